@@ -0,0 +1,59 @@
+"""Compare per-call latency of the fast date path with dateutil/dateparser on real-world due strings.
+
+Every string is resolved both ways against the same reference time; the results must agree.
+The date cache is bypassed so each call parses.
+
+usage: python benchmarks/date_parsing.py [rounds]
+"""
+import sys
+import time
+from datetime import datetime
+from statistics import median
+from todo_app.utilis.utils import fast_parse_date, library_parse_date
+
+# due strings as users type them after due: in the add command
+CORPUS = (
+    "3pm", "5 pm", "9am", "12pm", "3:30pm", "18:00", "today", "tomorrow", "yesterday",
+    "monday", "friday", "sunday", "next week", "next month", "last week", "in 2 days", "in 3 hours",
+    "2025-01-14", "2025-10-23 18:00", "2026/02/23", "23/02/2026", "10/02/2024", "01-feb-25",
+    "1/jan/2024", "july 2nd 2025", "feb 1st, 2025", "1st february", "2 february 2025",
+)
+
+
+def time_calls(function, text: str, reference: datetime, rounds: int) -> float:
+    """median seconds per call"""
+    samples = []
+    for _ in range(rounds):
+        started = time.perf_counter()
+        function(text, reference)
+        samples.append(time.perf_counter() - started)
+    return median(samples)
+
+
+def main() -> None:
+    rounds = int(sys.argv[1]) if len(sys.argv) > 1 else 20
+    reference = datetime(2025, 10, 23, 10, 41)
+    library_parse_date("tomorrow", reference)  # load dateparser's language data before timing
+
+    total_fast = total_library = 0.0
+    print(f"{'due string':<20}{'fast (us)':>12}{'library (us)':>15}{'speed-up':>10}")
+    for text in CORPUS:
+        fast = fast_parse_date(text, reference)
+        _, library = library_parse_date(text, reference)
+        assert fast == library, (text, fast, library)
+
+        fast_time = time_calls(fast_parse_date, text, reference, rounds)
+        library_time = time_calls(library_parse_date, text, reference, rounds)
+        total_fast += fast_time
+        total_library += library_time
+        print(f"{text:<20}{fast_time * 1e6:>12.1f}{library_time * 1e6:>15.1f}{library_time / fast_time:>9.0f}x")
+
+    count = len(CORPUS)
+    print(
+        f"mean per call: fast {total_fast / count * 1e6:.1f} us, library {total_library / count * 1e6:.1f} us, "
+        f"speed-up {total_library / total_fast:.0f}x"
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,47 @@
+"""Compare validating the assignees of a bulk add one by one with Validator.valid_emails.
+
+DNS is replaced by a resolver that waits a fixed time per lookup, so the numbers show how
+much waiting each approach does: one lookup per task (strict mode, as every add used to
+do), one lookup per domain one after another (cached mode), and valid_emails looking the
+distinct domains up in a thread pool. Each run starts with an empty MX cache.
+
+usage: python benchmarks/email_validation.py [tasks] [domains] [latency ms]
+"""
+import sys
+import tempfile
+import time
+from pathlib import Path
+from todo_app.config import EMAIL_LOOKUP_WORKERS
+from todo_app.parsers.deliverability import DeliverabilityChecker, MXCache, set_checker
+from todo_app.parsers.validator import Validator
+
+
+def main() -> None:
+    tasks = int(sys.argv[1]) if len(sys.argv) > 1 else 200
+    domains = int(sys.argv[2]) if len(sys.argv) > 2 else 20
+    latency = (float(sys.argv[3]) if len(sys.argv) > 3 else 50) / 1000
+    addresses = [f"user{n}@team{n % domains}.example.org" for n in range(tasks)]
+
+    def resolver(domain: str, timeout: float) -> bool:
+        time.sleep(latency)
+        return True
+
+    print(f"{tasks} assignees over {domains} domains, {latency * 1000:.0f} ms per lookup")
+    with tempfile.TemporaryDirectory() as directory:
+        for name, mode, batch in (
+            ("valid_email per task, strict", "strict", False),
+            ("valid_email per task, cached", "cached", False),
+            (f"valid_emails, {EMAIL_LOOKUP_WORKERS} threads", "cached", True),
+        ):
+            checker = DeliverabilityChecker(mode, resolver, MXCache(Path(directory) / f"{name}.json"))
+            set_checker(checker)
+            started = time.perf_counter()
+            results = Validator.valid_emails(addresses) if batch else [Validator.valid_email(a) for a in addresses]
+            elapsed = time.perf_counter() - started
+            assert not any(isinstance(result, str) for result in results)
+            print(f"{name:<34}{elapsed:>8.2f} s{checker.lookups:>8} lookups")
+    set_checker(None)
+
+
+if __name__ == "__main__":
+    main()
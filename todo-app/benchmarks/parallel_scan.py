@@ -0,0 +1,62 @@
+"""Compare serial and parallel full scans of a synthetic store.
+
+usage: python benchmarks/parallel_scan.py [tasks] [workers]
+"""
+import os
+import sys
+import tempfile
+import time
+from pathlib import Path
+from todo_app.models.task import Task
+from todo_app.services.parallel import parallel_scan, shutdown_executor
+from todo_app.services.query import parse_query
+from todo_app.services.storage_backend import JSONBackend
+
+QUERIES = ("not tag:tag3 and not priority:mild", "meeting or not status:complete")
+
+
+def make_tasks(count: int):
+    """synthetic tasks spread over a few tags, priorities and statuses"""
+    for number in range(count):
+        yield Task.from_dict({
+            "ID": f"{number:08x}", "Time": f"2025-10-{number % 28 + 1:02d} 09:00:00",
+            "Description": f"Task number {number} {'meeting' if number % 11 == 0 else 'errand'}",
+            "Priority": ("High", "Mild", "Low")[number % 3], "Tag": f"tag{number % 7}",
+            "Status": "Complete" if number % 5 else "Incomplete",
+        })
+
+
+def main() -> None:
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 500_000
+    workers = int(sys.argv[2]) if len(sys.argv) > 2 else (os.cpu_count() or 1)
+
+    with tempfile.TemporaryDirectory() as directory:
+        backend = JSONBackend(Path(directory) / "todo-app.json")
+        backend.save_all(list(make_tasks(count)))
+
+        # the first parallel scan starts the pool and loads the store in every worker
+        started = time.perf_counter()
+        parallel_scan(backend, parse_query(QUERIES[0]), workers)
+        print(f"{count} tasks, {workers} workers; pool warm-up {time.perf_counter() - started:.2f}s")
+
+        for text in QUERIES:
+            query = parse_query(text)
+            started = time.perf_counter()
+            serial = [task.id for task in backend.iter_tasks() if query.matches(task)]
+            serial_time = time.perf_counter() - started
+
+            started = time.perf_counter()
+            parallel = parallel_scan(backend, query, workers)
+            parallel_time = time.perf_counter() - started
+
+            assert parallel == serial
+            print(
+                f"{text!r}: serial {serial_time:.3f}s ({count / serial_time:,.0f} tasks/s), "
+                f"parallel {parallel_time:.3f}s ({count / parallel_time:,.0f} tasks/s), "
+                f"speed-up {serial_time / parallel_time:.2f}x"
+            )
+    shutdown_executor()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,77 @@
+"""Measure how many task lines per second are parsed, and how much of a bulk add is parsing.
+
+Three parsers are timed on the same generated lines: the five Extractor.extract_* calls the add
+command used to make (each searches the whole line again), Extractor.extract_fields (one lex_task
+scan plus per-field validation) and lex_task alone. A bulk add of the same lines into a temporary
+store is then timed end to end. Lines carry no assignee, so no email is validated over the network.
+
+usage: python benchmarks/parse_throughput.py [lines]
+"""
+import sys
+import tempfile
+import time
+from pathlib import Path
+from todo_app.models.app import TodoApp
+from todo_app.parsers.extractor import Extractor
+from todo_app.parsers.lexer import lex_task
+from todo_app.services.database_service import DatabaseService
+from todo_app.services.storage_backend import JSONBackend
+
+TAGS = ("shopping", "work/release/q3", "family", "school", "health")
+PRIORITIES = ("high", "mild", "low")
+DUES = ("8pm", "tomorrow", "friday", "2026-03-14", "in 3 days", "july 2nd 2026")
+
+
+def task_lines(count: int):
+    return [
+        f"task number {n} for the weekly review @{TAGS[n % len(TAGS)]} #{PRIORITIES[n % len(PRIORITIES)]} "
+        f"due:{DUES[n % len(DUES)]}"
+        for n in range(count)
+    ]
+
+
+def separate_passes(line: str) -> None:
+    Extractor.extract_task_description(line)
+    Extractor.extract_date(line)
+    Extractor.extract_priority_level(line)
+    Extractor.extract_tag(line)
+    Extractor.extract_email(line)
+
+
+def lines_per_second(function, lines) -> float:
+    started = time.perf_counter()
+    for line in lines:
+        function(line)
+    return len(lines) / (time.perf_counter() - started)
+
+
+def main() -> None:
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 20000
+    lines = task_lines(count)
+    separate_passes(lines[0])  # resolve every due string once so the date cache is warm for all parsers
+    for line in lines[: len(DUES)]:
+        Extractor.extract_fields(line)
+
+    print(f"{'parser':<28}{'lines/s':>12}")
+    for name, function in (
+        ("five extract_* passes", separate_passes),
+        ("extract_fields", Extractor.extract_fields),
+        ("lex_task only", lex_task),
+    ):
+        print(f"{name:<28}{lines_per_second(function, lines):>12,.0f}")
+
+    with tempfile.TemporaryDirectory() as directory:
+        app = TodoApp()
+        app.db_service = DatabaseService(JSONBackend(Path(directory) / "todo-app.json"))
+        started = time.perf_counter()
+        status, message, errors = app.add_tasks(lines, commit_every=0)
+        elapsed = time.perf_counter() - started
+        assert status and not errors, (message, errors[:3])
+
+        build_rate = lines_per_second(app._build_task, lines)
+    print(f"bulk add: {count / elapsed:,.0f} lines/s ({message})")
+    print(f"parsing share of the bulk add: {count / build_rate / elapsed:.0%}")
+
+
+if __name__ == "__main__":
+    main()
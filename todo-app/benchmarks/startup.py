@@ -0,0 +1,53 @@
+"""Measure how long the taskmate entry point takes to import, using python -X importtime.
+
+Prints the median import time of todo_app.main over several fresh interpreters, the
+slowest modules of the last run, and the wall time of a few commands.
+
+usage: python benchmarks/startup.py [runs]
+"""
+import subprocess
+import sys
+import time
+from statistics import median
+from typing import Dict, List
+
+COMMANDS = (["--help"], ["display", "--id", "5e42c77c"], ["list", "--priority", "high"])
+
+
+def import_times(module: str = "todo_app.main") -> Dict[str, int]:
+    """import a module in a fresh interpreter; cumulative microseconds per imported module"""
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"], capture_output=True, text=True, check=True,
+    )
+    times: Dict[str, int] = {}
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        _, cumulative, name = line[len("import time:"):].split("|")
+        times[name.strip()] = int(cumulative)
+    return times
+
+
+def main() -> None:
+    runs = int(sys.argv[1]) if len(sys.argv) > 1 else 5
+    totals: List[float] = []
+    for _ in range(runs):
+        times = import_times()
+        totals.append(times["todo_app.main"] / 1000)
+    print(f"import todo_app.main: median {median(totals):.0f} ms over {runs} runs")
+
+    print("slowest imports (cumulative ms):")
+    for name, micros in sorted(times.items(), key=lambda item: -item[1])[1:11]:
+        print(f"  {name:<45}{micros / 1000:>8.1f}")
+
+    for command in COMMANDS:
+        samples = []
+        for _ in range(runs):
+            started = time.perf_counter()
+            subprocess.run([sys.executable, "-m", "todo_app.main", *command], capture_output=True, check=False)
+            samples.append(time.perf_counter() - started)
+        print(f"taskmate {' '.join(command)}: median {median(samples) * 1000:.0f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,62 @@
+"""Time shell completion of --tag and --id in a fresh process against a synthetic store.
+
+Completion is answered from the tag index sidecar, so the store itself is never parsed;
+the script checks that as well as the time.
+
+usage: python benchmarks/tag_completion.py [tasks]
+"""
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+from todo_app.models.task import Task
+from todo_app.services.database_service import DatabaseService
+from todo_app.services.storage_backend import JSONBackend
+from todo_app.services.task_service import TaskService
+
+BUDGET_MS = 50
+
+
+def make_tasks(count: int):
+    """synthetic tasks over a three level tag hierarchy"""
+    for number in range(count):
+        yield Task.from_dict({
+            "ID": f"{number:08x}", "Time": f"2025-10-{number % 28 + 1:02d} 09:00:00",
+            "Description": f"Task number {number}", "Priority": ("High", "Mild", "Low")[number % 3],
+            "Tag": f"Team{number % 13}/Project{number % 17}/Q{number % 4 + 1}", "Status": "Incomplete",
+        })
+
+
+def complete(path: str) -> None:
+    """run in the fresh process: time the first completion, which loads the sidecar"""
+    started = time.perf_counter()
+
+    class StoreTaskService(TaskService):
+        db_service = DatabaseService(JSONBackend(Path(path)))
+
+    tags = StoreTaskService.complete_tags("team1/")
+    ids = StoreTaskService.complete_ids("0001")
+    elapsed = (time.perf_counter() - started) * 1000
+    loaded = StoreTaskService.db_service.backend.repository.cache_stats()["misses"]
+    print(f"{len(tags)} tags, {len(ids)} IDs in {elapsed:.1f} ms; store parsed {loaded} time(s)")
+
+
+def main() -> None:
+    if len(sys.argv) > 2 and sys.argv[1] == "--complete":
+        return complete(sys.argv[2])
+
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 100_000
+    with tempfile.TemporaryDirectory() as directory:
+        path = Path(directory) / "todo-app.json"
+        service = DatabaseService(JSONBackend(path))
+        service.backend.save_all(list(make_tasks(count)))
+        service.indexes.get("tag")
+        service.indexes.flush()
+
+        print(f"{count} tasks; completion budget {BUDGET_MS} ms")
+        subprocess.run([sys.executable, __file__, "--complete", str(path)], check=True)
+
+
+if __name__ == "__main__":
+    main()
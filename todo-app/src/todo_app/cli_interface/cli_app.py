@@ -1,7 +1,14 @@
+import sys
+import json
 import typer  # type: ignore
 from todo_app.models.app import TodoApp
-from typing import Annotated, List, Optional
-from todo_app.cli_interface.cli_helper import parse_options
+from typing import Annotated, Dict, List, Optional
+from todo_app.cli_interface.cli_helper import option_values, parse_options
+from todo_app.services.import_service import guess_import_format
+from todo_app.services.export_service import EXPORT_FORMATS
+from todo_app.services.paging import SORT_FIELDS, Page, make_page
+from todo_app.indexes.stats import STAT_GROUPS
+from todo_app.config import IMPORT_COMMIT_EVERY
 from rich import print # type: ignore
 from rich import box # type: ignore
 from rich.table import Table # type: ignore
@@ -9,8 +16,11 @@ from rich.console import Console # type: ignore
 
 # creating reference to TodoApp, typer and Console
 app = typer.Typer(help="TaskMate - A Smart Manager for all your activies")
+view_app = typer.Typer(help="Save queries as named views that stay up to date as activities change")
+app.add_typer(view_app, name="view")
 todo_app = TodoApp()
 console = Console()
+error_console = Console(stderr=True)
 
 # creating the display table for rich output
 DISPLAY_TABLE = Table(box=box.SQUARE, expand=True)
@@ -26,6 +36,59 @@ DISPLAY_TABLE.add_column("Time", no_wrap=True, style="cyan")
 DISPLAY_TABLE.add_column("Status", no_wrap=True, style="grey93")
 DISPLAY_TABLE.add_column("Email", no_wrap=True, style="grey93")
 
+# paging options shared by display --all, search and list
+SortOption = Annotated[
+    str,
+    typer.Option("--sort", help=f"Order the tasks by one of; {', '.join(SORT_FIELDS)}. Default is the order they were added")
+]
+LimitOption = Annotated[
+    Optional[int],
+    typer.Option("--limit", help="Show at most this many tasks")
+]
+OffsetOption = Annotated[
+    int,
+    typer.Option("--offset", help="Skip this many tasks before showing any")
+]
+AfterOption = Annotated[
+    str,
+    typer.Option("--after", help="Show the tasks that come after this task ID; use the last ID of the previous page")
+]
+
+
+def _complete_last(incomplete: str, complete) -> List[str]:
+    """complete the last of several space separated values, keeping the ones before it"""
+    head, _, last = incomplete.rpartition(" ")
+    try:
+        values = complete(last)
+    except Exception:
+        return []  # completion must never break the shell
+    return [f"{head} {value}" if head else value for value in values]
+
+
+def complete_tag(incomplete: str) -> List[str]:
+    """shell completion for --tag, answered from the tag index without reading the store"""
+    return _complete_last(incomplete, todo_app.complete_tags)
+
+
+def complete_id(incomplete: str) -> List[str]:
+    """shell completion for --id, answered from the tag index without reading the store"""
+    return _complete_last(incomplete, todo_app.complete_ids)
+
+
+def build_page(sort: str, limit: Optional[int], offset: int, after: str) -> Optional[Page]:
+    """validate the paging options; prints the error and returns None if they are invalid"""
+    status, message, page = make_page(sort, limit, offset, after)
+    if not status:
+        print(f"[bold red]Error:[/bold red] {message}")
+        return None
+    return page
+
+
+def print_next_page(page: Page, result: List[dict]) -> None:
+    """tell the user how to get the next page when the current one is full"""
+    if page.limit is not None and len(result) == page.limit:
+        print(f"[bold yellow]Info:[/bold yellow] More tasks may follow; continue with --after {result[-1]['ID']}")
+
 
 @app.command(help="Add a new activity to TaskMate", name="add")
 def add_task(
@@ -63,6 +126,127 @@ def add_task(
     console.print(DISPLAY_TABLE)
 
 
+@app.command(help="Import many activities into TaskMate from a text, CSV or JSONL file", name="import")
+def import_tasks(
+    file_path: Annotated[
+        str,
+        typer.Argument(
+            help=(
+                "File with one task per line (text), per row (CSV header: description,tag,priority,due,assigned "
+                "or task) or per JSON object (JSONL). Use '-' to read from standard input"
+            )
+        )
+    ],
+    file_format: Optional[str] =
+        typer.Option(
+            None,
+            "--format",
+            help="Import file format; text, csv or jsonl. Guessed from the file extension by default"
+        ),
+    commit_every: int =
+        typer.Option(
+            IMPORT_COMMIT_EVERY,
+            "--commit-every",
+            help="Save after every N imported tasks. 0 saves once at the end"
+        )
+):
+    file_format = (file_format or guess_import_format(file_path)).lower()
+
+    # stream the file so memory does not grow with the import size
+    try:
+        if file_path == "-":
+            status, message, errors = todo_app.import_tasks(sys.stdin, file_format, commit_every)
+        else:
+            with open(file_path, "r", encoding="utf-8", newline="") as import_file:
+                status, message, errors = todo_app.import_tasks(import_file, file_format, commit_every)
+    except OSError as e:
+        return print(f"[bold red]Error:[/bold red] {e}")
+
+    # per-line errors do not stop the import
+    for error in errors:
+        print(f"[bold yellow]Info:[/bold yellow] {error}")
+
+    if not status:
+        return print(f"[bold red]Error:[/bold red] {message}")
+
+    return print(f"[bold green]Success:[/bold green] {message}")
+
+
+@app.command(
+    help=(
+        "Export saved activities in TaskMate as JSONL or CSV. Records are written as they are read, so "
+        "memory stays flat; a filtered export from the JSON backend holds the whole store in memory"
+    ),
+    name="export",
+)
+def export_tasks(
+    file_format: str =
+        typer.Option(
+            "jsonl",
+            "--format",
+            help=f"Export format; {' or '.join(EXPORT_FORMATS)}"
+        ),
+    output: Optional[str] =
+        typer.Option(
+            None,
+            "--output",
+            "-o",
+            help="File to write to. Writes to standard output by default"
+        ),
+    tag : Optional[str] = 
+        typer.Option(
+            None,
+            "--tag",
+            parser=parse_options,
+            autocompletion=complete_tag,
+            help="Export only tasks with these Tag values Example school, religion etc"
+        ),
+    priority: Optional[str] = 
+        typer.Option(
+            None,
+            "--priority",
+            parser=parse_options,
+            help="Export only tasks with these Priority levels; High, Mild and Low"
+        ),
+    due: Optional[str] = 
+        typer.Option(
+            None,
+            "--due",
+            "--time",
+            "--date",
+            parser=parse_options,
+            help="Export only tasks due on these dates example 10/02/2024, tomorrow, today etc"
+        ), 
+    status_: Optional[str] = 
+        typer.Option(
+            None,
+            "--status",
+            parser=parse_options,
+            help="Export only tasks with these status example complete, incomplete and inprogress"
+        )
+):
+    file_format = file_format.lower()
+    filters = (option_values(tag), option_values(priority), option_values(status_), option_values(due))
+
+    # records are written as they are read from disk, so memory stays flat; the JSON backend reads its
+    # file in pieces for an unfiltered export only, filters load the store to use its indexes
+    try:
+        if output is None:
+            status, message = todo_app.export_tasks(sys.stdout, file_format, *filters)
+        else:
+            with open(output, "w", encoding="utf-8", newline="") as export_file:
+                status, message = todo_app.export_tasks(export_file, file_format, *filters)
+    except OSError as e:
+        status, message = False, str(e)
+
+    # report on stderr so standard output only carries records
+    if not status:
+        error_console.print(f"[bold red]Error:[/bold red] {message}")
+        raise typer.Exit(code=1)
+
+    error_console.print(f"[bold green]Success:[/bold green] {message}")
+
+
 @app.command(help="Delete saved activites in TaskMate", name="delete")
 def delete_tasks(
     all_input: bool =
@@ -76,6 +260,7 @@ def delete_tasks(
             None,
             '--id',
             parser=parse_options,
+            autocompletion=complete_id,
             help="Delete selected task or activities based on task ids. Example delete -id 'fe567d7n 890e67b0'"        
         )
     
@@ -110,6 +295,7 @@ def display_tasks(
             None,
             "--id",
             parser=parse_options,
+            autocompletion=complete_id,
             help="List of task IDs to display specific tasks. Example: '011e00e8' 'f981351e'" 
         ),
         
@@ -118,11 +304,18 @@ def display_tasks(
             False,
             "--all",
             help='Display all avaliable task',
-        )        
+        ),
+    sort: SortOption = "",
+    limit: LimitOption = None,
+    offset: OffsetOption = 0,
+    after: AfterOption = "",
 ):  
     # if -all argument is used
     if all_input:
-        status, message, result = todo_app.display_all_task()      
+        page = build_page(sort, limit, offset, after)
+        if page is None:
+            return
+        status, message, result = todo_app.display_all_task(page)      
         if not status:  # empty Database
             return print(f"[bold yellow]Info:[/bold yellow] {message}")  
         
@@ -138,7 +331,8 @@ def display_tasks(
                 task['Email']  
             )
             
-        return console.print(DISPLAY_TABLE)  # display output
+        console.print(DISPLAY_TABLE)  # display output
+        return print_next_page(page, result)
         
     # if --id argument is used  
     status, message, result = todo_app.display_task(indices)
@@ -182,6 +376,17 @@ def display_tasks(
     
 @app.command(help="Update saved activites in TaskMate", name="update")
 def update_task(
+    indices: Optional[str] = 
+        typer.Option(
+            None,
+            "--id",
+            parser=parse_options,
+            autocompletion=complete_id,
+            help=(
+                "Apply every given field to these task IDs in one update; field options then take only the new value. "
+                "Example: update --id '011e00e8 f981351e' --priority high --status complete"
+            )
+        ),
     description : Optional[str] = 
         typer.Option(
             None,
@@ -214,21 +419,39 @@ def update_task(
             help="Update task status based on task ID. Example: '011e00e8 Complete'",
         ),
 ):
-    if description: # if --description
-        status, message = todo_app.update_task_description(description)   
-    elif time:  # if --time/--date
-        status, message = todo_app.update_task_time(time)    
-    elif priority_level: # if --priority
-        status, message = todo_app.update_task_priority(priority_level)    
-    elif email_address:  # if --email
-        status, message = todo_app.update_task_email(email_address)    
-    else:  # if --status
-        status, message = todo_app.update_task_status(task_status)
-    
+    options = {
+        "description": description,
+        "time": time,
+        "priority": priority_level,
+        "email": email_address,
+        "status": task_status,
+    }
+    fields: Dict[str, str] = {field: value for field, value in options.items() if value is not None}
+
+    if not fields:
+        return print("[bold red]Error:[/bold red] No update given. Use --description, --time, --priority, --email or --status")
+
+    # if --id: apply all fields to all task ids
+    if indices:
+        changes = [(task_id, fields) for task_id in indices if task_id]
+
+    # else each option carries its own '<task id> <value>'
+    else:
+        by_task: Dict[str, Dict[str, str]] = {}
+        for field, option in fields.items():
+            task_id, _, value = option.strip().partition(" ")
+            if not value.strip():
+                return print(f"[bold red]Error:[/bold red] No {field} value given. Example: --{field} '011e00e8 <{field}>'")
+            by_task.setdefault(task_id, {})[field] = value.strip()
+        changes = list(by_task.items())
+
+    # every change is validated, then saved in one write
+    status, message = todo_app.update_tasks(changes)
+
     # update not successful   
     if not status:
         return print(f"[bold red]Error:[/bold red] {message}")
-    
+
     # task update successful    
     return print(f"[bold green]Success:[/bold green] {message}")
 
@@ -240,9 +463,37 @@ def search_task(
         typer.Argument(
             help=("Search for saved task containing specific words in them")
         )
-    ]
+    ],
+    mode : str = typer.Option(
+        "any",
+        "--mode",
+        help=(
+            "any: tasks containing any word, all: tasks containing every word, "
+            "substring: match words inside longer words e.g. meet finds meeting"
+        )
+    ),
+    fuzzy: bool = typer.Option(
+        False,
+        "--fuzzy",
+        help="Also find misspelt words in descriptions and tags e.g. tozr finds Tozer; best match first"
+    ),
+    threshold: Optional[float] = typer.Option(
+        None,
+        "--threshold",
+        help="How similar a word must be for --fuzzy, from 0 to 1; higher is stricter. Default is 0.3"
+    ),
+    sort: SortOption = "",
+    limit: LimitOption = None,
+    offset: OffsetOption = 0,
+    after: AfterOption = "",
 ):
-    status, message, result = todo_app.task_keyword_search(user_query)
+    page = build_page(sort, limit, offset, after)
+    if page is None:
+        return
+    if fuzzy:
+        status, message, result = todo_app.task_fuzzy_search(user_query, threshold, page)
+    else:
+        status, message, result = todo_app.task_keyword_search(user_query, mode, page)
     # if search was not successful
     if not status:
         return print(f"[bold red]Error:[/bold red] {message}")
@@ -266,15 +517,17 @@ def search_task(
         )
     
     console.print(DISPLAY_TABLE)
+    print_next_page(page, result)
     
-@app.command(name='list', help="Filter task in TaskMate by Priority levels, Tags and Time/date")
+@app.command(name='list', help="Filter task in TaskMate by Priority levels, Tags, Status, Time/date and keywords")
 def filter_task(
     tag : Optional[str] = 
     typer.Option(
         None,
         "--tag",
         parser=parse_options,
-        help="Filter saved tasks based on Tag value Example school, religion etc"
+        autocompletion=complete_tag,
+        help="Filter saved tasks based on Tag value Example school, religion etc; work/* selects work and every tag below it"
     ),
     priority: Optional[str] = 
     typer.Option(
@@ -298,20 +551,77 @@ def filter_task(
         "--status",
         parser=parse_options,
         help="Filter saved tasks based on status example complete, incomplete and inprogress"
-    )
+    ),
+    keyword: Optional[str] =
+    typer.Option(
+        None,
+        "--keyword",
+        parser=parse_options,
+        help="Filter saved tasks containing any of these words"
+    ),
+    query: str =
+    typer.Option(
+        "",
+        "--query",
+        "-q",
+        help=(
+            "Query with AND/OR/NOT and brackets, combined with the other filters. "
+            "Example: 'status:incomplete and (tag:work or priority:high) and not due:today'"
+        )
+    ),
+    due_from: str =
+    typer.Option(
+        "",
+        "--due-from",
+        help="Only tasks due at or after this time example today, '23/10/2025 09:00'"
+    ),
+    due_to: str =
+    typer.Option(
+        "",
+        "--due-to",
+        help="Only tasks due at or before this time example friday, '23/10/2025 18:00'"
+    ),
+    overdue: bool =
+    typer.Option(
+        False,
+        "--overdue",
+        help="Only incomplete tasks whose due time has passed"
+    ),
+    within: str =
+    typer.Option(
+        "",
+        "--within",
+        help="Only tasks due between now and this duration from now example '1 hour', '7 days'"
+    ),
+    explain: bool =
+    typer.Option(
+        False,
+        "--explain",
+        help="Show how the filters are answered from the task indexes and the candidate counts"
+    ),
+    sort: SortOption = "",
+    limit: LimitOption = None,
+    offset: OffsetOption = 0,
+    after: AfterOption = "",
 ):
-    
-    if tag:
-        status, message, result = todo_app.task_tag_filter(tag)
-          
-    elif priority:         
-        status, message, result = todo_app.task_priority_filter(priority)
-        
-    elif status_:      
-        status, message, result = todo_app.task_status_filter(status_)     
-           
-    else:        
-        status, message, result = todo_app.task_time_filter(due)
+    # every given filter applies; a task must match all of them
+    filters = (
+        option_values(tag), option_values(priority), option_values(status_), option_values(due), option_values(keyword),
+        query, due_from, due_to, overdue, within,
+    )
+
+    if explain:
+        status, message, plan = todo_app.explain_task_filter(*filters)
+        if not status:
+            return print(f"[bold red]Error:[/bold red] {message}")
+        for line in plan:
+            console.print(line, highlight=False)
+        return
+
+    page = build_page(sort, limit, offset, after)
+    if page is None:
+        return
+    status, message, result = todo_app.task_filter(*filters, page)
         
     # failed filter query    
     if not status:
@@ -332,4 +642,134 @@ def filter_task(
             task['Email']
         )
     
-    console.print(DISPLAY_TABLE)
\ No newline at end of file
+    console.print(DISPLAY_TABLE)
+    print_next_page(page, result)
+
+@app.command(help="Show how many activities there are by status, priority, tag and assignee, and how many are overdue", name="stats")
+def task_stats(
+    recompute: bool =
+    typer.Option(
+        False,
+        "--recompute",
+        help="Count every task again and check the kept counters against the result"
+    ),
+    as_json: bool =
+    typer.Option(
+        False,
+        "--json",
+        help="Print the counts as JSON for dashboards and scripts"
+    )
+):
+    status, message, stats = todo_app.task_stats(recompute)
+    if not status:
+        return print(f"[bold red]Error:[/bold red] {message}")
+
+    if as_json:
+        return console.print_json(json.dumps(stats))
+
+    if message:
+        print(f"[bold green]Success:[/bold green] {message}")
+    print(f"Total tasks: [bold]{stats['total']}[/bold]    Overdue: [bold red]{stats['overdue']}[/bold red]")
+
+    for group in STAT_GROUPS:
+        table = Table(box=box.SQUARE, title=group.title(), title_justify="left")
+        table.header_styles = "bold white on grey23"
+        table.add_column(group.title(), style="grey93")
+        table.add_column("Tasks", justify="right", style="cyan")
+        for value, count in stats[group].items():
+            table.add_row(value or "(none)", str(count))
+        console.print(table)
+
+@app.command(help="Show how many activities each tag has, including the tags below it e.g. work/release under work", name="tags")
+def tag_counts(
+    root: Annotated[
+        str,
+        typer.Argument(help="Only show this tag and the tags below it example work", autocompletion=complete_tag)
+    ] = ""
+):
+    status, message, tags = todo_app.task_tag_counts(root)
+    if not status:
+        return print(f"[bold red]Error:[/bold red] {message}")
+
+    table = Table(box=box.SQUARE)
+    table.header_styles = "bold white on grey23"
+    table.add_column("Tag", style="grey93")
+    table.add_column("Tasks", justify="right", style="cyan")
+    table.add_column("Including subtags", justify="right", style="cyan")
+    for tag in tags:
+        # indent each level below its parent
+        depth = tag["tag"].count("/")
+        name = tag["tag"].rsplit("/", 1)[-1] or "(none)"
+        table.add_row("  " * depth + name, str(tag["tasks"]), str(tag["subtree"]))
+    console.print(table)
+
+@view_app.command(help="Save a query as a named view example: view save release 'priority:high tag:release'", name="save")
+def save_view(
+    name: Annotated[str, typer.Argument(help="View name of letters, digits, - and _")],
+    query: Annotated[
+        str,
+        typer.Argument(help="Query with AND/OR/NOT and brackets example 'status:incomplete and tag:work'")
+    ]
+):
+    status, message = todo_app.save_view(name, query)
+    if not status:
+        return print(f"[bold red]Error:[/bold red] {message}")
+    print(f"[bold green]Success:[/bold green] {message}")
+
+@view_app.command(help="Display the activities of a saved view", name="show")
+def show_view(
+    name: Annotated[str, typer.Argument(help="View name")],
+    sort: SortOption = "",
+    limit: LimitOption = None,
+    offset: OffsetOption = 0,
+    after: AfterOption = "",
+):
+    page = build_page(sort, limit, offset, after)
+    if page is None:
+        return
+    status, message, result = todo_app.show_view(name, page)
+
+    if not status:
+        return print(f"[bold red]Error:[/bold red] {message}")
+
+    # If database is empty
+    if not result:
+        return print(f"[bold yellow]Info:[/bold yellow] {message}")
+
+    for task in result:
+        DISPLAY_TABLE.add_row(
+            task['ID'],
+            task['Description'],
+            task['Tag'],
+            task['Priority'],
+            task['Time'],
+            task['Status'],
+            task['Email']
+        )
+
+    console.print(DISPLAY_TABLE)
+    print_next_page(page, result)
+
+@view_app.command(help="List saved views with their queries and number of activities", name="list")
+def list_views():
+    status, message, views = todo_app.list_views()
+    if not status:
+        return print(f"[bold red]Error:[/bold red] {message}")
+    if not views:
+        return print(f"[bold yellow]Info:[/bold yellow] {message}")
+
+    table = Table(box=box.SQUARE)
+    table.header_styles = "bold white on grey23"
+    table.add_column("View", style="grey93")
+    table.add_column("Query", style="grey93")
+    table.add_column("Tasks", justify="right", style="cyan")
+    for view in views:
+        table.add_row(view["name"], view["query"], str(view["count"]))
+    console.print(table)
+
+@view_app.command(help="Delete a saved view; its activities are kept", name="delete")
+def delete_view(name: Annotated[str, typer.Argument(help="View name")]):
+    status, message = todo_app.delete_view(name)
+    if not status:
+        return print(f"[bold red]Error:[/bold red] {message}")
+    print(f"[bold green]Success:[/bold green] {message}")
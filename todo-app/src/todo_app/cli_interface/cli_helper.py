@@ -1,4 +1,4 @@
-from typing import List
+from typing import List, Optional, cast
 
 def parse_options(value:str) -> List[str]:
     """Split typer Option input into a list
@@ -10,4 +10,16 @@ def parse_options(value:str) -> List[str]:
     
     value_list = [item for item in value.split(' ')]
     return value_list
-   
\ No newline at end of file
+   
+
+
+def option_values(value: Optional[str]) -> Optional[List[str]]:
+    """Return the list parse_options split an option into
+        typer only accepts a parser on options declared as str, so the option's value is
+        typed str although it holds the list parse_options returned.
+        args:
+            value: typer option parsed with parse_options
+        return:
+            value_list = the option's values, or None if it was not given
+    """
+    return cast(Optional[List[str]], value)
@@ -1,4 +1,63 @@
+import os
 from pathlib import Path
 
 PROJECT_ROOT = Path(__file__).resolve().parents[2]
-JSON_DB_PATH = PROJECT_ROOT / "database" / "todo-app.json"
+# folder of the saved tasks and of everything kept beside them: index sidecars, saved views and the MX cache
+DATA_DIR = Path(os.environ.get("TASKMATE_DATA_DIR", PROJECT_ROOT / "database"))
+JSON_DB_PATH = DATA_DIR / "todo-app.json"
+
+# storage engine used by DatabaseService and TaskService: "json" or "sqlite"
+STORAGE_BACKEND = os.environ.get("TASKMATE_STORAGE_BACKEND", "json").strip().lower()
+SQLITE_DB_PATH = DATA_DIR / "todo-app.db"
+
+# JSON backend journal mode: every change appends one line to todo-app.journal.jsonl
+# and the snapshot is only rewritten (compacted) once the journal passes a threshold
+JSON_JOURNAL_MODE = os.environ.get("TASKMATE_JSON_JOURNAL", "off").strip().lower() in ("1", "on", "true")
+JOURNAL_MAX_ENTRIES = 1000
+JOURNAL_MAX_BYTES = 1024 * 1024
+
+# index sidecars are not rewritten on a write: each change is appended to <name>.deltas.jsonl beside them and
+# replayed onto a sidecar when the index is next loaded. A sidecar that had to catch up on more than
+# INDEX_DELTA_REWRITE_AFTER changes is rewritten by the command that loaded it; the delta log starts over once
+# it passes INDEX_DELTA_MAX_BYTES, and changes of more than INDEX_DELTA_MAX_TASKS tasks are not logged, in both
+# cases the indexes behind are rebuilt when next used
+INDEX_DELTA_REWRITE_AFTER = 100
+INDEX_DELTA_MAX_BYTES = 4 * 1024 * 1024
+INDEX_DELTA_MAX_TASKS = 5000
+
+# bulk import saves after every IMPORT_COMMIT_EVERY tasks; 0 saves once at the end
+IMPORT_COMMIT_EVERY = 1000
+
+# number of query results kept between writes (LRU), in memory and as files beside the index sidecars so separate
+# CLI commands share them; 0 turns the cache off
+QUERY_CACHE_SIZE = int(os.environ.get("TASKMATE_QUERY_CACHE_SIZE", "256"))
+
+# parsed due strings kept in memory (LRU), and the window in seconds relative phrases such as
+# 'tomorrow' or '2 hours' are resolved against; 0 turns the cache off
+DATE_CACHE_SIZE = int(os.environ.get("TASKMATE_DATE_CACHE_SIZE", "512"))
+DATE_CACHE_BUCKET = 60
+
+# default smallest word similarity (0 to 1) for search --fuzzy; 0.3 lets one typo through in a 5 letter word
+FUZZY_THRESHOLD = 0.3
+
+# saved task fields scanned by substring search (search --mode substring)
+SEARCH_FIELDS = ("Description", "Tag", "Email")
+
+# parallel scans: queries no index can answer are checked in PARALLEL_WORKERS processes once a
+# store holds PARALLEL_MIN_TASKS tasks; 0 workers keeps every scan in the calling process
+PARALLEL_WORKERS = int(os.environ.get("TASKMATE_PARALLEL_WORKERS", "0"))
+PARALLEL_MIN_TASKS = int(os.environ.get("TASKMATE_PARALLEL_MIN_TASKS", "200000"))
+
+# email deliverability checks of assigned: and update --email: "off" checks syntax only, "cached" keeps each
+# domain's DNS answer in EMAIL_MX_CACHE_PATH for EMAIL_MX_CACHE_TTL seconds, "strict" asks DNS every time and
+# rejects an address whose domain cannot be confirmed; DNS lookups give up after EMAIL_DNS_TIMEOUT seconds
+EMAIL_DELIVERABILITY_MODES = ("off", "cached", "strict")
+EMAIL_DELIVERABILITY = os.environ.get("TASKMATE_EMAIL_DELIVERABILITY", "cached").strip().lower()
+EMAIL_MX_CACHE_PATH = DATA_DIR / "mx-cache.json"
+EMAIL_MX_CACHE_TTL = int(os.environ.get("TASKMATE_EMAIL_MX_CACHE_TTL", str(24 * 60 * 60)))
+EMAIL_DNS_TIMEOUT = float(os.environ.get("TASKMATE_EMAIL_DNS_TIMEOUT", "2"))
+
+# bulk add, import and apply_updates validate the assignees of EMAIL_BATCH_SIZE task lines together, looking up
+# their distinct domains in up to EMAIL_LOOKUP_WORKERS threads
+EMAIL_BATCH_SIZE = 1000
+EMAIL_LOOKUP_WORKERS = int(os.environ.get("TASKMATE_EMAIL_LOOKUP_WORKERS", "8"))
@@ -0,0 +1,40 @@
+from abc import ABC, abstractmethod
+from typing import Any
+from todo_app.models.task import Task
+
+
+class TaskIndex(ABC):
+    """Interface of an in-memory index over saved tasks.
+
+    An index is fed every saved task through add() when it is built, then kept
+    current with add()/remove() as tasks are inserted, updated and deleted. Its
+    state must be JSON serializable so the IndexRegistry can persist it next to the
+    database.
+    """
+
+    # unique name; also used in the sidecar file name
+    name: str = ""
+
+    # False for indexes that are cheaper to rebuild than to read back, e.g. copies of
+    # task text; they are never written to a sidecar and only built once used
+    persistent: bool = True
+
+    @abstractmethod
+    def clear(self) -> None:
+        """Forget every task."""
+
+    @abstractmethod
+    def add(self, task: Task) -> None:
+        """Index a saved task."""
+
+    @abstractmethod
+    def remove(self, task: Task) -> None:
+        """Drop a task that was indexed with add()."""
+
+    @abstractmethod
+    def to_state(self) -> Any:
+        """Return the index contents as JSON serializable data."""
+
+    @abstractmethod
+    def load_state(self, state: Any) -> None:
+        """Replace the index contents with data returned by to_state()."""
@@ -0,0 +1,60 @@
+from typing import AbstractSet, Any, Dict, Set
+from todo_app.indexes.base import TaskIndex
+from todo_app.models.task import TASK_FIELDS, Task
+
+EMPTY: AbstractSet[str] = frozenset()
+
+
+class BucketIndex(TaskIndex):
+    """Group task IDs by the lower case value of one field e.g. {"high": {...}, "low": {...}}.
+
+    Bucket sizes are known without touching any task, which is what the query
+    planner uses to start from the most selective predicate.
+    """
+
+    def __init__(self, field: str) -> None:
+        if field not in TASK_FIELDS:
+            raise ValueError(f"Unknown task field {field}")
+        self.field = field
+        self.name = field.lower()
+        self._buckets: Dict[str, Set[str]] = {}
+
+    def clear(self) -> None:
+        self._buckets = {}
+
+    def add(self, task: Task) -> None:
+        self._buckets.setdefault(task.value(self.field).lower(), set()).add(task.id)
+
+    def remove(self, task: Task) -> None:
+        key = task.value(self.field).lower()
+        task_ids = self._buckets.get(key)
+        if task_ids is None:
+            return
+        task_ids.discard(task.id)
+        if not task_ids:
+            del self._buckets[key]
+
+    def get(self, value: str) -> AbstractSet[str]:
+        """Return the IDs of tasks whose field equals value, ignoring case.
+        The returned set is shared; callers must not modify it.
+        """
+        return self._buckets.get(value.lower(), EMPTY)
+
+    def containing(self, value: str) -> Set[str]:
+        """Return the IDs of tasks whose field contains value, ignoring case."""
+        value = value.lower()
+        task_ids: Set[str] = set()
+        for key, bucket in self._buckets.items():
+            if value in key:
+                task_ids |= bucket
+        return task_ids
+
+    def counts(self) -> Dict[str, int]:
+        """Return the number of tasks per lower case field value."""
+        return {key: len(task_ids) for key, task_ids in self._buckets.items()}
+
+    def to_state(self) -> Any:
+        return {key: sorted(task_ids) for key, task_ids in self._buckets.items()}
+
+    def load_state(self, state: Any) -> None:
+        self._buckets = {key: set(task_ids) for key, task_ids in state.items()}
@@ -0,0 +1,77 @@
+from bisect import bisect_left, bisect_right, insort
+from datetime import datetime
+from typing import Any, Iterator, List, Optional, Tuple
+from todo_app.indexes.base import TaskIndex
+from todo_app.models.task import Task, epoch_seconds
+
+
+class DueIndex(TaskIndex):
+    """Keep (due epoch seconds, task ID) pairs sorted so due-time ranges are two binary searches.
+
+    A range query costs O(log N + k) for k results instead of a scan of every task.
+    Tasks without a due time are not indexed.
+    """
+
+    name = "due"
+
+    def __init__(self) -> None:
+        self._keys: List[Tuple[int, str]] = []
+
+    def clear(self) -> None:
+        self._keys = []
+
+    def add(self, task: Task) -> None:
+        due = task.due_epoch
+        if due is not None:
+            insort(self._keys, (due, task.id))
+
+    def remove(self, task: Task) -> None:
+        due = task.due_epoch
+        if due is None:
+            return
+        position = bisect_left(self._keys, (due, task.id))
+        if position < len(self._keys) and self._keys[position] == (due, task.id):
+            del self._keys[position]
+
+    def _bounds(self, start: datetime, end: datetime) -> Tuple[int, int]:
+        """positions of the first key due at or after start and the first due at or after end"""
+        # "" sorts before every task ID, so (epoch, "") is the first key of that second
+        low = bisect_left(self._keys, (epoch_seconds(start), ""))
+        high = bisect_left(self._keys, (epoch_seconds(end), ""), low)
+        return low, high
+
+    def between(self, start: datetime, end: datetime) -> List[str]:
+        """Return the IDs of tasks due in [start, end), earliest first.
+        args:
+            start: inclusive lower bound; datetime.min for no lower bound
+            end: exclusive upper bound; datetime.max for no upper bound
+        return:
+            List[str]: task IDs ordered by due time
+        """
+        low, high = self._bounds(start, end)
+        return [task_id for _, task_id in self._keys[low:high]]
+
+    def count_between(self, start: datetime, end: datetime) -> int:
+        """Return the number of tasks due in [start, end) without listing them."""
+        low, high = self._bounds(start, end)
+        return high - low
+
+    def __len__(self) -> int:
+        return len(self._keys)
+
+    def iter_ids(self, after: Optional[Tuple[int, str]] = None) -> Iterator[str]:
+        """Yield task IDs earliest due first, the same order as sorting by (due epoch, ID).
+        args:
+            after: (due epoch, task ID) key to resume after; None starts from the earliest task
+        return:
+            Iterator[str]: task IDs in due order
+        """
+        start = 0 if after is None else bisect_right(self._keys, after)
+        for position in range(start, len(self._keys)):
+            yield self._keys[position][1]
+
+    def to_state(self) -> Any:
+        return [list(key) for key in self._keys]
+
+    def load_state(self, state: Any) -> None:
+        self._keys = sorted((int(due), str(task_id)) for due, task_id in state)
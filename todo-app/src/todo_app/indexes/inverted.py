@@ -0,0 +1,98 @@
+import re
+from typing import Any, Dict, Iterable, List, Set
+from todo_app.indexes.base import TaskIndex
+from todo_app.models.task import Task
+
+# a token is a run of word characters plus trailing + or # so c++ and c# stay searchable
+TOKEN_PATTERN = re.compile(r"\w+[+#]*")
+
+# saved task fields covered by the inverted index
+INDEXED_FIELDS = ("Description", "Tag", "Email")
+
+
+def tokenize(text: str) -> List[str]:
+    """Split text into lower case tokens e.g. 'Learn C++ @work' -> ['learn', 'c++', 'work']"""
+    return TOKEN_PATTERN.findall(text.lower())
+
+
+def task_tokens(task: Task) -> Set[str]:
+    """Return the distinct tokens of a task's Description, Tag and Email."""
+    tokens: Set[str] = set()
+    for field in INDEXED_FIELDS:
+        tokens.update(tokenize(task.value(field)))
+    return tokens
+
+
+class InvertedIndex(TaskIndex):
+    """Map every token of a task's Description, Tag and Email to the IDs of the tasks using it.
+
+    A keyword lookup reads one posting set per token, so the cost of a search
+    grows with the number of matching tasks rather than the number of saved tasks.
+    """
+
+    name = "inverted"
+
+    def __init__(self) -> None:
+        self._postings: Dict[str, Set[str]] = {}
+
+    def clear(self) -> None:
+        self._postings = {}
+
+    def add(self, task: Task) -> None:
+        for token in task_tokens(task):
+            self._postings.setdefault(token, set()).add(task.id)
+
+    def remove(self, task: Task) -> None:
+        for token in task_tokens(task):
+            task_ids = self._postings.get(token)
+            if task_ids is None:
+                continue
+            task_ids.discard(task.id)
+            if not task_ids:
+                del self._postings[token]
+
+    def lookup(self, keyword: str) -> Set[str]:
+        """Return the IDs of tasks containing every token of keyword.
+        args:
+            keyword: one search keyword e.g. 'tozer' or 'johndoe34@gmail.com'
+        return:
+            Set[str]: matching task IDs; empty when keyword has no token
+        """
+        tokens = tokenize(keyword)
+        if not tokens:
+            return set()
+
+        # intersect starting from the rarest token
+        postings = sorted((self._postings.get(token, set()) for token in tokens), key=len)
+        result = set(postings[0])
+        for task_ids in postings[1:]:
+            result &= task_ids
+        return result
+
+    def search(self, keywords: Iterable[str], match_all: bool = False) -> Set[str]:
+        """Return the IDs of tasks matching any (or all) keywords.
+        args:
+            keywords: search keywords e.g. ['tozer', 'john']
+            match_all: True for AND, False for OR
+        return:
+            Set[str]: matching task IDs
+        """
+        result: Set[str] = set()
+        for position, keyword in enumerate(keywords):
+            task_ids = self.lookup(keyword)
+            if not match_all:
+                result |= task_ids
+            elif position == 0:
+                result = task_ids
+            else:
+                result &= task_ids
+
+            if match_all and not result:
+                break  # no later keyword can add tasks back
+        return result
+
+    def to_state(self) -> Any:
+        return {token: sorted(task_ids) for token, task_ids in self._postings.items()}
+
+    def load_state(self, state: Any) -> None:
+        self._postings = {token: set(task_ids) for token, task_ids in state.items()}
@@ -0,0 +1,358 @@
+import atexit
+import json
+import os
+import tempfile
+import threading
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Set, Tuple
+from todo_app.config import INDEX_DELTA_MAX_BYTES, INDEX_DELTA_MAX_TASKS, INDEX_DELTA_REWRITE_AFTER
+from todo_app.indexes.base import TaskIndex
+from todo_app.indexes.buckets import BucketIndex
+from todo_app.indexes.due import DueIndex
+from todo_app.indexes.inverted import InvertedIndex
+from todo_app.indexes.stats import StatsIndex
+from todo_app.indexes.tags import TagIndex
+from todo_app.indexes.text import TextIndex
+from todo_app.indexes.trigram import TrigramIndex
+from todo_app.models.task import Task
+from todo_app.services.storage_backend import StorageBackend
+
+
+class IndexRegistry:
+    """Keep task indexes in step with a storage backend and persist them next to it.
+
+    Every index is stamped with the backend signature it reflects. When the
+    signature moves on without the registry being told (another process wrote to
+    the store, or a test wrote to the backend directly), the index is re-loaded from
+    its sidecar file if that one is current, otherwise rebuilt in a single pass over
+    the saved tasks. Changes made through DatabaseService are applied incrementally.
+
+    Sidecars live in an indexes/ folder beside the database, one JSON file per
+    index, and are only written at interpreter exit for indexes that were rebuilt.
+    A write never loads or rewrites them: the indexes this process already holds
+    are updated in memory, and the change (the tasks added and removed) is appended
+    to a delta log beside the sidecars. An index loaded later replays the deltas
+    saved since its sidecar, so every command pays only for the indexes it reads.
+    """
+
+    def __init__(self, backend: StorageBackend, indexes: Iterable[TaskIndex], directory: Optional[Path] = None):
+        self.backend = backend
+        self.directory = Path(directory) if directory is not None else Path(backend.path).parent / "indexes"
+        self._indexes: Dict[str, TaskIndex] = {}
+        self._signatures: Dict[str, str] = {}  # index name -> backend signature it reflects
+        self._dirty: Set[str] = set()
+        self._lock = threading.RLock()
+        self.delta_path = self.directory / f"{Path(backend.path).name}.deltas.jsonl"
+        self._write_signature: Optional[str] = None  # backend signature before the change being saved
+        self._delta_cache: Tuple[Any, Dict[str, Dict[str, Any]]] = (None, {})  # (file stat, deltas by signature)
+
+        for index in indexes:
+            self.register(index)
+
+        atexit.register(self.flush)
+        backend.add_compaction_listener(self._compacted)
+
+    def __contains__(self, name: str) -> bool:
+        return name in self._indexes
+
+    def register(self, index: TaskIndex) -> None:
+        """Add an index; it is built or loaded on first use."""
+        with self._lock:
+            self._indexes[index.name] = index
+            self._signatures.pop(index.name, None)
+
+    def sidecar_path(self, name: str) -> Path:
+        """Return the file an index is persisted to e.g. indexes/todo-app.json.inverted.json"""
+        return self.directory / f"{Path(self.backend.path).name}.{name}.json"
+
+    def get(self, name: str) -> TaskIndex:
+        """Return a current index by name.
+        args:
+            name: index name e.g. 'inverted'
+        return:
+            TaskIndex: the index, loaded or rebuilt first if the store changed
+        """
+        with self._lock:
+            # only the requested index is loaded, so a read-only command pays for what it uses
+            self.sync([name])
+            return self._indexes[name]
+
+    def _in_use(self) -> List[str]:
+        """names of the indexes kept current on every change: persistent ones and in-memory ones already built"""
+        return [name for name, index in self._indexes.items() if index.persistent or name in self._signatures]
+
+    def _loaded(self) -> List[str]:
+        """names of the indexes this process holds in memory"""
+        return [name for name in self._indexes if name in self._signatures]
+
+    def _forget(self, name: str) -> None:
+        """drop an index from memory; it is loaded or rebuilt again on next use"""
+        self._indexes[name].clear()
+        self._signatures.pop(name, None)
+        self._dirty.discard(name)
+
+    def sync(self, names: Optional[Iterable[str]] = None) -> None:
+        """Bring indexes up to date with the backend.
+        args:
+            names: indexes to sync; when None every persistent index and every in-memory index already built
+        """
+        with self._lock:
+            signature = self.backend.signature()
+            selected = {name: self._indexes[name] for name in (self._in_use() if names is None else names)}
+            stale = [
+                index for name, index in selected.items()
+                if self._signatures.get(name) != signature
+                and not self._catch_up(index, signature) and not self._load(index, signature)
+            ]
+            if stale:
+                self._rebuild(stale, signature)
+
+    def _catch_up(self, index: TaskIndex, signature: str) -> bool:
+        """bring an index held in memory up to signature from the delta log"""
+        held = self._signatures.get(index.name)
+        if held is None:
+            return False
+        chain = self._chain(held, signature)
+        if chain is None:
+            return False
+        self._replay(index, chain)
+        self._signatures[index.name] = signature
+        return True
+
+    def rebuild(self, names: Optional[Iterable[str]] = None) -> None:
+        """Rebuild indexes from the saved tasks, ignoring what is cached or persisted.
+        args:
+            names: indexes to rebuild; when None every persistent index and every in-memory index already built
+        """
+        with self._lock:
+            selected = self._in_use() if names is None else list(names)
+            self._rebuild([self._indexes[name] for name in selected], self.backend.signature())
+
+    def _rebuild(self, indexes: List[TaskIndex], signature: str) -> None:
+        """feed every saved task to indexes in one pass"""
+        for index in indexes:
+            index.clear()
+
+        for task in self.backend.iter_tasks():
+            for index in indexes:
+                index.add(task)
+
+        for index in indexes:
+            self._signatures[index.name] = signature
+            self._dirty.add(index.name)
+
+    def _load(self, index: TaskIndex, signature: str) -> bool:
+        """load an index from its sidecar, replaying the deltas saved since, if they lead to the current signature"""
+        if not index.persistent:
+            return False
+        try:
+            with open(self.sidecar_path(index.name), "r", encoding="utf-8") as sidecar:
+                data = json.load(sidecar)
+        except (OSError, ValueError):
+            return False
+
+        if not isinstance(data, dict):
+            return False
+        chain = self._chain(data.get("signature"), signature)
+        if chain is None:
+            return False
+
+        try:
+            index.load_state(data["state"])
+            self._replay(index, chain)
+        except (KeyError, TypeError, ValueError, AttributeError):
+            index.clear()
+            return False
+
+        self._signatures[index.name] = signature
+        if len(chain) > INDEX_DELTA_REWRITE_AFTER:
+            self._dirty.add(index.name)  # far behind; save it caught up
+        else:
+            self._dirty.discard(index.name)
+        return True
+
+    def _deltas(self) -> Dict[str, Dict[str, Any]]:
+        """the saved deltas by the backend signature they start from; the log is re-read only when it changed"""
+        try:
+            stat = os.stat(self.delta_path)
+        except OSError:
+            return {}
+        key = (stat.st_mtime_ns, stat.st_size, stat.st_ino)
+        if self._delta_cache[0] != key:
+            deltas: Dict[str, Dict[str, Any]] = {}
+            try:
+                with open(self.delta_path, "r", encoding="utf-8") as delta_log:
+                    for line in delta_log:
+                        try:
+                            entry = json.loads(line)
+                        except ValueError:
+                            continue  # torn line from a crash mid-append
+                        if isinstance(entry, dict) and isinstance(entry.get("from"), str):
+                            deltas[entry["from"]] = entry
+            except OSError:
+                return {}
+            self._delta_cache = (key, deltas)
+        return self._delta_cache[1]
+
+    def _chain(self, start: Optional[str], signature: str) -> Optional[List[Dict[str, Any]]]:
+        """the deltas leading from signature start to signature; None if the log has no such path"""
+        chain: List[Dict[str, Any]] = []
+        if start == signature:
+            return chain
+        deltas = self._deltas()
+        seen: Set[str] = set()
+        while start != signature:
+            if start is None or start in seen or start not in deltas:
+                return None
+            seen.add(start)
+            chain.append(deltas[start])
+            start = deltas[start].get("to")
+        return chain
+
+    @staticmethod
+    def _replay(index: TaskIndex, chain: List[Dict[str, Any]]) -> None:
+        """apply saved deltas to an index"""
+        for entry in chain:
+            for task in entry.get("removed", ()):
+                index.remove(Task.from_dict(task))
+            for task in entry.get("added", ()):
+                index.add(Task.from_dict(task))
+
+    def _log_delta(self, before: str, after: str, added: List[Task], removed: List[Task]) -> None:
+        """append a change to the delta log; a failed write or an oversized change only costs a rebuild later"""
+        # no sidecar was ever written for this store, so there is nothing to catch up
+        if before == after or not self.directory.is_dir():
+            return
+        if len(added) + len(removed) > INDEX_DELTA_MAX_TASKS:
+            return
+        entry = {
+            "from": before, "to": after,
+            "added": [task.to_dict() for task in added], "removed": [task.to_dict() for task in removed],
+        }
+        line = json.dumps(entry, ensure_ascii=False, separators=(",", ":")) + "\n"
+        try:
+            # a full log starts over; indexes whose sidecars are older are rebuilt when next used
+            full = self.delta_path.exists() and self.delta_path.stat().st_size >= INDEX_DELTA_MAX_BYTES
+            with open(self.delta_path, "w" if full else "a", encoding="utf-8") as delta_log:
+                delta_log.write(line)
+        except OSError:
+            pass
+
+    def prepare_write(self) -> None:
+        """Get ready to record a change about to be saved through the backend.
+            Only the indexes this process already holds are brought up to date; the others are left
+            on disk and catch up from the delta log when they are next used. Call apply() after the change.
+        """
+        with self._lock:
+            signature = self.backend.signature()
+            for name in self._loaded():
+                if self._signatures[name] != signature and not self._catch_up(self._indexes[name], signature):
+                    self._forget(name)
+            self._write_signature = signature
+
+    def apply(self, added: Iterable[Task] = (), removed: Iterable[Task] = ()) -> None:
+        """Record a change that was just saved through the backend.
+            Call prepare_write() before making the change so the indexes reflect the old tasks.
+            An update is the old task removed and the new task added. The indexes held in memory
+            are updated; the change is appended to the delta log for every other index.
+        args:
+            added: tasks that were inserted or are the new version of an updated task
+            removed: tasks that were deleted or are the old version of an updated task
+        """
+        added, removed = list(added), list(removed)
+        with self._lock:
+            names = self._loaded()
+            for name in names:
+                index = self._indexes[name]
+                for task in removed:
+                    index.remove(task)
+                for task in added:
+                    index.add(task)
+
+            signature = self.backend.signature()
+            for name in names:
+                self._signatures[name] = signature
+
+            if self._write_signature is not None:
+                self._log_delta(self._write_signature, signature, added, removed)
+                self._write_signature = None
+
+    def reset(self) -> None:
+        """Forget every index after the whole store was replaced; each is rebuilt when next used."""
+        with self._lock:
+            for name in self._loaded():
+                self._forget(name)
+            self._write_signature = None
+
+    def _compacted(self, before: str, after: str) -> None:
+        """the backend rewrote its files without changing the tasks; indexes current at before are current at after"""
+        with self._lock:
+            for name in self._loaded():
+                if self._signatures[name] == before:
+                    self._signatures[name] = after
+            self._log_delta(before, after, [], [])
+
+    def mark_changed(self, name: str) -> None:
+        """Record that an index was changed other than through apply(), so flush() writes it."""
+        with self._lock:
+            self._dirty.add(name)
+
+    def flush(self) -> None:
+        """Write every changed index to its sidecar file. Indexes can always be rebuilt,
+        so a failed write is ignored.
+        """
+        with self._lock:
+            for name in sorted(self._dirty):
+                if not self._indexes[name].persistent:
+                    self._dirty.discard(name)
+                    continue
+                data = {"signature": self._signatures.get(name), "state": self._indexes[name].to_state()}
+                try:
+                    write_json(self.sidecar_path(name), data)
+                except OSError:
+                    continue
+                self._dirty.discard(name)
+
+
+def write_json(path: Path, data: object) -> None:
+    """atomically replace path with data as compact JSON"""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    fd, temp_path = tempfile.mkstemp(dir=path.parent, prefix=f".{path.name}.")
+    try:
+        with os.fdopen(fd, "w", encoding="utf-8") as temp_file:
+            json.dump(data, temp_file, ensure_ascii=False, separators=(",", ":"))
+        os.replace(temp_path, path)
+    except BaseException:
+        if os.path.exists(temp_path):
+            os.unlink(temp_path)
+        raise
+
+
+def default_indexes() -> List[TaskIndex]:
+    """Create the indexes every store gets: keyword tokens, priority and status buckets, sorted tags, due times,
+    description/tag trigrams for fuzzy search, the in-memory text used by substring search and the
+    aggregate counters of the stats command.
+    """
+    return [
+        InvertedIndex(), BucketIndex("Priority"), BucketIndex("Status"), TagIndex(), DueIndex(),
+        TrigramIndex(), TextIndex(), StatsIndex(),
+    ]
+
+
+# one registry per stored file for the whole process
+_REGISTRIES: Dict[Path, IndexRegistry] = {}
+_REGISTRIES_LOCK = threading.Lock()
+
+
+def get_index_registry(backend: StorageBackend) -> IndexRegistry:
+    """Return the process-wide index registry for a backend's store.
+    args:
+        backend: storage backend; JSON or SQLite
+    return:
+        IndexRegistry: shared registry holding the default task indexes
+    """
+    key = Path(backend.path).resolve()
+    with _REGISTRIES_LOCK:
+        if key not in _REGISTRIES:
+            _REGISTRIES[key] = IndexRegistry(backend, default_indexes())
+        return _REGISTRIES[key]
@@ -0,0 +1,87 @@
+from bisect import bisect_left, insort
+from datetime import datetime
+from typing import Any, Dict, List
+from todo_app.indexes.base import TaskIndex
+from todo_app.models.task import Status, Task, epoch_seconds
+
+# task groupings counted by the stats index
+STAT_GROUPS = ("status", "priority", "tag", "assignee")
+
+
+def _group_keys(task: Task) -> Dict[str, str]:
+    """the counter each group of a task goes to; tags and emails ignore case, no email is ''"""
+    return {
+        "status": task.status.value,
+        "priority": task.priority.value,
+        "tag": task.tag.lower(),
+        "assignee": task.email.lower(),
+    }
+
+
+class StatsIndex(TaskIndex):
+    """Count tasks by status, priority, tag and assignee as tasks are added and removed.
+
+    Reading the counts costs the same for ten tasks or a million. Overdue tasks depend
+    on the current time, so the due times of tasks that are not complete are kept
+    sorted and counted with one binary search.
+    """
+
+    name = "stats"
+
+    def __init__(self) -> None:
+        self.total = 0
+        self._counts: Dict[str, Dict[str, int]] = {group: {} for group in STAT_GROUPS}
+        self._open_due: List[int] = []  # sorted due epochs of tasks that are not complete
+
+    def clear(self) -> None:
+        self.total = 0
+        self._counts = {group: {} for group in STAT_GROUPS}
+        self._open_due = []
+
+    def add(self, task: Task) -> None:
+        self.total += 1
+        for group, key in _group_keys(task).items():
+            counts = self._counts[group]
+            counts[key] = counts.get(key, 0) + 1
+        due = task.due_epoch
+        if task.status is not Status.COMPLETE and due is not None:
+            insort(self._open_due, due)
+
+    def remove(self, task: Task) -> None:
+        self.total -= 1
+        for group, key in _group_keys(task).items():
+            counts = self._counts[group]
+            counts[key] = counts.get(key, 0) - 1
+            if counts[key] <= 0:
+                del counts[key]
+        due = task.due_epoch
+        if task.status is not Status.COMPLETE and due is not None:
+            position = bisect_left(self._open_due, due)
+            if position < len(self._open_due) and self._open_due[position] == due:
+                del self._open_due[position]
+
+    def overdue(self, now: datetime) -> int:
+        """Return the number of tasks that are not complete and were due before now."""
+        return bisect_left(self._open_due, epoch_seconds(now))
+
+    def snapshot(self, now: datetime) -> Dict[str, Any]:
+        """Return every counter e.g. {"total": 8, "overdue": 2, "status": {"Incomplete": 7, ...}, ...}.
+        args:
+            now: time overdue tasks are counted against
+        return:
+            Dict[str, Any]: total, overdue and a count per value of each group, largest first
+        """
+        snapshot: Dict[str, Any] = {"total": self.total, "overdue": self.overdue(now)}
+        for group in STAT_GROUPS:
+            counts = self._counts[group]
+            snapshot[group] = {key: counts[key] for key in sorted(counts, key=lambda key: (-counts[key], key))}
+        return snapshot
+
+    def to_state(self) -> Any:
+        return {"total": self.total, "counts": self._counts, "open_due": self._open_due}
+
+    def load_state(self, state: Any) -> None:
+        counts = {group: {str(key): int(count) for key, count in state["counts"][group].items()} for group in STAT_GROUPS}
+        self.total = int(state["total"])
+        self._counts = counts
+        self._open_due = sorted(int(due) for due in state["open_due"])
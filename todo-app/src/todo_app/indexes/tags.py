@@ -0,0 +1,134 @@
+import sys
+from bisect import bisect_left, insort
+from typing import Any, Dict, Iterator, List, Optional, Set, Tuple
+from todo_app.indexes.buckets import BucketIndex
+from todo_app.models.task import Task
+
+# separates the levels of a hierarchical tag e.g. work/release/q3
+TAG_SEPARATOR = "/"
+
+# suffix of a tag filter selecting a tag and every tag below it e.g. work/*
+SUBTREE_SUFFIX = f"{TAG_SEPARATOR}*"
+
+
+def subtree_root(value: str) -> Optional[str]:
+    """Return the lower case tag a subtree filter selects from e.g. 'Work/*' -> 'work'; None for other filters."""
+    if not value.endswith(SUBTREE_SUFFIX):
+        return None
+    return value[:-len(SUBTREE_SUFFIX)].strip(TAG_SEPARATOR).lower()
+
+
+def in_subtree(tag: str, root: str) -> bool:
+    """Whether a lower case tag is root or below it; every tag is below the empty root."""
+    return not root or tag == root or tag.startswith(root + TAG_SEPARATOR)
+
+
+class TagIndex(BucketIndex):
+    """Group task IDs by tag and keep the distinct tags sorted.
+
+    Sorting puts every tag below work/ in one run right after work, so subtree
+    filters, per-tag counts and shell completion read a slice of the tags found
+    with a binary search instead of looking at every task. The sidecar holds the
+    tags and their task IDs only, so completion answers from it without opening
+    the store; the sidecar's sorted ID lists are kept after loading, so IDs are
+    completed with a binary search per tag as well.
+    """
+
+    name = "tag"
+
+    def __init__(self) -> None:
+        super().__init__("Tag")
+        self._tags: List[str] = []  # distinct lower case tags, sorted
+        self._sorted_ids: Dict[str, List[str]] = {}  # tag -> sorted task IDs, dropped when the tag changes
+
+    def clear(self) -> None:
+        super().clear()
+        self._tags = []
+        self._sorted_ids = {}
+
+    def add(self, task: Task) -> None:
+        key = task.tag.lower()
+        if key not in self._buckets:
+            key = sys.intern(key)
+            insort(self._tags, key)
+        self._buckets.setdefault(key, set()).add(task.id)
+        self._sorted_ids.pop(key, None)
+
+    def remove(self, task: Task) -> None:
+        super().remove(task)
+        key = task.tag.lower()
+        self._sorted_ids.pop(key, None)
+        if key not in self._buckets:
+            position = bisect_left(self._tags, key)
+            if position < len(self._tags) and self._tags[position] == key:
+                del self._tags[position]
+
+    def tags(self, prefix: str = "") -> Iterator[str]:
+        """Yield the saved tags starting with prefix in sorted order, ignoring case."""
+        prefix = prefix.lower()
+        for position in range(bisect_left(self._tags, prefix), len(self._tags)):
+            tag = self._tags[position]
+            if not tag.startswith(prefix):
+                break
+            yield tag
+
+    def _subtree_tags(self, root: str) -> Iterator[str]:
+        """the saved tags equal to root or below it"""
+        if not root:
+            yield from self._tags
+            return
+        if root in self._buckets:
+            yield root
+        yield from self.tags(root + TAG_SEPARATOR)
+
+    def subtree(self, root: str) -> Set[str]:
+        """Return the IDs of tasks tagged root or any tag below it e.g. work, work/release, work/release/q3."""
+        task_ids: Set[str] = set()
+        for tag in self._subtree_tags(root.lower()):
+            task_ids |= self._buckets[tag]
+        return task_ids
+
+    def subtree_count(self, root: str) -> int:
+        """Return the number of tasks tagged root or any tag below it."""
+        return sum(len(self._buckets[tag]) for tag in self._subtree_tags(root.lower()))
+
+    def tree(self, root: str = "") -> List[Tuple[str, int, int]]:
+        """Count tasks per tag, rolling every tag's tasks up into the tags above it.
+        args:
+            root: only count this tag and the tags below it; every tag when empty
+        return:
+            List[Tuple[str, int, int]]: (tag, tasks with exactly this tag, tasks in its subtree) in sorted order,
+            including levels no task is tagged with directly e.g. work for work/release
+        """
+        root = root.lower().strip(TAG_SEPARATOR)
+        own: Dict[str, int] = {}
+        total: Dict[str, int] = {}
+        for tag in self._subtree_tags(root):
+            count = len(self._buckets[tag])
+            own[tag] = count
+            parts = tag.split(TAG_SEPARATOR)
+            for depth in range(1, len(parts) + 1):
+                level = TAG_SEPARATOR.join(parts[:depth])
+                if in_subtree(level, root):
+                    total[level] = total.get(level, 0) + count
+        return [(tag, own.get(tag, 0), total[tag]) for tag in sorted(total)]
+
+    def task_ids(self, prefix: str = "") -> List[str]:
+        """Return every indexed task ID starting with prefix, sorted."""
+        task_ids: List[str] = []
+        for key, bucket in self._buckets.items():
+            ordered = self._sorted_ids.get(key)
+            if ordered is None:
+                ordered = self._sorted_ids[key] = sorted(bucket)
+            for position in range(bisect_left(ordered, prefix), len(ordered)):
+                if not ordered[position].startswith(prefix):
+                    break
+                task_ids.append(ordered[position])
+        task_ids.sort()
+        return task_ids
+
+    def load_state(self, state: Any) -> None:
+        # to_state() saves every tag's IDs sorted
+        self._sorted_ids = {sys.intern(key): list(task_ids) for key, task_ids in state.items()}
+        self._buckets = {key: set(task_ids) for key, task_ids in self._sorted_ids.items()}
+        self._tags = sorted(self._buckets)
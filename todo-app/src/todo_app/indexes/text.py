@@ -0,0 +1,125 @@
+import re
+from bisect import bisect_right
+from typing import Any, Dict, Iterable, List, Optional, Pattern, Sequence
+from todo_app.config import SEARCH_FIELDS
+from todo_app.indexes.base import TaskIndex
+from todo_app.models.task import TASK_FIELDS, Task
+
+# joins fields and tasks in the scanned text; keywords never contain it, so no match spans two fields
+SEPARATOR = "\0"
+
+
+def keyword_pattern(keywords: Iterable[str]) -> Optional[Pattern[str]]:
+    """Compile keywords into one regular expression that finds any of them as literal text.
+        The keywords are escaped and merged into a prefix tree, e.g. ['meet', 'mass', 'c++'] becomes
+        'c\\+\\+|m(?:ass|eet)', so each position of the text is tried against the tree once instead of
+        against every keyword in turn. A keyword that extends another e.g. 'meeting' after 'meet' is
+        dropped, since any text containing it also contains the shorter one.
+    args:
+        keywords: lower case keywords
+    return:
+        Pattern | None: compiled pattern; None when there is no non-empty keyword
+    """
+    trie: Dict[str, Any] = {}
+    for keyword in sorted(set(keywords), key=len):
+        if not keyword:
+            continue
+        node = trie
+        for char in keyword:
+            if SEPARATOR in node:
+                break  # a shorter keyword already matches here
+            node = node.setdefault(char, {})
+        else:
+            node.clear()
+            node[SEPARATOR] = {}
+
+    if not trie:
+        return None
+
+    def build(node: Dict[str, Any]) -> str:
+        branches = [re.escape(char) + build(child) for char, child in sorted(node.items()) if char != SEPARATOR]
+        if len(branches) == 1:
+            return branches[0]
+        return f"(?:{'|'.join(branches)})" if branches else ""
+
+    return re.compile(build(trie))
+
+
+class TextIndex(TaskIndex):
+    """Keep a lower case copy of the searchable fields of every task for substring search.
+
+    Each task's fields are lower-cased and joined once when the task is added, and all
+    tasks are concatenated into a single string when a scan needs it, so a search is
+    one pass of a compiled pattern over that string instead of a regex call per field
+    of every task. The string is rebuilt lazily after a change. The index is kept in
+    memory only; it is as cheap to rebuild as to read back from disk.
+    """
+
+    name = "text"
+    persistent = False
+
+    def __init__(self, fields: Sequence[str] = SEARCH_FIELDS) -> None:
+        for field in fields:
+            if field not in TASK_FIELDS:
+                raise ValueError(f"Unknown task field {field}")
+        self.fields = tuple(fields)
+        self._blobs: Dict[str, str] = {}  # task ID -> lower case searchable text
+        self._text: Optional[str] = None  # every blob, each followed by SEPARATOR
+        self._starts: List[int] = []  # offset of each blob in _text
+        self._ids: List[str] = []  # task ID of each blob in _text
+
+    def clear(self) -> None:
+        self._blobs = {}
+        self._text = None
+
+    def add(self, task: Task) -> None:
+        self._blobs[task.id] = SEPARATOR.join(task.value(field) for field in self.fields).lower()
+        self._text = None
+
+    def remove(self, task: Task) -> None:
+        if self._blobs.pop(task.id, None) is not None:
+            self._text = None
+
+    def _build_text(self) -> str:
+        """concatenate the blobs and record where each task starts"""
+        starts, offset = [], 0
+        for blob in self._blobs.values():
+            starts.append(offset)
+            offset += len(blob) + 1
+        self._starts = starts
+        self._ids = list(self._blobs)
+        self._text = "".join(blob + SEPARATOR for blob in self._blobs.values())
+        return self._text
+
+    def scan(self, keywords: Iterable[str]) -> List[str]:
+        """Return the IDs of tasks whose searchable fields contain any keyword, ignoring case.
+        args:
+            keywords: literal text e.g. ['docl', 'c++', '(urgent)']; regex characters have no special meaning
+        return:
+            List[str]: matching task IDs, not in any particular order
+        """
+        pattern = keyword_pattern(keyword.lower() for keyword in keywords)
+        if pattern is None:
+            return []
+
+        text = self._text if self._text is not None else self._build_text()
+        starts, ids = self._starts, self._ids
+        task_ids: List[str] = []
+        position = 0
+        while True:
+            match = pattern.search(text, position)
+            if match is None:
+                break
+            blob = bisect_right(starts, match.start()) - 1
+            task_ids.append(ids[blob])
+            # the task matched; carry on from the start of the next one
+            if blob + 1 == len(starts):
+                break
+            position = starts[blob + 1]
+        return task_ids
+
+    def to_state(self) -> Any:
+        return None
+
+    def load_state(self, state: Any) -> None:
+        raise ValueError("the text index is not persisted")
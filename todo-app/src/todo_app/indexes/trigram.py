@@ -0,0 +1,160 @@
+from typing import Any, Dict, Iterable, Optional, Set
+from todo_app.indexes.base import TaskIndex
+from todo_app.indexes.inverted import tokenize
+from todo_app.models.task import Task
+
+# saved task fields covered by fuzzy search
+FUZZY_FIELDS = ("Description", "Tag")
+
+
+def trigrams(word: str) -> Set[str]:
+    """Return the trigrams of a lower case word padded at both ends e.g. 'cat' -> {'  c', ' ca', 'cat', 'at '}.
+    The padding lets short words and word starts count, so 'tozr' still shares 3 of its 5 trigrams with 'tozer'.
+    """
+    padded = f"  {word} "
+    return {padded[position:position + 3] for position in range(len(padded) - 2)}
+
+
+def similarity(first: str, second: str) -> float:
+    """Return the share of trigrams two words have in common, from 0.0 (none) to 1.0 (same trigrams)."""
+    first_grams, second_grams = trigrams(first), trigrams(second)
+    shared = len(first_grams & second_grams)
+    return shared / (len(first_grams) + len(second_grams) - shared)
+
+
+def task_words(task: Task) -> Set[str]:
+    """Return the distinct lower case words of a task's Description and Tag."""
+    words: Set[str] = set()
+    for field in FUZZY_FIELDS:
+        words.update(tokenize(task.value(field)))
+    return words
+
+
+class TrigramIndex(TaskIndex):
+    """Find tasks whose Description or Tag contain words similar to a misspelt keyword.
+
+    Two levels are kept: every distinct word maps to the IDs of the tasks using it,
+    and every trigram maps to the words containing it. A fuzzy lookup only scores
+    the words sharing at least one trigram with the keyword, so its cost follows
+    the vocabulary around the keyword rather than the number of saved tasks.
+
+    Only the word level is saved and kept current as tasks change. The trigram
+    level is derived from it on the first fuzzy lookup and kept current from then
+    on, so loading, rebuilding and every write skip it.
+    """
+
+    name = "trigram"
+
+    def __init__(self) -> None:
+        self._words: Dict[str, Set[str]] = {}  # word -> task IDs
+        self._grams: Optional[Dict[str, Set[str]]] = None  # trigram -> words; None until the first lookup
+        self._sizes: Dict[str, int] = {}  # word -> number of distinct trigrams
+
+    def clear(self) -> None:
+        self._words = {}
+        self._grams = None
+        self._sizes = {}
+
+    def _trigram_level(self) -> Dict[str, Set[str]]:
+        """the trigram level, derived from the words the first time it is needed"""
+        if self._grams is None:
+            self._grams = {}
+            for word in self._words:
+                self._add_word(word)
+        return self._grams
+
+    def _add_word(self, word: str) -> None:
+        """add a new word to the trigram level"""
+        assert self._grams is not None
+        grams = trigrams(word)
+        self._sizes[word] = len(grams)
+        for gram in grams:
+            self._grams.setdefault(gram, set()).add(word)
+
+    def _remove_word(self, word: str) -> None:
+        """drop a word no task uses any more from the trigram level"""
+        assert self._grams is not None
+        del self._sizes[word]
+        for gram in trigrams(word):
+            words = self._grams.get(gram)
+            if words is None:
+                continue
+            words.discard(word)
+            if not words:
+                del self._grams[gram]
+
+    def add(self, task: Task) -> None:
+        for word in task_words(task):
+            task_ids = self._words.get(word)
+            if task_ids is None:
+                task_ids = self._words[word] = set()
+                if self._grams is not None:
+                    self._add_word(word)
+            task_ids.add(task.id)
+
+    def remove(self, task: Task) -> None:
+        for word in task_words(task):
+            task_ids = self._words.get(word)
+            if task_ids is None:
+                continue
+            task_ids.discard(task.id)
+            if not task_ids:
+                del self._words[word]
+                if self._grams is not None:
+                    self._remove_word(word)
+
+    def similar_words(self, word: str, threshold: float) -> Dict[str, float]:
+        """Return the indexed words at least threshold similar to word, with their similarity.
+        args:
+            word: search word e.g. 'tozr'
+            threshold: smallest similarity to keep, between 0 and 1
+        return:
+            Dict[str, float]: similar words e.g. {'tozer': 0.375}
+        """
+        level = self._trigram_level()
+        grams = trigrams(word.lower())
+        shared: Dict[str, int] = {}
+        for gram in grams:
+            for candidate in level.get(gram, ()):
+                shared[candidate] = shared.get(candidate, 0) + 1
+
+        similar: Dict[str, float] = {}
+        for candidate, count in shared.items():
+            score = count / (len(grams) + self._sizes[candidate] - count)
+            if score >= threshold:
+                similar[candidate] = score
+        return similar
+
+    def search(self, keywords: Iterable[str], threshold: float) -> Dict[str, float]:
+        """Score tasks by how closely their words match the keywords.
+            Each keyword word scores a task by its most similar word in the task; a task's
+            score is the mean over the keyword words, so tasks matching every word rank first.
+        args:
+            keywords: search keywords e.g. ['tozr', 'bok']
+            threshold: smallest word similarity that counts as a match, between 0 and 1
+        return:
+            Dict[str, float]: task ID -> score between 0 and 1 for tasks matching any keyword word
+        """
+        terms = {term for keyword in keywords for term in tokenize(keyword)}
+        if not terms:
+            return {}
+
+        totals: Dict[str, float] = {}
+        for term in terms:
+            best: Dict[str, float] = {}
+            for word, score in self.similar_words(term, threshold).items():
+                for task_id in self._words[word]:
+                    if score > best.get(task_id, 0.0):
+                        best[task_id] = score
+            for task_id, score in best.items():
+                totals[task_id] = totals.get(task_id, 0.0) + score
+
+        return {task_id: total / len(terms) for task_id, total in totals.items()}
+
+    def to_state(self) -> Any:
+        # the trigram level is derived from the words, so only the words are saved
+        return {word: sorted(task_ids) for word, task_ids in self._words.items()}
+
+    def load_state(self, state: Any) -> None:
+        self.clear()
+        self._words = {word: set(task_ids) for word, task_ids in state.items()}
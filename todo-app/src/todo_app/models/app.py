@@ -1,67 +1,243 @@
 from todo_app.parsers.extractor import Extractor
-from todo_app.utilis.utils import generate_taskID
+from todo_app.parsers.lexer import TaskLine, lex_task
+from todo_app.utilis.utils import date_cache_stats, generate_taskID
 from todo_app.services.task_service import TaskService
 from todo_app.services.database_service import DatabaseService
-from typing import Union, List, Any, Tuple
+from todo_app.services.import_service import IMPORT_FORMATS, iter_task_lines
+from todo_app.services.export_service import EXPORT_FORMATS, export_tasks
+from todo_app.services.paging import Page
+from todo_app.services.query import MatchAll
+from todo_app.config import EMAIL_BATCH_SIZE, IMPORT_COMMIT_EVERY
+from todo_app.models.task import Priority, Status, Task, parse_due
+from dataclasses import replace
+from itertools import islice
+from typing import List, Any, Tuple, Dict, Iterable, Iterator, Mapping, Set, TextIO, Optional, Union
 
 
 class TodoApp:
     def __init__(self):
         self.extractor = Extractor()
         self.task_service = TaskService()
-        self.db_service = DatabaseService()
+        self._db_service: Optional[DatabaseService] = None
 
-    def add_task(self, user_input: str) -> Tuple[bool, str, List[Any]]:
-        """Assign a task based on user input and store in JSON_DB
+    @property
+    def db_service(self) -> DatabaseService:
+        """database service, built on first use so commands that never read tasks skip opening the store"""
+        if self._db_service is None:
+            self._db_service = DatabaseService()
+        return self._db_service
+
+    @db_service.setter
+    def db_service(self, service: DatabaseService) -> None:
+        self._db_service = service
+
+    def _build_task(
+        self, user_input: Union[str, TaskLine], emails: Optional[Mapping[str, Any]] = None
+    ) -> Tuple[bool, str, Optional[Task]]:
+        """Extract and validate every task field from user input.
            args:
-                user_input: A valid user input. Example buy groceries @shopping #high due:8pm assigned:okeyobinna2001@gmail.com
+                user_input: A valid user input. Example buy groceries @shopping #high due:8pm assigned:okeyobinna2001@gmail.com,
+                            or the TaskLine lex_task already made of it
+                emails: assignees validated beforehand by address, see _with_emails
            return:
-               (True|False, success message|error message, List[Dict]|[])
+               (True|False, empty message|error message, Task|None)
         """
-        description_status, task_description = self.extractor.extract_task_description(user_input)
-        time_status, task_time = self.extractor.extract_date(user_input)
-        priority_status, task_priority = self.extractor.extract_priority_level(user_input)
-        tag_status, task_tag = self.extractor.extract_tag(user_input)
-        email_status, task_email = self.extractor.extract_email(user_input)
+        line = user_input if isinstance(user_input, TaskLine) else lex_task(user_input)
+        fields = self.extractor.extract_fields(line, emails)
+        description_status, task_description = fields["description"]
+        time_status, task_time = fields["due"]
+        priority_status, task_priority = fields["priority"]
+        tag_status, task_tag = fields["tag"]
+        email_status, task_email = fields["email"]
 
         # checking if user input is valid
         if not description_status:
-            return description_status, task_description, []
+            return description_status, task_description, None
 
         if not time_status:
-            return time_status, task_time, []
+            return time_status, task_time, None
 
         if not priority_status:
-            return priority_status, task_priority, []
+            return priority_status, task_priority, None
 
         if not tag_status:
-            return tag_status, task_tag, []
+            return tag_status, task_tag, None
 
         if not email_status:
             if task_email == "Email not found.":
                 task_email = ""
 
             elif task_email == "Invalid Email address":
-                return task_email
+                return False, task_email, None
 
-        # create a unique task id and status
-        task_id = generate_taskID(user_input)
-        status = "Incomplete"
+        # create a unique task id
+        task_id = generate_taskID(line.text)
 
         # create task
-        task = {
-            "ID": task_id,
-            "Time": str(task_time),
-            "Description": task_description,
-            "Priority": task_priority,
-            "Tag": task_tag,
-            "Email": task_email,
-            "Status": status,
-        }
+        task = Task(
+            id=task_id,
+            due=parse_due(task_time),
+            description=task_description,
+            priority=Priority.parse(task_priority),
+            tag=task_tag,
+            email=task_email,
+            status=Status.INCOMPLETE,
+        )
+        return True, "", task
+
+    def add_task(self, user_input: str) -> Tuple[bool, str, List[Any]]:
+        """Assign a task based on user input and store in JSON_DB
+           args:
+                user_input: A valid user input. Example buy groceries @shopping #high due:8pm assigned:okeyobinna2001@gmail.com
+           return:
+               (True|False, success message|error message, List[Dict]|[])
+        """
+        status, message, task = self._build_task(user_input)
+        if not status or task is None:
+            return status, message, []
 
         # save task to todo-app.json
         return self.db_service.upload_task(task)
 
+    def add_tasks(
+        self, task_lines: Iterable[str], commit_every: int = IMPORT_COMMIT_EVERY
+    ) -> Tuple[bool, str, List[str]]:
+        """Add many tasks, one task line per item, saving once per batch instead of once per task.
+           args:
+                task_lines: iterable (e.g. an open file or generator) of task lines in the add format
+                commit_every: save after every N tasks; 0 saves once at the end
+           return:
+               (True|False, summary message, List of per-line error messages)
+        """
+        numbered_lines = ((number, line, "") for number, line in enumerate(task_lines, start=1))
+        return self._add_numbered_tasks(numbered_lines, commit_every)
+
+    def import_tasks(
+        self, stream: TextIO, file_format: str = "text", commit_every: int = IMPORT_COMMIT_EVERY
+    ) -> Tuple[bool, str, List[str]]:
+        """Stream tasks from a text, CSV or JSONL file into TaskMate.
+           args:
+                stream: open import file or standard input
+                file_format: text, csv or jsonl
+                commit_every: save after every N tasks; 0 saves once at the end
+           return:
+               (True|False, summary message, List of per-line error messages)
+        """
+        if file_format not in IMPORT_FORMATS:
+            return False, f"Invalid import format {file_format}. Valid formats are; {', '.join(IMPORT_FORMATS)}", []
+
+        return self._add_numbered_tasks(iter_task_lines(stream, file_format), commit_every)
+
+    def _with_emails(
+        self, numbered_lines: Iterable[Tuple[int, str, str]]
+    ) -> Iterator[Tuple[int, TaskLine, str, Dict[str, Any]]]:
+        """Validate the assignees of EMAIL_BATCH_SIZE lines at a time with Validator.valid_emails and
+        pass each (line number, task line, error) item on with the results of its batch. Each task line
+        is lexed here once and passed on as its TaskLine, so building the task does not lex it again.
+        """
+        numbered_lines = iter(numbered_lines)
+        while True:
+            chunk = [
+                (number, lex_task(line) if not error else TaskLine(line), error)
+                for number, line, error in islice(numbered_lines, EMAIL_BATCH_SIZE)
+            ]
+            if not chunk:
+                return
+            tokens = (line.get("email") for _, line, _ in chunk)
+            addresses = [token.text for token in tokens if token is not None]
+            emails = dict(zip(addresses, self.extractor.validator.valid_emails(addresses)))
+            for number, line, error in chunk:
+                yield number, line, error, emails
+
+    def _add_numbered_tasks(
+        self, numbered_lines: Iterable[Tuple[int, str, str]], commit_every: int
+    ) -> Tuple[bool, str, List[str]]:
+        """Build, de-duplicate and save tasks from (line number, task line, error) items"""
+        added = skipped = 0
+        errors: List[str] = []
+        batch: List[Task] = []
+        batch_ids: Set[str] = set()
+
+        def commit() -> Tuple[bool, str]:
+            nonlocal added, skipped
+            status, message, saved = self.db_service.upload_tasks(batch)
+            if status:
+                added += len(saved)
+                skipped += len(batch) - len(saved)  # duplicate descriptions
+            batch.clear()
+            batch_ids.clear()
+            return status, message
+
+        for number, line, error, emails in self._with_emails(numbered_lines):
+            if error:
+                errors.append(f"line {number}: {error}")
+                continue
+
+            if not line.text.strip():
+                continue
+
+            # a bad line is reported and the rest of the batch carries on
+            try:
+                status, message, task = self._build_task(line, emails)
+            except Exception as e:
+                status, message, task = False, str(e), None
+
+            if not status or task is None:
+                errors.append(f"line {number}: {message}")
+                continue
+
+            # ids are a short hash of the line and the current second; re-hash on a collision
+            while task.id in batch_ids or self.db_service.backend.get_task(task.id) is not None:
+                task = replace(task, id=generate_taskID(f"{line.text}{number}{task.id}"))
+
+            batch.append(task)
+            batch_ids.add(task.id)
+
+            if commit_every and len(batch) >= commit_every:
+                status, message = commit()
+                if not status:
+                    return False, f"Import stopped at line {number}: {message}", errors
+
+        if batch:
+            status, message = commit()
+            if not status:
+                return False, f"Import stopped: {message}", errors
+
+        summary = f"Imported {added} task(s), skipped {skipped} duplicate(s), {len(errors)} line(s) failed."
+        return added > 0 or not errors, summary, errors
+
+    def export_tasks(
+        self,
+        stream: TextIO,
+        file_format: str = "jsonl",
+        tag_filters_list: Optional[List[str]] = None,
+        priority_filters_list: Optional[List[str]] = None,
+        status_filters_list: Optional[List[str]] = None,
+        time_filters_list: Optional[List[str]] = None,
+    ) -> Tuple[bool, str]:
+        """Stream saved tasks to a file or standard output as JSONL or CSV, one record at a time.
+        Memory stays flat, except for a filtered export from the JSON backend, which reads the whole store first.
+        args:
+            stream: open output file or standard output
+            file_format: jsonl or csv
+            tag_filters_list, priority_filters_list, status_filters_list, time_filters_list:
+                optional list command filters; exported tasks match all given filters
+        return:
+            (bool, str):
+                - (True | False,  success message | error message)
+        """
+        if file_format not in EXPORT_FORMATS:
+            return False, f"Invalid export format {file_format}. Valid formats are; {', '.join(EXPORT_FORMATS)}"
+
+        status, message, tasks = self.task_service.iter_filtered_tasks(
+            tag_filters_list, priority_filters_list, status_filters_list, time_filters_list
+        )
+        if not status:
+            return status, message
+
+        count = export_tasks((task.to_dict() for task in tasks), stream, file_format)
+        return True, f"Exported {count} task(s)"
+
     def delete_task(self, index: List[str]) -> Tuple[bool, str]:
         """Delete one or more tasks based on task IDs.
         args:
@@ -93,15 +269,21 @@ class TodoApp:
         """
         return self.db_service.display_tasks(index)
 
-    def display_all_task(self) -> Tuple[bool, str, List[Any]]:
+    def display_all_task(self, page: Optional[Page] = None) -> Tuple[bool, str, List[Any]]:
         """Delete one or more tasks based on task ID or 'all'.
         args:
-            None
+            page: optional sort order and slice of the tasks example Page(sort="time", limit=20)
         return:
             (bool, str, List[Any]):
                 - (True | False,  success message | warnin message, List of tasks | empty list)
         """
-        return self.db_service.display_all_tasks()
+        if page is None or page == Page():
+            return self.db_service.display_all_tasks()
+
+        status, message, result = self.task_service.query_tasks(MatchAll(), page)
+        if not result:
+            return False, message, []
+        return status, message, result
     
     def update_task_description(self, update_values: str) -> Tuple[bool, str]:
         """ "To update the description of an existing task based on the task id.
@@ -153,15 +335,45 @@ class TodoApp:
         """
         return self.db_service.update_status(update_values)
 
-    def task_keyword_search(self, keywords: List[str]) -> Tuple[bool, str, List[Any]]:
+    def update_tasks(self, changes: List[Tuple[str, Dict[str, str]]]) -> Tuple[bool, str]:
+        """To update several fields of several tasks in one write.
+        args:
+            changes: List of (task id, {field: value}). E.g [('9d30d4ab', {'priority': 'mild', 'status': 'complete'})]
+        return:
+            (bool, str):
+                - (True | False,  success message | error message)
+        """
+        return self.db_service.apply_updates(changes)
+
+    def task_keyword_search(
+        self, keywords: List[str], mode: str = "any", page: Optional[Page] = None,
+    ) -> Tuple[bool, str, List[Any]]:
         """Search and extract task from todo-app.json using keyword.
         args:
             keywords: List containing keywords
+            mode: any, all or substring; see TaskService.keyword_search
+            page: optional sort order and slice of the search result
         return:
             (bool, str, List[Any]):
                 - (True | False,  empty message | error message, List of search result | empty list)
         """
-        return self.task_service.keyword_search(keywords)
+        return self.task_service.keyword_search(keywords, mode, page)
+
+    def task_fuzzy_search(
+        self, keywords: List[str], threshold: Optional[float] = None, page: Optional[Page] = None,
+    ) -> Tuple[bool, str, List[Any]]:
+        """Search task descriptions and tags for words similar to possibly misspelt keywords.
+        args:
+            keywords: List containing keywords example ['tozr', 'bok']
+            threshold: smallest word similarity between 0 and 1; the configured default when None
+            page: optional slice of the ranked result, or a sort order replacing the ranking
+        return:
+            (bool, str, List[Any]):
+                - (True | False,  success message | error message, List of search result best match first | empty list)
+        """
+        if threshold is None:
+            return self.task_service.fuzzy_search(keywords, page=page)
+        return self.task_service.fuzzy_search(keywords, threshold, page)
 
     def task_tag_filter(self, tag_filters_list: List[str]) -> Tuple[bool, str, List[Any]]:
         """Search and extract task from todo-app.json based on tag filters.
@@ -201,4 +413,176 @@ class TodoApp:
             (bool, str, List[Any]):
                 - (True | False,  empty string| error message, List of filter result | empty list)
         """
-        return self.task_service.status_filter(status_filters_list)
\ No newline at end of file
+        return self.task_service.status_filter(status_filters_list)
+
+    def task_filter(
+        self,
+        tag_filters_list: Optional[List[str]] = None,
+        priority_filters_list: Optional[List[str]] = None,
+        status_filters_list: Optional[List[str]] = None,
+        time_filters_list: Optional[List[str]] = None,
+        keywords: Optional[List[str]] = None,
+        query: str = "",
+        due_from: str = "",
+        due_to: str = "",
+        overdue: bool = False,
+        within: str = "",
+        page: Optional[Page] = None,
+    ) -> Tuple[bool, str, List[Any]]:
+        """Search and extract tasks matching every given filter and an optional query string.
+        args:
+            tag_filters_list, priority_filters_list, status_filters_list, time_filters_list: list command filters
+            keywords: List containing keywords
+            query: query string with AND/OR/NOT example 'status:incomplete and not tag:work'
+            due_from, due_to: inclusive due time bounds example 'today', '23/10/2025 18:00'
+            overdue: only incomplete tasks whose due time has passed
+            within: only tasks due from now until this duration example '1 hour', '7 days'
+            page: optional sort order and slice of the filter result
+        return:
+            (bool, str, List[Any]):
+                - (True | False,  empty string| error message, List of filter result | empty list)
+        """
+        status, message, task_query = self.task_service.build_query(
+            tag_filters_list, priority_filters_list, status_filters_list, time_filters_list, keywords, query,
+            due_from, due_to, overdue, within,
+        )
+        if not status:
+            return status, message, []
+
+        return self.task_service.query_tasks(task_query, page)
+
+    def explain_task_filter(
+        self,
+        tag_filters_list: Optional[List[str]] = None,
+        priority_filters_list: Optional[List[str]] = None,
+        status_filters_list: Optional[List[str]] = None,
+        time_filters_list: Optional[List[str]] = None,
+        keywords: Optional[List[str]] = None,
+        query: str = "",
+        due_from: str = "",
+        due_to: str = "",
+        overdue: bool = False,
+        within: str = "",
+    ) -> Tuple[bool, str, List[str]]:
+        """Describe how task_filter answers the given filters.
+        args:
+            same as task_filter
+        return:
+            (bool, str, List[str]):
+                - (True | False,  empty string| error message, plan lines with candidate counts | empty list)
+        """
+        status, message, task_query = self.task_service.build_query(
+            tag_filters_list, priority_filters_list, status_filters_list, time_filters_list, keywords, query,
+            due_from, due_to, overdue, within,
+        )
+        if not status:
+            return status, message, []
+
+        return self.task_service.explain_query(task_query)
+
+    def task_stats(self, recompute: bool = False) -> Tuple[bool, str, Dict[str, Any]]:
+        """Count saved tasks by status, priority, tag and assignee, and count overdue tasks.
+        args:
+            recompute: count every task again to verify the kept counters
+        return:
+            (bool, str, Dict[str, Any]):
+                - (True | False,  empty string | verification message | error message, counts | empty dict)
+        """
+        return self.task_service.stats(recompute)
+
+    def task_tag_counts(self, root: str = "") -> Tuple[bool, str, List[Dict[str, Any]]]:
+        """Count tasks per tag, including the tasks of the tags below each one.
+        args:
+            root: only count this tag and the tags below it example 'work'; every tag when empty
+        return:
+            (bool, str, List[Dict[str, Any]]):
+                - (True | False,  empty string | error message, List of tag counts | empty list)
+        """
+        return self.task_service.tag_counts(root)
+
+    def complete_tags(self, incomplete: str) -> List[str]:
+        """Return saved tags starting with incomplete, for shell completion.
+        args:
+            incomplete: start of a tag example 'work/'
+        return:
+            List[str]: matching tags and subtree filters example ['work/*', 'work/release']
+        """
+        return self.task_service.complete_tags(incomplete)
+
+    def complete_ids(self, incomplete: str) -> List[str]:
+        """Return saved task IDs starting with incomplete, for shell completion.
+        args:
+            incomplete: start of a task ID example '01'
+        return:
+            List[str]: matching task IDs
+        """
+        return self.task_service.complete_ids(incomplete)
+
+    def save_view(self, name: str, query: str) -> Tuple[bool, str]:
+        """Save a query as a named view whose tasks are kept up to date as tasks change.
+        args:
+            name: view name example 'release'
+            query: query string example 'priority:high status:incomplete tag:release'
+        return:
+            (bool, str):
+                - (True | False, success message | error message)
+        """
+        return self.task_service.save_view(name, query)
+
+    def show_view(self, name: str, page: Optional[Page] = None) -> Tuple[bool, str, List[Any]]:
+        """Return the tasks of a saved view.
+        args:
+            name: view name example 'release'
+            page: optional sort order and slice of the result
+        return:
+            (bool, str, List[Any]):
+                - (True | False,  empty string | error message, List of tasks | empty list)
+        """
+        return self.task_service.show_view(name, page)
+
+    def list_views(self) -> Tuple[bool, str, List[Dict[str, Any]]]:
+        """List saved views with their queries and task counts.
+        args:
+            None
+        return:
+            (bool, str, List[Dict[str, Any]]):
+                - (True | False,  empty string | error message, List of views | empty list)
+        """
+        return self.task_service.list_views()
+
+    def delete_view(self, name: str) -> Tuple[bool, str]:
+        """Delete a saved view.
+        args:
+            name: view name example 'release'
+        return:
+            (bool, str):
+                - (True | False, success message | error message)
+        """
+        return self.task_service.delete_view(name)
+
+    def cache_stats(self) -> Dict[str, int]:
+        """Report how often saved tasks were served from memory instead of re-reading storage.
+        args:
+            None
+        return:
+            Dict[str, int]: cache hit and miss counters e.g. {"hits": 12, "misses": 1}
+        """
+        return self.db_service.cache_stats()
+
+    def query_cache_stats(self) -> Dict[str, float]:
+        """Report how often search and list results were served from the query cache.
+        args:
+            None
+        return:
+            Dict[str, float]: cache counters and hit rate e.g. {"hits": 9, "misses": 1, "hit_rate": 0.9, ...}
+        """
+        return self.db_service.query_cache_stats()
+
+    def date_cache_stats(self) -> Dict[str, float]:
+        """Report how often due strings were resolved from the date parsing cache.
+        args:
+            None
+        return:
+            Dict[str, float]: cache counters and hit rate e.g. {"hits": 9, "misses": 1, "hit_rate": 0.9, ...}
+        """
+        return date_cache_stats()
@@ -0,0 +1,198 @@
+import re
+import sys
+from dataclasses import dataclass
+from datetime import datetime
+from enum import Enum
+from typing import Any, Dict, Optional
+
+PRIORITY_PATTERN = re.compile(r"\b(high|mild|low)\b", re.IGNORECASE)
+STATUS_PATTERN = re.compile(r"\b(incomplete|inprogress|complete)\b", re.IGNORECASE)
+
+# field names of a saved task in the order they are written to storage
+TASK_FIELDS = ("ID", "Time", "Description", "Priority", "Tag", "Email", "Status")
+
+
+class Priority(str, Enum):
+    """Task priority level. Members compare equal to their saved string e.g. Priority.HIGH == "High"."""
+    HIGH = "High"
+    MILD = "Mild"
+    LOW = "Low"
+
+    @classmethod
+    def parse(cls, value: str, strict: bool = False) -> "Priority":
+        """convert a priority string such as 'high' or 'High' to a Priority.
+        args:
+            value: priority string
+            strict: raise ValueError, instead of returning Mild, when a non-empty value names no level
+        return:
+            Priority: matched level; Mild when value is empty or, unless strict, names no level
+        """
+        match = PRIORITY_PATTERN.search(value or "")
+        if match:
+            return cls(match.group(1).title())
+        if strict and value:
+            raise ValueError(f"Invalid Priority {value!r}. Priority Level are high, mild and low")
+        return cls.MILD
+
+    @property
+    def rank(self) -> int:
+        """sort key; High sorts first"""
+        return _PRIORITY_RANK[self]
+
+
+class Status(str, Enum):
+    """Task status. Members compare equal to their saved string e.g. Status.COMPLETE == "Complete"."""
+    INCOMPLETE = "Incomplete"
+    INPROGRESS = "Inprogress"
+    COMPLETE = "Complete"
+
+    @classmethod
+    def parse(cls, value: str, strict: bool = False) -> "Status":
+        """convert a status string such as 'complete' to a Status.
+        args:
+            value: status string
+            strict: raise ValueError, instead of returning Incomplete, when a non-empty value names no status
+        return:
+            Status: matched status; Incomplete when value is empty or, unless strict, names no status
+        """
+        match = STATUS_PATTERN.search(value or "")
+        if match:
+            return cls(match.group(1).title())
+        if strict and value:
+            raise ValueError(f"Invalid Status {value!r}. Valid status are; Incomplete, Inprogress and Complete")
+        return cls.INCOMPLETE
+
+    @property
+    def rank(self) -> int:
+        """sort key; Incomplete sorts first"""
+        return _STATUS_RANK[self]
+
+
+_PRIORITY_RANK = {Priority.HIGH: 0, Priority.MILD: 1, Priority.LOW: 2}
+_STATUS_RANK = {Status.INCOMPLETE: 0, Status.INPROGRESS: 1, Status.COMPLETE: 2}
+
+
+def parse_due(value: Any) -> Optional[datetime]:
+    """convert a saved Time string such as '2025-10-23 18:00:00' to a datetime.
+    args:
+        value: saved Time string or datetime
+    return:
+        datetime | None: None when value is empty or not an ISO date time
+    """
+    if isinstance(value, datetime):
+        return value
+    try:
+        return datetime.fromisoformat(value)
+    except (TypeError, ValueError):
+        return None
+
+
+# epoch keys used for times before 1970 or past the platform's timestamp range
+MIN_EPOCH = -(2 ** 63)
+MAX_EPOCH = 2 ** 63 - 1
+
+
+def epoch_seconds(value: datetime) -> int:
+    """convert a naive local datetime to whole seconds since the epoch.
+    args:
+        value: datetime e.g. a task due time or a query bound such as datetime.max
+    return:
+        int: seconds since the epoch; MIN_EPOCH / MAX_EPOCH for times out of range
+    """
+    try:
+        return int(value.timestamp())
+    except (OverflowError, OSError, ValueError):
+        return MIN_EPOCH if value.year < 1970 else MAX_EPOCH
+
+
+@dataclass(slots=True, frozen=True)
+class Task:
+    """A saved task with pre-parsed fields.
+
+    The on-disk shape is the dictionary used by todo-app.json:
+    {"ID", "Time", "Description", "Priority", "Tag", "Email", "Status"}. Use
+    Task.from_dict and Task.to_dict to convert between the two. Tasks are frozen,
+    so the repository can hand out its cached tasks without copying them.
+    """
+    id: str
+    due: Optional[datetime]
+    description: str
+    priority: Priority
+    tag: str
+    email: str = ""
+    status: Status = Status.INCOMPLETE
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "Task":
+        """Build a Task from a saved task dictionary.
+        args:
+            data: task in the on-disk shape
+        return:
+            Task: parsed task; tags and emails are interned since few distinct values repeat across tasks
+        raises:
+            ValueError: when the saved Priority or Status names no known value; a missing one defaults
+            to Mild / Incomplete
+        """
+        return cls(
+            id=str(data.get("ID", "")),
+            due=parse_due(data.get("Time")),
+            description=str(data.get("Description", "")),
+            priority=Priority.parse(str(data.get("Priority") or ""), strict=True),
+            tag=sys.intern(str(data.get("Tag", ""))),
+            email=sys.intern(str(data.get("Email") or "")),
+            status=Status.parse(str(data.get("Status") or ""), strict=True),
+        )
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Return the task in the on-disk dictionary shape."""
+        return {
+            "ID": self.id,
+            "Time": self.time,
+            "Description": self.description,
+            "Priority": self.priority.value,
+            "Tag": self.tag,
+            "Email": self.email,
+            "Status": self.status.value,
+        }
+
+    @property
+    def time(self) -> str:
+        """due time as saved in todo-app.json e.g. '2025-10-23 18:00:00'"""
+        return str(self.due) if self.due is not None else ""
+
+    @property
+    def due_epoch(self) -> Optional[int]:
+        """due time as whole seconds since the epoch (local time); None when there is no due time"""
+        return epoch_seconds(self.due) if self.due is not None else None
+
+    def value(self, field: str) -> str:
+        """Return one field as saved in todo-app.json.
+        args:
+            field: saved task key e.g. "Priority"
+        return:
+            str: saved value e.g. "High"
+        """
+        if field == "ID":
+            return self.id
+        if field == "Time":
+            return self.time
+        if field == "Description":
+            return self.description
+        if field == "Priority":
+            return self.priority.value
+        if field == "Tag":
+            return self.tag
+        if field == "Email":
+            return self.email
+        if field == "Status":
+            return self.status.value
+        raise ValueError(f"Unknown task field {field}")
+
+    def with_fields(self, fields: Dict[str, Any]) -> "Task":
+        """Return a copy of the task with saved-shape fields overwritten.
+        args:
+            fields: task fields in the on-disk shape e.g. {"Status": "Complete", "Time": "2025-10-24 09:00:00"}
+        return:
+            Task: updated copy
+        """
+        return Task.from_dict({**self.to_dict(), **fields})
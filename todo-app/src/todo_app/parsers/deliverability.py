@@ -0,0 +1,169 @@
+import json
+import threading
+import time
+from pathlib import Path
+from typing import Callable, Dict, Optional
+from todo_app.config import (
+    EMAIL_DELIVERABILITY, EMAIL_DELIVERABILITY_MODES, EMAIL_DNS_TIMEOUT, EMAIL_MX_CACHE_PATH, EMAIL_MX_CACHE_TTL,
+)
+
+# looks a domain up: True if it accepts email, False if it does not, None if DNS gave no answer (timeout, no
+# resolver); called with the domain and a timeout in seconds
+Resolver = Callable[[str, float], Optional[bool]]
+
+
+def dns_resolver(domain: str, timeout: float) -> Optional[bool]:
+    """Look up the MX records of a domain (or its A/AAAA records when it has none) with email_validator.
+    args:
+        domain: ASCII domain of an email address e.g. gmail.com
+        timeout: seconds before the lookup gives up
+    return:
+        True | False | None: accepts email, does not accept email, unknown
+    """
+    # imported here; dnspython is only loaded when a domain is actually looked up
+    from email_validator import EmailUndeliverableError  # type: ignore
+    from email_validator.deliverability import validate_email_deliverability  # type: ignore
+
+    try:
+        info = validate_email_deliverability(domain, domain, timeout=timeout)  # type: ignore[arg-type]
+    except EmailUndeliverableError as e:
+        # any other resolver failure is reported with this message; it says nothing about the domain
+        if str(e).startswith("There was an error while checking"):
+            return None
+        return False
+    except Exception:
+        return None  # no resolver configured
+    return None if "unknown-deliverability" in info else True
+
+
+class MXCache:
+    """Deliverability answers per domain, kept on disk until they expire.
+
+    The file is read on first use and rewritten when a new answer is stored, so
+    every process on the machine shares the lookups made before it.
+    """
+
+    def __init__(self, path: Path = EMAIL_MX_CACHE_PATH, ttl: int = EMAIL_MX_CACHE_TTL) -> None:
+        self.path = Path(path)
+        self.ttl = ttl
+        self._entries: Optional[Dict[str, Dict[str, object]]] = None  # domain -> {"deliverable": bool, "checked": epoch}
+
+    def _load(self) -> Dict[str, Dict[str, object]]:
+        if self._entries is None:
+            try:
+                with open(self.path, "r", encoding="utf-8") as cache_file:
+                    data = json.load(cache_file)
+            except (OSError, ValueError):
+                data = {}
+            self._entries = data if isinstance(data, dict) else {}
+        return self._entries
+
+    def _fresh(self, entry: Dict[str, object], now: float) -> bool:
+        """whether an answer was looked up less than ttl seconds before now"""
+        try:
+            return float(entry.get("checked", 0)) + self.ttl > now  # type: ignore[arg-type]
+        except (TypeError, ValueError):
+            return False
+
+    def get(self, domain: str, now: float) -> Optional[bool]:
+        """Return the saved answer for a domain, or None if there is none or it has expired."""
+        entry = self._load().get(domain)
+        if not isinstance(entry, dict) or not self._fresh(entry, now):
+            return None
+        return bool(entry.get("deliverable"))
+
+    def put(self, domain: str, deliverable: bool, now: float) -> None:
+        """Save the answer for a domain, dropping expired answers, and rewrite the cache file."""
+        # imported here; the registry pulls in every index module
+        from todo_app.indexes.registry import write_json
+
+        entries = {
+            name: entry for name, entry in self._load().items() if isinstance(entry, dict) and self._fresh(entry, now)
+        }
+        entries[domain] = {"deliverable": deliverable, "checked": now}
+        self._entries = entries
+        try:
+            write_json(self.path, entries)
+        except OSError:
+            pass  # a read-only disk only costs the next process a lookup
+
+
+class DeliverabilityChecker:
+    """Decide whether the domain of an email address accepts email.
+
+    off: no lookup, every domain is accepted
+    cached: the answer of each domain is saved in an MXCache, so a domain is looked up once per TTL no matter
+            how many tasks are assigned to it; a domain DNS cannot answer for is accepted and not saved
+    strict: every check is looked up and a domain DNS cannot answer for is rejected
+    """
+
+    def __init__(
+        self,
+        mode: str = EMAIL_DELIVERABILITY,
+        resolver: Resolver = dns_resolver,
+        cache: Optional[MXCache] = None,
+        timeout: float = EMAIL_DNS_TIMEOUT,
+    ) -> None:
+        mode = mode.strip().lower()
+        if mode not in EMAIL_DELIVERABILITY_MODES:
+            raise ValueError(
+                f"Unknown deliverability mode {mode}. Valid modes are; {', '.join(EMAIL_DELIVERABILITY_MODES)}"
+            )
+        self.mode = mode
+        self.resolver = resolver
+        self.cache = cache if cache is not None else MXCache()
+        self.timeout = timeout
+        self.lookups = 0  # number of resolver calls made
+        self._lock = threading.Lock()
+
+    def _lookup(self, domain: str) -> Optional[bool]:
+        with self._lock:
+            self.lookups += 1
+        return self.resolver(domain, self.timeout)
+
+    def check(self, domain: str) -> bool:
+        """Return whether a domain accepts email under the checker's mode.
+        args:
+            domain: ASCII domain of an email address e.g. gmail.com
+        return:
+            bool: True if an address at the domain may be assigned
+        """
+        if self.mode == "off":
+            return True
+
+        domain = domain.lower()
+        if self.mode == "strict":
+            return self._lookup(domain) is True
+
+        now = time.time()
+        with self._lock:
+            saved = self.cache.get(domain, now)
+        if saved is not None:
+            return saved
+
+        deliverable = self._lookup(domain)
+        if deliverable is None:
+            return True
+        with self._lock:
+            self.cache.put(domain, deliverable, now)
+        return deliverable
+
+
+# the checker used by Validator.valid_email, created on first use
+_CHECKER: Optional[DeliverabilityChecker] = None
+
+
+def get_checker() -> DeliverabilityChecker:
+    """Return the deliverability checker set up from todo_app.config, creating it on first use."""
+    global _CHECKER
+    if _CHECKER is None:
+        _CHECKER = DeliverabilityChecker()
+    return _CHECKER
+
+
+def set_checker(checker: Optional[DeliverabilityChecker]) -> None:
+    """Replace the checker used by Validator.valid_email e.g. with one using a local resolver;
+    None goes back to the checker set up from todo_app.config.
+    """
+    global _CHECKER
+    _CHECKER = checker
@@ -1,9 +1,10 @@
 import re
-from typing import Tuple, Union
+from typing import Any, Dict, Mapping, Optional, Tuple, Union
 from datetime import datetime
 
 from todo_app.utilis.utils import convert_datestring
 
+from todo_app.parsers.lexer import TaskLine, lex_task
 from todo_app.parsers.validator import Validator
 
 # regex pattern to extract date from task description
@@ -42,6 +43,60 @@ class Extractor:
     """Utility class to extract parts from a task description string."""
     validator = Validator()
 
+    @classmethod
+    def extract_fields(
+        cls, task: Union[str, TaskLine], emails: Optional[Mapping[str, Any]] = None
+    ) -> Dict[str, Tuple[bool, Any]]:
+        """Extract every task field from a task line in one scan.
+        args:
+            task: User task line eg buy groceries @shopping #high due:8pm assigned:okeyobinna2001@gmail.com,
+                  or the TaskLine lex_task already made of it
+            emails: Validator.valid_email results by address as typed, e.g. from Validator.valid_emails over many
+                    lines; an assignee found in it is not validated again
+        return:
+            Dict[str, Tuple[bool, Any]]: (True | False, value | error message) per field; description, due, priority,
+            tag and email, with the values and messages of the extract_* methods. The date is taken from the
+            due field only, so a date-like word in the description is never read as the due time.
+        """
+        line = task if isinstance(task, TaskLine) else lex_task(task)
+        fields: Dict[str, Tuple[bool, Any]] = {}
+        for error in line.errors:
+            fields[error.field] = (False, error.message)
+
+        description = line.get("description")
+        if description is not None:
+            fields["description"] = (True, description.text.title())
+
+        due = line.get("due")
+        if due is not None:
+            date_match = DATE_PATTERN.search(due.text)
+            if date_match is None:
+                fields["due"] = (False, "Invalid or No date found in task description.")
+            else:
+                fields["due"] = convert_datestring(date_match.group(1).strip())
+
+        priority = line.get("priority")
+        if priority is not None:
+            task_priority = priority.text.title()
+            status, result = cls.validator.valid_priority_level(task_priority)
+            fields["priority"] = (True, task_priority) if status else (status, result)
+
+        tag = line.get("tag")
+        if tag is not None:
+            levels = [level.strip() for level in tag.text.split("/")]
+            task_tag = "/".join(level for level in levels if level).title()
+            fields["tag"] = (True, task_tag) if task_tag else (False, "Task Tag not found!")
+
+        email = line.get("email")
+        if email is not None:
+            if emails is not None and email.text in emails:
+                mail = emails[email.text]
+            else:
+                mail = cls.validator.valid_email(email.text)
+            fields["email"] = (False, mail) if isinstance(mail, str) else (True, mail.normalized)
+
+        return fields
+
     @staticmethod 
     def extract_task_description(task: str) -> Tuple[bool, str]:
         """Extract task description from task.
@@ -53,6 +108,11 @@ class Extractor:
             err = error message
         """
         task_match = MESSAGE_PATTERN.match(task)
+
+        # no tag marker means the description cannot be located
+        if not task_match:
+            return False, "Task description not Found!"
+
         task = task_match.group(1).strip().title()  # extract clean and normalize task
 
         # check if task if present in task descritption
@@ -95,6 +155,7 @@ class Extractor:
         """Extract task tag from task decsription.
         args:
             task_description: User task descriptin contain a task tag eg #shopping, #religion, #relaxation, #worship etc
+                              or a hierarchical tag eg @work/release/q3#
         return:
             tag: task tag eg WORSHIP, SCHOOL etc
             err: error message
@@ -107,7 +168,12 @@ class Extractor:
         if not tag_matches:
             return False, "Task Tag not found!"
         
-        tag = tag_matches.group(1).strip().title()
+        # hierarchical tags e.g. @work / release#; empty levels and spaces around / are dropped
+        levels = [level.strip() for level in tag_matches.group(1).split("/")]
+        tag = "/".join(level for level in levels if level).title()
+
+        if not tag:
+            return False, "Task Tag not found!"
 
         # return extracted tag
         return True, tag
@@ -0,0 +1,166 @@
+import re
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional
+
+# field names of a task line, in the order the add command reports their errors
+TASK_LINE_FIELDS = ("description", "due", "priority", "tag", "email")
+
+# error messages shared with the Extractor methods
+DESCRIPTION_NOT_FOUND = "Task description not Found!"
+DATE_NOT_FOUND = "Invalid or No date found in task description."
+PRIORITY_NOT_FOUND = "Task Priority level not found!"
+TAG_NOT_FOUND = "Task Tag not found!"
+EMAIL_NOT_FOUND = "Email not found."
+
+# a priority level e.g. #high; the first # followed by a word after the tag
+PRIORITY_TOKEN = re.compile(r"#(\w+)")
+
+# the keywords that open the due and assignee fields e.g. due:8pm, due 8pm, assigned:mark20@gmail.com
+KEYWORD_TOKEN = re.compile(r"\b(?:(due)\b:?|(assigned):)", re.IGNORECASE)
+
+# an assignee runs up to the next whitespace
+EMAIL_VALUE = re.compile(r"[^\s]+")
+
+
+@dataclass(frozen=True)
+class Token:
+    """A field found in a task line.
+
+    text: the field as typed, without its marker e.g. 'shopping' for @shopping#
+    start: offset of text in the task line
+    """
+    text: str
+    start: int
+
+    @property
+    def end(self) -> int:
+        return self.start + len(self.text)
+
+
+@dataclass(frozen=True)
+class LexError:
+    """A field missing from a task line and the offset it was expected at."""
+    field: str
+    message: str
+    position: int
+
+
+@dataclass
+class TaskLine:
+    """The fields of one task line, as found by lex_task.
+
+    tokens: the fields found, by name; the due token is the whole due segment e.g. '8pm' of due:8pm
+    errors: the fields that are missing, in the order the add command reports them
+    """
+    text: str
+    tokens: Dict[str, Token] = field(default_factory=dict)
+    errors: List[LexError] = field(default_factory=list)
+
+    def get(self, name: str) -> Optional[Token]:
+        """Return the token of a field, or None if it is missing."""
+        return self.tokens.get(name)
+
+    def error(self, name: str) -> Optional[LexError]:
+        """Return the error of a missing field, or None if it was found."""
+        for error in self.errors:
+            if error.field == name:
+                return error
+        return None
+
+    def position(self, name: str) -> int:
+        """Return the offset of a field in the task line, or where it was expected if it is missing."""
+        token = self.tokens.get(name)
+        if token is not None:
+            return token.start
+        error = self.error(name)
+        return error.position if error is not None else len(self.text)
+
+
+def _strip(text: str, start: int, stop: int) -> Token:
+    """token of text[start:stop] without surrounding whitespace"""
+    value = text[start:stop]
+    stripped = value.lstrip()
+    start += len(value) - len(stripped)
+    return Token(stripped.rstrip(), start)
+
+
+def lex_task(text: str) -> TaskLine:
+    """Split a task line into its fields in one left to right scan.
+        The grammar is 'description @tag #priority due:<time> assigned:<email>': the description runs up to
+        the first @, the tag up to the next #, the priority is the first #word after the tag, and the due time
+        runs up to assigned: or the end of the line. Each part of the line is looked at once, where the
+        Extractor methods search the whole line again for every field.
+    args:
+        text: task line e.g. buy groceries @shopping #high due:8pm assigned:okeyobinna2001@gmail.com
+    return:
+        TaskLine: the fields found, with their offsets, and an error with the expected offset for each missing field
+    """
+    line = TaskLine(text)
+    tokens, errors = line.tokens, line.errors
+
+    # description: everything before the first @
+    at = text.find("@")
+    if at == -1:
+        errors.append(LexError("description", DESCRIPTION_NOT_FOUND, 0))
+    else:
+        description = _strip(text, 0, at)
+        if description.text:
+            tokens["description"] = description
+        else:
+            errors.append(LexError("description", DESCRIPTION_NOT_FOUND, description.start))
+
+    # tag: from the @ up to the next #
+    position = 0
+    tag_error: Optional[LexError] = None
+    if at == -1:
+        tag_error = LexError("tag", TAG_NOT_FOUND, len(text))
+    else:
+        hash_mark = text.find("#", at + 1)
+        if hash_mark == -1:
+            tag_error = LexError("tag", TAG_NOT_FOUND, at + 1)
+            position = at + 1
+        else:
+            tag = _strip(text, at + 1, hash_mark)
+            if tag.text:
+                tokens["tag"] = tag
+            else:
+                tag_error = LexError("tag", TAG_NOT_FOUND, at + 1)
+            position = hash_mark
+
+    # the due and assignee fields start at their keywords, wherever they are after the tag
+    keywords = list(KEYWORD_TOKEN.finditer(text, position))
+    due_keyword = next((match for match in keywords if match.group(1)), None)
+
+    # priority: the first #word between the tag and the due keyword
+    priority_stop = due_keyword.start() if due_keyword is not None else position
+    priority = PRIORITY_TOKEN.search(text, position, priority_stop)
+    if priority is not None:
+        tokens["priority"] = Token(priority.group(1), priority.start(1))
+
+    # due: from the keyword up to the next keyword or the end of the line
+    if due_keyword is not None:
+        following = [match.start() for match in keywords if match.start() > due_keyword.start()]
+        due = _strip(text, due_keyword.end(), following[0] if following else len(text))
+        if due.text:
+            tokens["due"] = due
+        else:
+            errors.append(LexError("due", DATE_NOT_FOUND, due.start))
+    else:
+        errors.append(LexError("due", DATE_NOT_FOUND, len(text)))
+
+    if priority is None:
+        errors.append(LexError("priority", PRIORITY_NOT_FOUND, priority_stop))
+    if tag_error is not None:
+        errors.append(tag_error)
+
+    # assignee: the first assigned: keyword, up to the next whitespace
+    assigned = next((match for match in keywords if match.group(2)), None)
+    email = EMAIL_VALUE.match(text, assigned.end()) if assigned is not None else None
+    if email is not None:
+        tokens["email"] = Token(email.group(), email.start())
+    else:
+        errors.append(LexError("email", EMAIL_NOT_FOUND, assigned.end() if assigned is not None else len(text)))
+
+    # report errors in field order, as the add command checks them
+    errors.sort(key=lambda error: TASK_LINE_FIELDS.index(error.field))
+    return line
@@ -1,24 +1,84 @@
 import re
-from email_validator import validate_email, EmailNotValidError, ValidatedEmail # type: ignore
-from typing import Union, Tuple
+from typing import TYPE_CHECKING, Dict, Iterable, List, Union, Tuple
+from todo_app.config import EMAIL_LOOKUP_WORKERS
+
+if TYPE_CHECKING:
+    from email_validator import ValidatedEmail # type: ignore
 
 class Validator:
     """A class to validate different components of a todo task."""
 
     @staticmethod
-    def valid_email(email_address: str) -> Union[ValidatedEmail, str]:
+    def _parse_email(email_address: str) -> Union["ValidatedEmail", str]:
+        """check the syntax of an email address only; no lookup"""
+        # imported here; only commands given an email pay for loading email_validator
+        from email_validator import validate_email, EmailNotValidError # type: ignore
+
+        try:
+            return validate_email(email_address, check_deliverability=False)
+        except EmailNotValidError:
+            return "Invalid Email address"
+
+    @classmethod
+    def valid_email(cls, email_address: str) -> Union["ValidatedEmail", str]:
         """check is an email address is valid.
+            The syntax is checked locally; whether the domain accepts email is decided by the
+            deliverability checker (see todo_app.parsers.deliverability), which may not look it up at all.
         args:
             email_address: a potential email address in string format
         return:
             email: a valid email address in ValidatedEmail datatype
             err: error message
         """
-        try:
-            email = validate_email(email_address, check_deliverability=True)
+        from todo_app.parsers.deliverability import get_checker
+
+        email = cls._parse_email(email_address)
+        if isinstance(email, str):
             return email
-        except EmailNotValidError:
+
+        if not get_checker().check(email.ascii_domain):
             return "Invalid Email address"
+        return email
+
+    @classmethod
+    def valid_emails(
+        cls, email_addresses: Iterable[str], workers: int = EMAIL_LOOKUP_WORKERS
+    ) -> List[Union["ValidatedEmail", str]]:
+        """check many email addresses at once, e.g. the assignees of an import.
+            Each distinct address is checked once and its syntax locally; the distinct domains of the valid
+            ones are then checked for deliverability together, in up to workers threads, so the time spent
+            waiting on DNS follows the number of domains rather than the number of addresses.
+        args:
+            email_addresses: potential email addresses in string format
+            workers: largest number of domains looked up at the same time; 1 looks them up one after another
+        return:
+            List[ValidatedEmail | str]: the valid_email result of every address, in input order
+        """
+        from todo_app.parsers.deliverability import get_checker
+
+        email_addresses = list(email_addresses)
+        parsed: Dict[str, Union["ValidatedEmail", str]] = {
+            address: cls._parse_email(address) for address in dict.fromkeys(email_addresses)
+        }
+        domains = list(dict.fromkeys(email.ascii_domain for email in parsed.values() if not isinstance(email, str)))
+
+        checker = get_checker()
+        if workers > 1 and len(domains) > 1:
+            # imported here; only batches with several domains start threads
+            from concurrent.futures import ThreadPoolExecutor
+
+            with ThreadPoolExecutor(max_workers=min(workers, len(domains))) as executor:
+                deliverable = dict(zip(domains, executor.map(checker.check, domains)))
+        else:
+            deliverable = {domain: checker.check(domain) for domain in domains}
+
+        results: Dict[str, Union["ValidatedEmail", str]] = {}
+        for address, email in parsed.items():
+            if isinstance(email, str) or deliverable[email.ascii_domain]:
+                results[address] = email
+            else:
+                results[address] = "Invalid Email address"
+        return [results[address] for address in email_addresses]
     
     @staticmethod
     def valid_priority_level(priority: str) -> Tuple[bool, str]:
@@ -1,32 +1,90 @@
-import json
 import re
-from typing import Union, Tuple, List, Any, Dict
+from typing import Union, Tuple, List, Any, Dict, Optional, Iterator, Sequence
 from todo_app.parsers.validator import Validator
 from todo_app.parsers.extractor import Extractor
 from todo_app.utilis.utils import convert_datestring
-from todo_app.config import JSON_DB_PATH
+from todo_app.services.storage_backend import StorageBackend, get_storage_backend
+from todo_app.models.task import Priority, Status, Task
+from todo_app.indexes.registry import IndexRegistry, get_index_registry
+from todo_app.services.query_cache import QueryCache, get_query_cache
+from todo_app.services.views import ViewIndex, views_path
 
 # extract everything in a string except the first 8 values
 UPDATE_PATTERN = re.compile(r"^.{8}\s+(.+)")
 
+# update field names accepted by apply_updates mapped to the saved task key
+UPDATE_FIELDS = {
+    "description": "Description",
+    "time": "Time",
+    "email": "Email",
+    "priority": "Priority",
+    "status": "Status",
+}
+
 class DatabaseService:
     """A class to handle database operations for the todo app."""
-    def __init__(self):
+    def __init__(self, backend: Optional[StorageBackend] = None):
         self.validator = Validator()
         self.extractor = Extractor()
+        # storage engine selected in todo_app.config unless one is given
+        self.backend = backend if backend is not None else get_storage_backend()
+        # search indexes kept current by every change made through this service
+        self.indexes: IndexRegistry = get_index_registry(self.backend)
+        # saved views are kept current with the other indexes; their definitions live beside the store
+        if ViewIndex.name not in self.indexes:
+            self.indexes.register(ViewIndex(views_path(self.backend.path)))
+        # query results served until the store changes; saved beside the index sidecars for later commands
+        self.query_cache: QueryCache = get_query_cache(self.backend, self.indexes.directory)
     
     def read_json(self) -> list:
-        """Access todo-app.json"""
-        try:
-            with open(JSON_DB_PATH, "r") as json_file:
-                return json.load(json_file)
-        except (FileNotFoundError, json.JSONDecodeError):
-            return []
+        """Access every saved task through the storage backend as task dictionaries"""
+        return [task.to_dict() for task in self.backend.load_all()]
         
     def _save_json(self, data: List[Dict[str, Any]]) -> None:
-        """save todo-app.json after every update"""
-        with open(JSON_DB_PATH, "w", encoding="utf-8") as json_file:
-            json.dump(data, json_file, indent=4, ensure_ascii=False)
+        """replace every saved task through the storage backend"""
+        self.backend.save_all([Task.from_dict(task) for task in data])
+        self.indexes.reset()
+        self.query_cache.bump()
+
+    def _insert_tasks(self, tasks: List[Task]) -> None:
+        """save new tasks and add them to the indexes"""
+        self.indexes.prepare_write()
+        self.backend.insert_tasks(tasks)
+        self.indexes.apply(added=tasks)
+        self.query_cache.bump()
+
+    def _update_tasks(self, changes: Dict[str, Dict[str, Any]]) -> List[str]:
+        """save field changes and re-index the updated tasks; returns the updated IDs"""
+        self.indexes.prepare_write()
+        old_tasks = self.backend.get_tasks(changes)
+        updated = self.backend.update_tasks(changes)
+
+        updated_ids = set(updated)
+        self.indexes.apply(
+            added=self.backend.get_tasks(updated),
+            removed=[task for task in old_tasks if task.id in updated_ids],
+        )
+        self.query_cache.bump()
+        return updated
+
+    def _delete_tasks(self, task_ids: List[str]) -> List[str]:
+        """delete tasks and drop them from the indexes; returns the deleted IDs"""
+        self.indexes.prepare_write()
+        old_tasks = self.backend.get_tasks(task_ids)
+        deleted = self.backend.delete_tasks(task_ids)
+
+        deleted_ids = set(deleted)
+        self.indexes.apply(removed=[task for task in old_tasks if task.id in deleted_ids])
+        self.query_cache.bump()
+        return deleted
+
+    def cache_stats(self) -> Dict[str, int]:
+        """Return the storage backend read cache counters e.g. {"hits": 12, "misses": 1}"""
+        return self.backend.cache_stats()
+
+    def query_cache_stats(self) -> Dict[str, float]:
+        """Return the query result cache counters e.g. {"hits": 9, "misses": 1, "hit_rate": 0.9, ...}"""
+        return self.query_cache.stats()
 
     def _validate_taskid(self, task_id: str) -> Tuple[bool, str]:
         """check if a task id is valid.
@@ -35,41 +93,109 @@ class DatabaseService:
             return: 
                 (True | False,  success message | error message)
         """
-        # read todo-app.json
-        json_tasks = self.read_json()
-
-        # extract all the task ID into a list
-        task_ids = [task.get("ID") for task in json_tasks]
-
-        if task_id in task_ids:
+        # look up the task id in the storage backend
+        if self.backend.get_task(task_id) is not None:
             return True, "Task ID is valid"
     
         return False, f"Invalid Task ID. {task_id} does not exist!"
 
-    def upload_task(self, data: dict) -> Tuple[bool, str, List[Any]]:
+    def _validate_field(self, field: str, value: str) -> Tuple[bool, str]:
+        """validate and normalize a new value for a task field.
+            args:
+                field: saved task key; Description, Time, Email, Priority or Status
+                value: new field value from user input. E.g 'tomorrow', 'high'
+            return:
+                (True | False,  normalized value | error message)
+        """
+        value = (value or "").strip()
+
+        if field == "Description":
+            if not value:
+                return False, "No description given."
+            return True, value.title()
+
+        if field == "Time":
+            if not value:
+                return False, "No value for time or date."
+            status, result = convert_datestring(value)
+            if not status:
+                assert isinstance(result, str)
+                return status, result
+            return True, str(result)
+
+        if field == "Email":
+            if not value:
+                return False, "No value for Email address."
+            valid_mail = self.validator.valid_email(value)
+            if isinstance(valid_mail, str):
+                return False, valid_mail
+            return True, valid_mail.normalized
+
+        if field == "Priority":
+            if not value:
+                return False, "Priority Level is empty."
+            status, result = self.validator.valid_priority_level(value)
+            return (True, Priority.parse(value).value) if status else (status, result)
+
+        if field == "Status":
+            if not value:
+                return False, "No value for Status."
+            status, result = self.validator.valid_status(value)
+            return (True, Status.parse(value).value) if status else (status, result)
+
+        return False, f"Invalid task field {field}. Valid fields are; description, time, email, priority and status"
+
+    def upload_task(self, data: Union[Dict[str, Any], Task]) -> Tuple[bool, str, List[Any]]:
         """Save a task to todo-app.json.
             args:
-                data: dictionary containing user task
+                data: Task or dictionary containing user task
             return: 
                 (True | False, success message | error message, list of uploaded task | empty list)
         """
-        todo_records = self.read_json()
-        
+        task = data if isinstance(data, Task) else Task.from_dict(data)
+
         # duplicate check
-        if any(task['Description'] == data['Description'] for task in todo_records):
-            return True, f"Task Description - {data['Description']} already exist", []
-        
-        todo_records.append(data)
+        if self.backend.has_description(task.description):
+            return True, f"Task Description - {task.description} already exist", []
         
         try:
-            with open(JSON_DB_PATH, "w") as db:
-                json.dump(todo_records, db, indent=4)
+            self._insert_tasks([task])
 
-            return True, "Task added", [data]
+            return True, "Task added", [task.to_dict()]
     
         except Exception as e:
             return False, str(e), []
         
+    def upload_tasks(self, tasks: Sequence[Union[Dict[str, Any], Task]]) -> Tuple[bool, str, List[Any]]:
+        """Save several tasks with a single write. Tasks whose description already exists are skipped.
+            args:
+                tasks: list of Tasks or dictionaries containing user tasks
+            return: 
+                (True | False, success message | error message, list of uploaded tasks | empty list)
+        """
+        new_tasks: List[Task] = []
+        descriptions = set()
+
+        # duplicate check against saved tasks and the rest of the batch
+        for data in tasks:
+            task = data if isinstance(data, Task) else Task.from_dict(data)
+            description = task.description
+            if description in descriptions or self.backend.has_description(description):
+                continue
+            descriptions.add(description)
+            new_tasks.append(task)
+
+        if not new_tasks:
+            return True, "No new task to add", []
+
+        try:
+            self._insert_tasks(new_tasks)
+
+            return True, f"{len(new_tasks)} task(s) added", [task.to_dict() for task in new_tasks]
+
+        except Exception as e:
+            return False, str(e), []
+        
     def delete_all_tasks(self) -> Tuple[bool, str]:
         """Delete one or more tasks based on task ID.
             args:
@@ -78,17 +204,13 @@ class DatabaseService:
                 (bool, list | str):
                     - (True | False,  success message | warning message)
         """
-        todo_records = self.read_json()
-
-        if not todo_records:
-            return False, "No record found - Mermory is Empty"
-
         # delete all records
-        task_count = len(todo_records)
-        todo_records.clear()
+        task_count = self.backend.clear()
+        self.indexes.reset()
+        self.query_cache.bump()
 
-        # update the cleared todo-app.json
-        self._save_json(todo_records)
+        if not task_count:
+            return False, "No record found - Mermory is Empty"
 
         # return status message
         return True, f"Delete successful - all {task_count} task(s) cleared"        
@@ -102,32 +224,15 @@ class DatabaseService:
                 (bool, list | str):
                     - (True | False,  success message | error message)
         """
-        todo_records = self.read_json()
-
-        if not todo_records:
+        if not self.backend.count():
             return True, "No record found - Mermory is Empty"
 
-        deleted_task: List[Union[str, int]] = []
-        not_found_task: List[Union[str, int]] = []
-
-        # delete record based task id
-        for id in index:
-            status, _ = self._validate_taskid(id)
-
-            if status:
-                # Find the task with matching ID
-                task_to_remove = next(
-                    (task for task in todo_records if task.get("ID") == id), None
-                )
-                if task_to_remove:
-                    todo_records.remove(task_to_remove)
-                    deleted_task.append(id)
-                else:
-                    not_found_task.append(id)
-            else:
-                not_found_task.append(id)
+        # delete every matching task id in a single backend call
+        deleted_task: List[str] = self._delete_tasks(index)
 
-        self._save_json(todo_records)
+        # track task id that were not found
+        deleted = set(deleted_task)
+        not_found_task: List[str] = [id for id in index if id not in deleted]
 
         if deleted_task and not_found_task:
             return True, (
@@ -156,6 +261,15 @@ class DatabaseService:
         return True, "", todo_records
 
 
+    def iter_tasks(self) -> Iterator[Task]:
+        """Stream every saved task one at a time in insertion order.
+               args:
+                   None
+               return:
+                    Iterator[Task]: generator of tasks
+        """
+        yield from self.backend.iter_tasks()
+
     def display_tasks(
         self, index: List[str],
     ) -> Tuple[bool, str, List[Any]]:
@@ -166,11 +280,8 @@ class DatabaseService:
                     (bool, str, List[Any]):
                         - (True | False,  success message | error message, List of tasks | empty list)
         """
-        # read todo-app.json
-        todo_records = self.read_json()
-
-        # check if todo_records is empty
-        if not todo_records:
+        # check if the store is empty
+        if not self.backend.count():
             return True, "No record found - Memory is Empty", []
 
         # initialize list to store extracted task and track task not found
@@ -179,21 +290,14 @@ class DatabaseService:
 
         # Handle task id based index
         for id in index:
-            status, _ = self._validate_taskid(id)
-            if status:
-                # Find the task with matching ID
-                task_ = next(
-                    (task for task in todo_records if task.get("ID") == id), None)
-
-                if task_:
-                    to_display.append(task_)
-                else:
-                    not_found.append(id)
+            # Find the task with matching ID
+            task_ = self.backend.get_task(id)
+
+            if task_:
+                to_display.append(task_.to_dict())
             else:
                 not_found.append(id)
 
-        self._save_json(todo_records)
-
         if to_display and not_found:
             return True, f"Found {len(to_display)} task(s), but {' '.join(not_found)} not found.", to_display
     
@@ -229,18 +333,11 @@ class DatabaseService:
         if not description_match:
             return False, "No description given."     
 
-        description = description_match.group(1).strip().title()
-
-        # open todo-app.json to update decription
-        todo_records = self.read_json()
+        # normalize description
+        _, description = self._validate_field("Description", description_match.group(1))
 
         # update description of task with task_id
-        for task in todo_records:
-            if task_id == task.get("ID"):
-                task["Description"] = description
-
-        # save update
-        self._save_json(todo_records)
+        self._update_tasks({task_id: {"Description": description}})
 
         # return success message
         return True, f"{task_id} description update successful."
@@ -271,28 +368,15 @@ class DatabaseService:
         if not time_match:
             return False, "No value for time or date."
         
-        time_string = time_match.group(1).strip()
-
-        # convert time string to datetime object
-        status, result = convert_datestring(time_string)  # convert time string to datetime object
+        # convert time string to a datetime string
+        status, task_time = self._validate_field("Time", time_match.group(1))
 
         # conversion fail
         if not status:
-            return status, result
-    
-        # create a task_time variable if conversion is successful
-        task_time: str = str(result)
-
-        # open todo-app.json to update decription
-        todo_records = self.read_json()
+            return status, task_time
 
         # update time of task with task_id
-        for task in todo_records:
-            if task_id == task.get("ID"):
-                task["Time"] = task_time
-
-        # save update
-        self._save_json(todo_records)
+        self._update_tasks({task_id: {"Time": task_time}})
 
         # return success message
         return True, f"{task_id} time update successful."
@@ -323,26 +407,14 @@ class DatabaseService:
         if not email_match:
             return False, "No value for Email address."  
               
-        mail_extract = email_match.group(1).strip()
-
         # check if email is valid
-        valid_mail = self.validator.valid_email(mail_extract)
+        status, email = self._validate_field("Email", email_match.group(1))
 
-        if isinstance(valid_mail, str):
-            return False, valid_mail   # if email address is not valid
-
-        email = valid_mail.normalized  # convert valid_mail to str
-
-        # open todo-app.json to update decription
-        todo_records = self.read_json()
+        if not status:
+            return False, email   # if email address is not valid
 
         # update email of task with task_id
-        for task in todo_records:
-            if task_id == task.get("ID"):
-                task["Email"] = email
-
-        # save update
-        self._save_json(todo_records)
+        self._update_tasks({task_id: {"Email": email}})
 
         # return success message
         return True, f"{task_id} Email update successful"
@@ -372,25 +444,15 @@ class DatabaseService:
         if not priority_match:
             return False, "Priority Level is empty."
 
-        priority = priority_match.group(1).strip().title()
-
         # check if priority is valid
-        status, result = self.validator.valid_priority_level(priority)
+        status, priority = self._validate_field("Priority", priority_match.group(1))
 
         # if priority is invalid
         if not status:
-            return status, result
-
-        # open todo-app.json to update decription
-        todo_records = self.read_json()
-
-        # update description of task with task_id
-        for task in todo_records:
-            if task_id == task.get("ID"):
-                task["Priority"] = priority
+            return status, priority
 
-        # save update
-        self._save_json(todo_records)
+        # update priority of task with task_id
+        self._update_tasks({task_id: {"Priority": priority}})
 
         # return success message
         return True, f"{task_id} Priority Level update successful"
@@ -421,25 +483,93 @@ class DatabaseService:
         if not status_match:
             return False, "No value for Status."   
 
-        task_status = status_match.group(1).strip().title()
-
         # check if status is valid
-        status, result = self.validator.valid_status(task_status)
+        status, task_status = self._validate_field("Status", status_match.group(1))
 
         # if status is invalid
         if not status:
-            return status, result
-
-        # open todo-app.json to update status
-        todo_records = self.read_json()
+            return status, task_status
 
         # update status of task with task_id
-        for task in todo_records:
-            if task_id == task.get("ID"):
-                task["Status"] = task_status
-
-        # save update
-        self._save_json(todo_records)
+        self._update_tasks({task_id: {"Status": task_status}})
 
         # return success message
         return True, f"{task_id} Task Status update successful"
+
+
+    def apply_updates(self, changes: List[Tuple[str, Dict[str, str]]]) -> Tuple[bool, str]:
+        """To update several fields of several tasks with a single write.
+            All changes are validated first; nothing is saved if any of them is invalid.
+            args:
+                changes: List of (task id, {field: new value}) where field is description, time, email,
+                         priority or status. E.g [('7d588667', {'priority': 'high', 'status': 'complete'})]
+            return:
+                (bool, str):
+                    - (True | False,  success message | error message)
+        """
+        if not changes:
+            return False, "No update given."
+
+        errors: List[str] = []
+        updates: Dict[str, Dict[str, Any]] = {}
+
+        # the same value is often applied to many tasks; validate each distinct value once
+        validated: Dict[Tuple[str, str], Tuple[bool, str]] = {}
+
+        # new assignees are validated together so their domains are looked up concurrently
+        addresses = [
+            value for _, fields in changes for name, value in (fields or {}).items()
+            if UPDATE_FIELDS.get(name.strip().lower(), name) == "Email" and (value or "").strip()
+        ]
+        for address, mail in zip(addresses, self.validator.valid_emails(address.strip() for address in addresses)):
+            validated[("Email", address)] = (False, mail) if isinstance(mail, str) else (True, mail.normalized)
+
+        for task_id, fields in changes:
+            # validate task id
+            status, result = self._validate_taskid(task_id)
+            if not status:
+                errors.append(result)
+                continue
+
+            if not fields:
+                errors.append(f"No update value given for {task_id}.")
+                continue
+
+            for name, value in fields.items():
+                field = UPDATE_FIELDS.get(name.strip().lower(), name)
+                key = (field, value)
+                if key not in validated:
+                    validated[key] = self._validate_field(field, value)
+
+                status, result = validated[key]
+                if not status:
+                    errors.append(f"{task_id}: {result}")
+                    continue
+
+                updates.setdefault(task_id, {})[field] = result
+
+        if errors:
+            return False, " ".join(dict.fromkeys(errors))
+
+        # save every update in one write
+        updated = self._update_tasks(updates)
+
+        # return success message
+        return True, f"Updated {len(updated)} task(s) successfully."
+
+
+class LazyDatabaseService:
+    """Class attribute that builds the default DatabaseService on first use.
+
+    Building one opens the configured store and its index registry, so a command that
+    never reaches the tasks, or a subclass that sets its own db_service, never pays for
+    it. The built service replaces this attribute on the owning class.
+    """
+
+    def __set_name__(self, owner: type, name: str) -> None:
+        self.owner, self.name = owner, name
+
+    def __get__(self, instance: Any, owner: Optional[type] = None) -> DatabaseService:
+        service = DatabaseService()
+        setattr(self.owner, self.name, service)
+        return service
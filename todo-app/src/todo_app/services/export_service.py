@@ -0,0 +1,59 @@
+import csv
+import json
+from typing import Any, Dict, Iterable, TextIO
+from todo_app.services.storage_backend import TASK_FIELDS
+
+# supported export file formats
+EXPORT_FORMATS = ("jsonl", "csv")
+
+
+def write_jsonl(tasks: Iterable[Dict[str, Any]], stream: TextIO) -> int:
+    """Write tasks as one compact JSON object per line.
+    args:
+        tasks: iterable (e.g. generator) of tasks
+        stream: open text file or standard output
+    return:
+        int: number of tasks written
+    """
+    count = 0
+    for task in tasks:
+        stream.write(json.dumps(task, ensure_ascii=False, separators=(",", ":")))
+        stream.write("\n")
+        count += 1
+    return count
+
+
+def write_csv(tasks: Iterable[Dict[str, Any]], stream: TextIO) -> int:
+    """Write tasks as CSV rows under an ID,Time,Description,Priority,Tag,Email,Status header.
+    args:
+        tasks: iterable (e.g. generator) of tasks
+        stream: open text file (opened with newline="") or standard output
+    return:
+        int: number of tasks written
+    """
+    writer = csv.DictWriter(stream, fieldnames=TASK_FIELDS, extrasaction="ignore")
+    writer.writeheader()
+
+    count = 0
+    for task in tasks:
+        writer.writerow(task)
+        count += 1
+    return count
+
+
+def export_tasks(tasks: Iterable[Dict[str, Any]], stream: TextIO, file_format: str = "jsonl") -> int:
+    """Write tasks to stream one record at a time in the given format.
+    args:
+        tasks: iterable (e.g. generator) of tasks
+        stream: open text file or standard output
+        file_format: jsonl or csv
+    return:
+        int: number of tasks written
+    """
+    if file_format == "csv":
+        return write_csv(tasks, stream)
+
+    if file_format == "jsonl":
+        return write_jsonl(tasks, stream)
+
+    raise ValueError(f"Invalid export format {file_format}. Valid formats are; {', '.join(EXPORT_FORMATS)}")
@@ -0,0 +1,83 @@
+import csv
+import json
+from typing import Any, Dict, Iterator, TextIO, Tuple
+
+# supported bulk import file formats
+IMPORT_FORMATS = ("text", "csv", "jsonl")
+
+
+def guess_import_format(file_name: str) -> str:
+    """Guess the import format from a file name.
+    args:
+        file_name: name or path of the import file
+    return:
+        str: csv, jsonl or text
+    """
+    name = file_name.lower()
+    if name.endswith(".csv"):
+        return "csv"
+    if name.endswith((".jsonl", ".ndjson")):
+        return "jsonl"
+    return "text"
+
+
+def task_line_from_row(row: Dict[str, Any]) -> str:
+    """Build a task line in the add command format from a CSV row or JSONL object.
+    args:
+        row: either {"task": "buy groceries @shopping #high due:8pm"} or the separate
+             description, tag, priority, due and (optional) assigned/email values
+    return:
+        str: task line e.g. buy groceries @shopping #high due:8pm assigned:johndoe34@gmail.com
+    """
+    values = {str(key).strip().lower(): "" if value is None else str(value).strip() for key, value in row.items()}
+
+    if values.get("task"):
+        return values["task"]
+
+    task_line = (
+        f"{values.get('description', '')} @{values.get('tag', '')} "
+        f"#{values.get('priority', '')} due:{values.get('due', '')}"
+    )
+    email = values.get("assigned") or values.get("email")
+    if email:
+        task_line += f" assigned:{email}"
+    return task_line
+
+
+def iter_task_lines(stream: TextIO, file_format: str = "text") -> Iterator[Tuple[int, str, str]]:
+    """Stream task lines out of an import file one at a time.
+    args:
+        stream: open text file or standard input
+        file_format: text (one task line per line), csv (header row) or jsonl (one object per line)
+    return:
+        Iterator of (line number, task line, error message); the error message is empty for a valid line
+    """
+    if file_format == "csv":
+        reader = csv.DictReader(stream)
+        for row in reader:
+            if not any((value or "").strip() for value in row.values() if isinstance(value, str)):
+                continue  # skip empty row
+            yield reader.line_num, task_line_from_row(row), ""
+        return
+
+    for line_number, line in enumerate(stream, start=1):
+        line = line.strip()
+        if not line:
+            continue
+
+        if file_format != "jsonl":
+            yield line_number, line, ""
+            continue
+
+        try:
+            row = json.loads(line)
+        except json.JSONDecodeError as e:
+            yield line_number, "", f"Invalid JSON - {e.msg}"
+            continue
+
+        if isinstance(row, str):
+            yield line_number, row, ""
+        elif isinstance(row, dict):
+            yield line_number, task_line_from_row(row), ""
+        else:
+            yield line_number, "", "Expected a JSON object or string"
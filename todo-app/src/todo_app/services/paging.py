@@ -0,0 +1,92 @@
+import heapq
+from dataclasses import dataclass
+from itertools import dropwhile, islice
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
+from todo_app.models.task import Task
+
+# sort orders accepted by --sort; every order breaks ties by due time and then by task ID
+SORT_FIELDS = ("time", "priority", "status")
+
+SortKey = Tuple[Any, ...]
+
+
+def due_key(task: Task) -> SortKey:
+    """sort key of the time order: earliest due first, tasks without a due time last.
+    Matches the order of the due index, which keys tasks by (due epoch seconds, ID).
+    """
+    if task.due is None:
+        return (1, 0, task.id)
+    return (0, task.due_epoch, task.id)
+
+
+SORT_KEYS: Dict[str, Callable[[Task], SortKey]] = {
+    "time": due_key,
+    "priority": lambda task: (task.priority.rank, *due_key(task)),
+    "status": lambda task: (task.status.rank, *due_key(task)),
+}
+
+
+@dataclass(frozen=True)
+class Page:
+    """Which slice of a result to show.
+
+    sort: one of SORT_FIELDS; empty keeps insertion order
+    limit: largest number of tasks to return; None returns every task
+    offset: number of tasks to skip after the cursor
+    after: task ID cursor; only tasks ordered after this task are returned
+    """
+    sort: str = ""
+    limit: Optional[int] = None
+    offset: int = 0
+    after: str = ""
+
+
+def make_page(sort: str = "", limit: Optional[int] = None, offset: int = 0, after: str = "") -> Tuple[bool, str, Page]:
+    """Validate the paging options of the display, search and list commands.
+    args:
+        sort: time, priority, status or empty for insertion order
+        limit: largest number of tasks to show
+        offset: number of tasks to skip
+        after: ID of the last task of the previous page
+    return:
+        (True | False, empty string | error message, Page)
+    """
+    sort = (sort or "").strip().lower()
+    if sort and sort not in SORT_FIELDS:
+        return False, f"Invalid sort field {sort}. Valid fields are; {', '.join(SORT_FIELDS)}", Page()
+    if limit is not None and limit < 1:
+        return False, f"Invalid limit {limit}; it must be at least 1.", Page()
+    if offset < 0:
+        return False, f"Invalid offset {offset}; it must not be negative.", Page()
+    return True, "", Page(sort, limit, offset, (after or "").strip())
+
+
+def paginate(tasks: Iterable[Task], page: Page, after: Optional[Task] = None) -> List[Task]:
+    """Sort and slice a stream of tasks without materializing more of it than the page needs.
+        In insertion order the stream is read only up to the end of the page. Sorted pages
+        with a limit keep a heap of offset + limit tasks, so memory stays bounded however many
+        tasks match.
+    args:
+        tasks: iterable (e.g. generator) of matching tasks in insertion order
+        page: sort and slice to apply
+        after: the cursor task named by page.after, if any
+    return:
+        List[Task]: tasks of the page
+    """
+    stop = None if page.limit is None else page.offset + page.limit
+
+    if not page.sort:
+        if after is not None:
+            # skip up to and including the cursor task
+            tasks = dropwhile(lambda task: task.id != after.id, tasks)
+            next(tasks, None)
+        return list(islice(tasks, page.offset, stop))
+
+    key = SORT_KEYS[page.sort]
+    if after is not None:
+        cursor = key(after)
+        tasks = (task for task in tasks if key(task) > cursor)
+
+    if stop is None:
+        return sorted(tasks, key=key)[page.offset:]
+    return heapq.nsmallest(stop, tasks, key=key)[page.offset:]
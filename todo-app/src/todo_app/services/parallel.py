@@ -0,0 +1,131 @@
+import atexit
+import threading
+from pathlib import Path
+from typing import TYPE_CHECKING, Dict, List, Optional, Tuple, Type
+from todo_app.config import PARALLEL_MIN_TASKS, PARALLEL_WORKERS
+from todo_app.services.query import Query
+from todo_app.services.storage_backend import StorageBackend
+
+if TYPE_CHECKING:
+    from concurrent.futures import ProcessPoolExecutor
+
+# shards per worker; a few per worker keeps every worker busy when shards finish unevenly
+SHARDS_PER_WORKER = 4
+
+
+class StoreChanged(Exception):
+    """The store a worker read is not the version the scan was planned against."""
+
+
+# worker side: each worker process opens every store once and keeps it, so the JSON
+# file is parsed once per worker rather than on every scan
+_WORKER_BACKENDS: Dict[Tuple[Type[StorageBackend], str], StorageBackend] = {}
+
+
+def _worker_backend(backend_type: Type[StorageBackend], path: str) -> StorageBackend:
+    """return this worker's backend for a store, opening it on first use"""
+    key = (backend_type, path)
+    if key not in _WORKER_BACKENDS:
+        _WORKER_BACKENDS[key] = backend_type(Path(path))  # type: ignore[call-arg]
+    return _WORKER_BACKENDS[key]
+
+
+def scan_shard(
+    backend_type: Type[StorageBackend], path: str, signature: str, query: Query, start: int, stop: int,
+) -> List[str]:
+    """Check the tasks at positions start up to stop against query in a worker process.
+    args:
+        backend_type, path: the store to read e.g. (JSONBackend, '/.../todo-app.json')
+        signature: backend signature the scan was planned against
+        query: predicate to check; queries are frozen dataclasses and pickle as they are
+        start, stop: insertion positions of the shard
+    return:
+        List[str]: IDs of the matching tasks in insertion order
+    raises:
+        StoreChanged: if the store was written to since the scan was planned
+    """
+    backend = _worker_backend(backend_type, path)
+    if backend.signature() != signature:
+        raise StoreChanged(path)
+    return [task.id for task in backend.iter_range(start, stop) if query.matches(task)]
+
+
+# calling side: one pool for the whole process, started on the first parallel scan
+_EXECUTOR: Optional["ProcessPoolExecutor"] = None
+_EXECUTOR_WORKERS = 0
+_EXECUTOR_LOCK = threading.Lock()
+
+
+def get_executor(workers: int) -> "ProcessPoolExecutor":
+    """Return the shared process pool, starting it (or restarting it with a new size) if needed."""
+    # imported on the first parallel scan; most commands never start a pool
+    from concurrent.futures import ProcessPoolExecutor
+
+    global _EXECUTOR, _EXECUTOR_WORKERS
+    with _EXECUTOR_LOCK:
+        if _EXECUTOR is None or _EXECUTOR_WORKERS != workers:
+            if _EXECUTOR is not None:
+                _EXECUTOR.shutdown(wait=False, cancel_futures=True)
+            _EXECUTOR = ProcessPoolExecutor(max_workers=workers)
+            _EXECUTOR_WORKERS = workers
+        return _EXECUTOR
+
+
+def shutdown_executor() -> None:
+    """Stop the shared process pool; the next parallel scan starts a new one."""
+    global _EXECUTOR
+    with _EXECUTOR_LOCK:
+        if _EXECUTOR is not None:
+            _EXECUTOR.shutdown(wait=True, cancel_futures=True)
+            _EXECUTOR = None
+
+
+atexit.register(shutdown_executor)
+
+
+def use_parallel(total: int, workers: int = PARALLEL_WORKERS, min_tasks: int = PARALLEL_MIN_TASKS) -> bool:
+    """Whether a scan of total tasks is worth spreading over the process pool; small stores are
+    scanned faster in the calling process than the pool can be handed the work.
+    """
+    return workers > 1 and total >= max(min_tasks, 1)
+
+
+def parallel_scan(backend: StorageBackend, query: Query, workers: int = PARALLEL_WORKERS) -> Optional[List[str]]:
+    """Check every saved task against query in a pool of worker processes.
+        The store is split into contiguous shards by insertion position; the shard results
+        are joined in shard order, so the IDs come back in insertion order as with a serial
+        scan. Workers read the store themselves, so no task is sent between processes.
+    args:
+        backend: storage backend of the store
+        query: predicate to check on every task
+        workers: number of worker processes
+    return:
+        List[str] | None: IDs of the matching tasks in insertion order; None if the scan could not be
+        completed in parallel (the store changed meanwhile or the pool failed), so the caller scans serially
+    """
+    from concurrent.futures.process import BrokenProcessPool
+
+    total = backend.count()
+    if not total:
+        return []
+    shards = min(workers * SHARDS_PER_WORKER, total)
+    size = -(-total // shards)  # ceiling division
+    bounds = [(start, min(start + size, total)) for start in range(0, total, size)]
+
+    executor = get_executor(workers)
+    signature = backend.signature()
+    path = str(Path(backend.path).resolve())
+    try:
+        futures = [
+            executor.submit(scan_shard, type(backend), path, signature, query, start, stop)
+            for start, stop in bounds
+        ]
+        task_ids: List[str] = []
+        for future in futures:
+            task_ids.extend(future.result())
+        return task_ids
+    except StoreChanged:
+        return None
+    except BrokenProcessPool:
+        shutdown_executor()
+        return None
@@ -0,0 +1,617 @@
+import re
+from abc import ABC, abstractmethod
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta
+from typing import AbstractSet, Any, Callable, Dict, Iterator, List, Optional, Set, Tuple
+from todo_app.indexes.buckets import BucketIndex
+from todo_app.indexes.due import DueIndex
+from todo_app.indexes.inverted import INDEXED_FIELDS, InvertedIndex, task_tokens, tokenize
+from todo_app.indexes.registry import IndexRegistry
+from todo_app.indexes.tags import TagIndex, in_subtree, subtree_root
+from todo_app.models.task import Priority, Status, Task
+from todo_app.parsers.validator import Validator
+from todo_app.utilis.utils import convert_datestring
+
+# a [start, end) window of due times
+DueRange = Tuple[datetime, datetime]
+
+
+class Query(ABC):
+    """A predicate over saved tasks that may also be answered from the task indexes."""
+
+    @abstractmethod
+    def matches(self, task: Task) -> bool:
+        """check a single task against the predicate."""
+
+    def lookup(self, indexes: IndexRegistry) -> Optional[AbstractSet[str]]:
+        """Return the exact IDs of matching tasks from the indexes, or None if no index answers it.
+        The returned set may be shared with the index; callers must not modify it.
+        """
+        return None
+
+    def estimate(self, indexes: IndexRegistry) -> Optional[int]:
+        """Return the number of matching tasks if an index can tell without listing them, else None."""
+        return None
+
+    @abstractmethod
+    def describe(self) -> str:
+        """Return a readable form of the predicate e.g. 'priority in (high)'"""
+
+
+@dataclass(frozen=True)
+class TagQuery(Query):
+    """Tasks whose tag contains any of values, ignoring case. A value ending in /* e.g. work/*
+    selects that tag and every tag below it in the hierarchy instead.
+    """
+    values: Tuple[str, ...]
+
+    def matches(self, task: Task) -> bool:
+        tag = task.tag.lower()
+        for value in self.values:
+            root = subtree_root(value)
+            if in_subtree(tag, root) if root is not None else value.lower() in tag:
+                return True
+        return False
+
+    def lookup(self, indexes: IndexRegistry) -> Optional[AbstractSet[str]]:
+        index = indexes.get("tag")
+        assert isinstance(index, TagIndex)
+        task_ids: Set[str] = set()
+        for value in self.values:
+            root = subtree_root(value)
+            task_ids |= index.subtree(root) if root is not None else index.containing(value)
+        return task_ids
+
+    def estimate(self, indexes: IndexRegistry) -> Optional[int]:
+        index = indexes.get("tag")
+        assert isinstance(index, TagIndex)
+        roots = [root for root in map(subtree_root, self.values) if root is not None]
+        values = [value.lower() for value in self.values if subtree_root(value) is None]
+        estimate = sum(index.subtree_count(root) for root in roots)
+        if values:
+            estimate += sum(count for key, count in index.counts().items() if any(value in key for value in values))
+        return estimate
+
+    def describe(self) -> str:
+        return f"tag ~ ({', '.join(self.values)})"
+
+
+@dataclass(frozen=True)
+class PriorityQuery(Query):
+    """Tasks with any of the priority levels."""
+    values: Tuple[Priority, ...]
+
+    def matches(self, task: Task) -> bool:
+        return task.priority in self.values
+
+    def lookup(self, indexes: IndexRegistry) -> Optional[AbstractSet[str]]:
+        return _bucket_union(indexes, "priority", [value.value for value in self.values])
+
+    def describe(self) -> str:
+        return f"priority in ({', '.join(value.value.lower() for value in self.values)})"
+
+
+@dataclass(frozen=True)
+class StatusQuery(Query):
+    """Tasks with any of the statuses."""
+    values: Tuple[Status, ...]
+
+    def matches(self, task: Task) -> bool:
+        return task.status in self.values
+
+    def lookup(self, indexes: IndexRegistry) -> Optional[AbstractSet[str]]:
+        return _bucket_union(indexes, "status", [value.value for value in self.values])
+
+    def describe(self) -> str:
+        return f"status in ({', '.join(value.value.lower() for value in self.values)})"
+
+
+@dataclass(frozen=True)
+class DueQuery(Query):
+    """Tasks due inside any of the [start, end) ranges."""
+    ranges: Tuple[DueRange, ...]
+    label: str = ""
+
+    def matches(self, task: Task) -> bool:
+        due = task.due
+        return due is not None and any(start <= due < end for start, end in self.ranges)
+
+    def lookup(self, indexes: IndexRegistry) -> Optional[AbstractSet[str]]:
+        index = indexes.get("due")
+        assert isinstance(index, DueIndex)
+        task_ids: Set[str] = set()
+        for start, end in self.ranges:
+            task_ids.update(index.between(start, end))
+        return task_ids
+
+    def estimate(self, indexes: IndexRegistry) -> Optional[int]:
+        index = indexes.get("due")
+        assert isinstance(index, DueIndex)
+        return sum(index.count_between(start, end) for start, end in self.ranges)
+
+    def describe(self) -> str:
+        if self.label:
+            return f"due in ({self.label})"
+        return "due in (" + ", ".join(f"{start} .. {end}" for start, end in self.ranges) + ")"
+
+
+@dataclass(frozen=True)
+class KeywordQuery(Query):
+    """Tasks whose Description, Tag or Email contain any (or all) of the keywords as whole words."""
+    words: Tuple[str, ...]
+    match_all: bool = False
+
+    def matches(self, task: Task) -> bool:
+        tokens = task_tokens(task)
+        found = (self._word_matches(word, task, tokens) for word in self.words)
+        return all(found) if self.match_all else any(found)
+
+    @staticmethod
+    def _word_matches(word: str, task: Task, tokens: Set[str]) -> bool:
+        """whole-word match; a keyword without word characters e.g. '++' is matched as plain text"""
+        word_tokens = tokenize(word)
+        if word_tokens:
+            return set(word_tokens) <= tokens
+        return any(word.lower() in task.value(field).lower() for field in INDEXED_FIELDS)
+
+    def lookup(self, indexes: IndexRegistry) -> Optional[AbstractSet[str]]:
+        if not all(tokenize(word) for word in self.words):
+            return None
+        index = indexes.get("inverted")
+        assert isinstance(index, InvertedIndex)
+        return index.search(self.words, match_all=self.match_all)
+
+    def describe(self) -> str:
+        joiner = " & " if self.match_all else ", "
+        return f"keyword ({joiner.join(self.words)})"
+
+
+@dataclass(frozen=True)
+class AndQuery(Query):
+    children: Tuple[Query, ...]
+
+    def matches(self, task: Task) -> bool:
+        return all(child.matches(task) for child in self.children)
+
+    def lookup(self, indexes: IndexRegistry) -> Optional[AbstractSet[str]]:
+        sets = [child.lookup(indexes) for child in self.children]
+        if any(task_ids is None for task_ids in sets):
+            return None
+        return _intersect([task_ids for task_ids in sets if task_ids is not None])
+
+    def describe(self) -> str:
+        return " AND ".join(_wrap(child) for child in self.children)
+
+
+@dataclass(frozen=True)
+class OrQuery(Query):
+    children: Tuple[Query, ...]
+
+    def matches(self, task: Task) -> bool:
+        return any(child.matches(task) for child in self.children)
+
+    def lookup(self, indexes: IndexRegistry) -> Optional[AbstractSet[str]]:
+        task_ids: Set[str] = set()
+        for child in self.children:
+            child_ids = child.lookup(indexes)
+            if child_ids is None:
+                return None
+            task_ids |= child_ids
+        return task_ids
+
+    def describe(self) -> str:
+        return " OR ".join(_wrap(child) for child in self.children)
+
+
+@dataclass(frozen=True)
+class NotQuery(Query):
+    child: Query
+
+    def matches(self, task: Task) -> bool:
+        return not self.child.matches(task)
+
+    def describe(self) -> str:
+        return f"NOT {_wrap(self.child)}"
+
+
+@dataclass(frozen=True)
+class MatchAll(Query):
+    """Every task; the query used when no filter is given."""
+
+    def matches(self, task: Task) -> bool:
+        return True
+
+    def describe(self) -> str:
+        return "all tasks"
+
+
+def _wrap(query: Query) -> str:
+    """describe a nested AND/OR in brackets"""
+    if isinstance(query, (AndQuery, OrQuery)):
+        return f"({query.describe()})"
+    return query.describe()
+
+
+def _bucket_union(indexes: IndexRegistry, name: str, values: List[str]) -> AbstractSet[str]:
+    """IDs in any of the buckets of a bucket index; a single bucket is returned without copying"""
+    index = indexes.get(name)
+    assert isinstance(index, BucketIndex)
+    if len(values) == 1:
+        return index.get(values[0])
+
+    task_ids: Set[str] = set()
+    for value in values:
+        task_ids |= index.get(value)
+    return task_ids
+
+
+def _intersect(sets: List[AbstractSet[str]]) -> AbstractSet[str]:
+    """intersect ID sets starting from the smallest"""
+    ordered = sorted(sets, key=len)
+    result = ordered[0]
+    for task_ids in ordered[1:]:
+        if not result:
+            break
+        result = result & task_ids
+    return result
+
+
+def all_of(*queries: Query) -> Query:
+    """AND queries together, flattening nested ANDs and dropping MatchAll."""
+    children: List[Query] = []
+    for query in queries:
+        if isinstance(query, AndQuery):
+            children.extend(query.children)
+        elif not isinstance(query, MatchAll):
+            children.append(query)
+
+    if not children:
+        return MatchAll()
+    return children[0] if len(children) == 1 else AndQuery(tuple(children))
+
+
+def any_of(*queries: Query) -> Query:
+    """OR queries together, flattening nested ORs."""
+    children: List[Query] = []
+    for query in queries:
+        children.extend(query.children if isinstance(query, OrQuery) else [query])
+    return children[0] if len(children) == 1 else OrQuery(tuple(children))
+
+
+def cache_key(query: Query) -> Tuple[Any, ...]:
+    """Return a hashable key that is equal for queries selecting the same tasks.
+        Values are lower cased, de-duplicated and sorted, AND/OR operands are sorted and
+        display labels are dropped, so e.g. 'tag:Work,home' and 'tag:home,work' share a key.
+    args:
+        query: query to normalize
+    return:
+        Tuple: normalized form of the query
+    """
+    if isinstance(query, TagQuery):
+        return ("tag", *sorted({value.lower() for value in query.values}))
+    if isinstance(query, PriorityQuery):
+        return ("priority", *sorted({value.value for value in query.values}))
+    if isinstance(query, StatusQuery):
+        return ("status", *sorted({value.value for value in query.values}))
+    if isinstance(query, DueQuery):
+        return ("due", *sorted(set(query.ranges)))
+    if isinstance(query, KeywordQuery):
+        return ("keyword", query.match_all, *sorted({word.lower() for word in query.words}))
+    if isinstance(query, (AndQuery, OrQuery)):
+        name = "and" if isinstance(query, AndQuery) else "or"
+        # operands are tuples of mixed types, so they are ordered by their repr
+        return (name, *sorted({cache_key(child) for child in query.children}, key=repr))
+    if isinstance(query, NotQuery):
+        return ("not", cache_key(query.child))
+    if isinstance(query, MatchAll):
+        return ("all",)
+    return ("query", query)
+
+
+@dataclass
+class QueryPlan:
+    """How a query is answered: the index steps that produce candidate IDs, and the
+    predicate left to check on each candidate.
+    """
+    query: Query
+    steps: List[Tuple[str, int]] = field(default_factory=list)  # (step, candidates after the step)
+    candidates: Optional[AbstractSet[str]] = None  # None means every task is scanned
+    residual: Optional[Query] = None  # checked on every candidate; None when candidates are exact
+    matched: Optional[int] = None  # number of results once the plan has been run
+
+    def explain(self) -> List[str]:
+        """Return the plan as readable lines."""
+        lines = [f"query: {self.query.describe()}"]
+        for number, (step, count) in enumerate(self.steps, start=1):
+            lines.append(f"  {number}. {step} -> {count} candidate(s)")
+        if self.residual is not None:
+            lines.append(f"  {len(self.steps) + 1}. filter {self.residual.describe()}")
+        if self.matched is not None:
+            lines.append(f"result: {self.matched} task(s)")
+        return lines
+
+
+# an indexed predicate matching more than this many times the current candidates is
+# checked on each candidate instead of having its ID set built and intersected
+CHECK_RATIO = 8
+
+
+def plan_query(query: Query, indexes: IndexRegistry, total: int) -> QueryPlan:
+    """Choose how to answer a query.
+        An AND starts from its most selective indexed predicate and intersects the ID sets
+        of the other indexed predicates, smallest first. Predicates no index can answer,
+        or that would match far more tasks than are left, are checked on the remaining
+        candidates. Anything else is answered from the indexes when possible, otherwise
+        by a scan of every task.
+    args:
+        query: query to plan
+        indexes: index registry of the store
+        total: number of saved tasks
+    return:
+        QueryPlan: the chosen plan
+    """
+    plan = QueryPlan(query)
+
+    if isinstance(query, MatchAll):
+        plan.steps.append(("scan all tasks", total))
+        return plan
+
+    children = query.children if isinstance(query, AndQuery) else (query,)
+    estimates: List[Tuple[int, int, Query]] = []  # (estimated matches, position, predicate)
+    looked_up: Dict[int, AbstractSet[str]] = {}  # position -> ID set for predicates whose size is only known by looking up
+    unindexed: List[Query] = []
+    for position, child in enumerate(children):
+        estimate = child.estimate(indexes)
+        if estimate is None:
+            task_ids = child.lookup(indexes)
+            if task_ids is None:
+                unindexed.append(child)
+                continue
+            looked_up[position] = task_ids
+            estimate = len(task_ids)
+        estimates.append((estimate, position, child))
+
+    if not estimates:
+        plan.steps.append(("scan all tasks", total))
+        plan.residual = query
+        return plan
+
+    # most selective first
+    estimates.sort(key=lambda item: (item[0], item[1]))
+    _, position, child = estimates[0]
+    candidates = looked_up.get(position)
+    if candidates is None:
+        candidates = child.lookup(indexes) or set()
+    plan.steps.append((f"index {child.describe()}", len(candidates)))
+
+    for estimate, position, child in estimates[1:]:
+        if not candidates:
+            break
+        if estimate > CHECK_RATIO * len(candidates):
+            unindexed.append(child)
+            continue
+        task_ids = looked_up.get(position)
+        if task_ids is None:
+            task_ids = child.lookup(indexes) or set()
+        candidates = candidates & task_ids
+        plan.steps.append((f"and index {child.describe()}", len(candidates)))
+
+    plan.candidates = candidates
+    if unindexed and candidates:
+        plan.residual = all_of(*unindexed)
+    return plan
+
+
+def run_plan(
+    plan: QueryPlan,
+    tasks_by_id: Callable[[AbstractSet[str]], List[Task]],
+    all_tasks: Callable[[], Iterator[Task]],
+) -> Iterator[Task]:
+    """Yield the tasks selected by a plan in insertion order and record how many matched.
+    args:
+        plan: plan returned by plan_query
+        tasks_by_id: returns saved tasks for a set of IDs in insertion order
+        all_tasks: returns an iterator over every saved task
+    return:
+        Iterator[Task]: generator of matching tasks
+    """
+    tasks = all_tasks() if plan.candidates is None else iter(tasks_by_id(plan.candidates))
+    residual = plan.residual
+
+    matched = 0
+    for task in tasks:
+        if residual is None or residual.matches(task):
+            matched += 1
+            yield task
+    plan.matched = matched
+
+
+def day_range(value: str) -> DueRange:
+    """Convert a time filter e.g. 'tomorrow' or '23/10/2025' to the [midnight, next midnight) range of its day.
+    raises:
+        ValueError: with the conversion error message
+    """
+    start = datetime.combine(parse_time(value).date(), datetime.min.time())
+    return start, start + timedelta(days=1)
+
+
+def parse_time(value: str) -> datetime:
+    """Convert a time or duration e.g. '23/10/2025 14:00', 'friday' or '7 days' (from now) to a datetime.
+    raises:
+        ValueError: with the conversion error message
+    """
+    status, result = convert_datestring(value)
+    if not status or not isinstance(result, datetime):
+        raise ValueError(str(result))
+    return result
+
+
+def due_between(start: Optional[str] = None, end: Optional[str] = None) -> Query:
+    """Tasks due from start up to and including end; either bound may be left open.
+    args:
+        start: time filter e.g. 'today' or '23/10/2025 09:00'
+        end: time filter e.g. 'friday' or '7 days'
+    raises:
+        ValueError: if a bound cannot be converted or end is before start
+    """
+    lower = parse_time(start) if start else datetime.min
+    # the index works to the second, so an inclusive end is the start of the next second
+    upper = parse_time(end) + timedelta(seconds=1) if end else datetime.max
+    if upper <= lower:
+        raise ValueError(f"Invalid due range; {end} is before {start}.")
+
+    label = f"{start or '...'} to {end or '...'}"
+    return DueQuery(((lower, upper),), label)
+
+
+def overdue_query(now: Optional[datetime] = None) -> Query:
+    """Tasks due before now that are not complete."""
+    now = now or datetime.now()
+    return AndQuery((
+        DueQuery(((datetime.min, now),), "overdue"),
+        StatusQuery((Status.INCOMPLETE, Status.INPROGRESS)),
+    ))
+
+
+def due_within(duration: str, now: Optional[datetime] = None) -> Query:
+    """Tasks due between now and a duration from now e.g. '1 hour' or '7 days'.
+    raises:
+        ValueError: if duration cannot be converted or does not lie in the future
+    """
+    now = now or datetime.now()
+    end = parse_time(duration)
+    if end <= now:
+        raise ValueError(f"Invalid duration {duration}; it must lie in the future e.g. '7 days'.")
+    return DueQuery(((now, end),), f"next {duration}")
+
+
+def make_query(name: str, values: List[str]) -> Query:
+    """Build a single-field query from user input, validating the values.
+    args:
+        name: tag, priority, status, due (or time/date), keyword (or text), after, before or within.
+              due:overdue selects incomplete tasks whose due time has passed
+        values: user values e.g. ['high', 'mild']
+    return:
+        Query: the predicate; a task matches if it matches any of the values
+    raises:
+        ValueError: with the same error messages as the list command filters
+    """
+    values = [value for value in values if value.strip()]
+    name = name.lower()
+    if not values:
+        raise ValueError(f"No value given for {name}.")
+
+    if name == "tag":
+        return TagQuery(tuple(values))
+
+    if name == "priority":
+        for value in values:
+            status, message = Validator.valid_priority_level(value)
+            if not status:
+                raise ValueError(message)
+        return PriorityQuery(tuple(dict.fromkeys(Priority.parse(value) for value in values)))
+
+    if name == "status":
+        for value in values:
+            status, message = Validator.valid_status(value)
+            if not status:
+                raise ValueError(message)
+        return StatusQuery(tuple(dict.fromkeys(Status.parse(value) for value in values)))
+
+    if name in ("due", "time", "date"):
+        if [value.lower() for value in values] == ["overdue"]:
+            return overdue_query()
+        return DueQuery(tuple(day_range(value) for value in values), ", ".join(values))
+
+    if name == "after":
+        return due_between(start=values[0])
+
+    if name == "before":
+        return due_between(end=values[0])
+
+    if name == "within":
+        return due_within(values[0])
+
+    if name in ("keyword", "text"):
+        return KeywordQuery(tuple(values))
+
+    raise ValueError(
+        f"Invalid query field {name}. Valid fields are; tag, priority, status, due, after, before, within and keyword"
+    )
+
+
+# tokens of a query string: brackets, field:"quoted value", "quoted words" and plain words
+QUERY_TOKEN_PATTERN = re.compile(r'\(|\)|[^\s()":]+:"[^"]*"|"[^"]*"|[^\s()]+')
+
+
+def parse_query(text: str) -> Query:
+    """Parse a query string such as 'status:incomplete and (tag:work or priority:high) and not due:today'.
+        Words are combined with AND unless OR is given; NOT negates the next term.
+        field:value1,value2 matches any of the values. A word without a field is a keyword.
+    args:
+        text: query string
+    return:
+        Query: the parsed query; MatchAll for an empty string
+    raises:
+        ValueError: on a syntax error or an invalid value
+    """
+    tokens = QUERY_TOKEN_PATTERN.findall(text)
+    position = 0
+
+    def peek() -> Optional[str]:
+        return tokens[position] if position < len(tokens) else None
+
+    def take() -> str:
+        nonlocal position
+        position += 1
+        return tokens[position - 1]
+
+    def parse_or() -> Query:
+        terms = [parse_and()]
+        while (peek() or "").lower() == "or":
+            take()
+            terms.append(parse_and())
+        return any_of(*terms)
+
+    def parse_and() -> Query:
+        factors = [parse_not()]
+        while peek() is not None and peek() != ")" and (peek() or "").lower() != "or":
+            if (peek() or "").lower() == "and":
+                take()
+            factors.append(parse_not())
+        return all_of(*factors)
+
+    def parse_not() -> Query:
+        token = peek()
+        if token is None:
+            raise ValueError("Incomplete query; a term is missing at the end.")
+        if token.lower() == "not":
+            take()
+            return NotQuery(parse_not())
+        if token == "(":
+            take()
+            query = parse_or()
+            if peek() != ")":
+                raise ValueError("Missing ) in query.")
+            take()
+            return query
+        if token == ")" or token.lower() in ("and", "or"):
+            raise ValueError(f"Unexpected {token} in query.")
+        return parse_term(take())
+
+    def parse_term(token: str) -> Query:
+        name, separator, value = token.partition(":")
+        if not separator or not name.isalpha():
+            return KeywordQuery((token.strip('"'),))
+        value = value.strip('"')
+        # dates may contain commas e.g. due:"July 2nd, 2025"
+        is_date = name.lower() in ("due", "time", "date", "after", "before", "within")
+        return make_query(name, [value] if is_date else value.split(","))
+
+    if not tokens:
+        return MatchAll()
+
+    query = parse_or()
+    if peek() is not None:
+        raise ValueError(f"Unexpected {peek()} in query.")
+    return query
@@ -0,0 +1,181 @@
+import hashlib
+import json
+import os
+import threading
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any, Callable, Dict, Hashable, Iterable, List, Optional, Tuple
+from todo_app.config import QUERY_CACHE_SIZE
+from todo_app.indexes.registry import write_json
+from todo_app.services.storage_backend import StorageBackend
+
+
+class QueryCache:
+    """Least recently used cache of query results for one store.
+
+    Results are only valid for the store version they were computed against. The
+    version is a counter that DatabaseService bumps on every write, combined with
+    the backend signature so writes made by another process are noticed too. When
+    the version moves on every cached result is dropped at once; there is no
+    per-entry bookkeeping to get wrong.
+
+    Results are kept as tuples of saved-shape task dictionaries, converted once on
+    a miss. Use rows() to get copies that callers are free to modify.
+
+    Given a directory, every result is also saved there as a file stamped with the
+    backend signature it was computed against, so a later process, e.g. the next CLI
+    command run from a shell prompt, reads it back instead of running the query while
+    the store is unchanged. A file stamped with another signature is never used, and
+    the max_size most recently written files are kept.
+    """
+
+    def __init__(self, backend: StorageBackend, max_size: int = QUERY_CACHE_SIZE, directory: Optional[Path] = None):
+        self.backend = backend
+        self.max_size = max_size
+        self.directory = Path(directory) if directory is not None else None
+        self.version = 0
+        self._stamp: Optional[Tuple[int, str]] = None  # store version the entries were computed against
+        self._entries: "OrderedDict[Hashable, Tuple[Dict[str, Any], ...]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.disk_hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.invalidations = 0
+
+    def bump(self) -> None:
+        """Mark every cached result stale; called after each write to the store."""
+        with self._lock:
+            self.version += 1
+
+    def _current(self) -> Tuple[int, str]:
+        """return the store version, dropping the entries if it changed since they were cached"""
+        stamp = (self.version, self.backend.signature())
+        if stamp != self._stamp:
+            if self._entries:
+                self.invalidations += 1
+                self._entries.clear()
+            self._stamp = stamp
+        return stamp
+
+    def get_or_compute(
+        self, key: Hashable, compute: Callable[[], Iterable[Dict[str, Any]]],
+    ) -> Tuple[Dict[str, Any], ...]:
+        """Return the cached result for key, computing and caching it on a miss.
+        args:
+            key: normalized query e.g. ("query", cache_key(query), page)
+            compute: returns the matching tasks as dictionaries; only called on a miss
+        return:
+            Tuple[Dict[str, Any], ...]: matching tasks; shared with the cache, do not modify
+        """
+        if self.max_size <= 0:
+            return tuple(compute())
+
+        with self._lock:
+            stamp = self._current()
+            result = self._entries.get(key)
+            if result is not None:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return result
+
+        # read or computed outside the lock; the result is only kept if no write happened meanwhile
+        saved = self._read_file(key, stamp[1])
+        result = saved if saved is not None else tuple(compute())
+        with self._lock:
+            if saved is not None:
+                self.hits += 1
+                self.disk_hits += 1
+            else:
+                self.misses += 1
+            if self._current() != stamp:
+                return result
+            self._entries[key] = result
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+
+        if saved is None:
+            self._write_file(key, stamp[1], result)
+        return result
+
+    def _file_path(self, key: Hashable) -> Optional[Path]:
+        """file a result is saved in; the name is a digest of the key's repr, which is the same in every process"""
+        if self.directory is None:
+            return None
+        digest = hashlib.sha1(repr(key).encode("utf-8")).hexdigest()
+        return self.directory / f"{Path(self.backend.path).name}.queries" / f"{digest}.json"
+
+    def _read_file(self, key: Hashable, signature: str) -> Optional[Tuple[Dict[str, Any], ...]]:
+        """return the result saved for key against signature, or None"""
+        path = self._file_path(key)
+        if path is None:
+            return None
+        try:
+            with open(path, "r", encoding="utf-8") as result_file:
+                data = json.load(result_file)
+        except (OSError, ValueError):
+            return None
+        if not isinstance(data, dict) or data.get("key") != repr(key) or data.get("signature") != signature:
+            return None
+        return tuple(data.get("rows", ()))
+
+    def _write_file(self, key: Hashable, signature: str, result: Tuple[Dict[str, Any], ...]) -> None:
+        """save a result stamped with signature, then drop the least recently written files past max_size"""
+        path = self._file_path(key)
+        if path is None:
+            return
+        try:
+            write_json(path, {"key": repr(key), "signature": signature, "rows": list(result)})
+            saved = sorted(path.parent.glob("*.json"), key=lambda file: file.stat().st_mtime_ns)
+            for old in saved[: max(len(saved) - self.max_size, 0)]:
+                os.unlink(old)
+        except OSError:
+            pass  # a read-only disk or a file removed by another process only costs a later command a miss
+
+    def rows(self, key: Hashable, compute: Callable[[], Iterable[Dict[str, Any]]]) -> List[Dict[str, Any]]:
+        """Like get_or_compute, but return a list of copies of the cached task dictionaries."""
+        return [dict(row) for row in self.get_or_compute(key, compute)]
+
+    def resize(self, max_size: int) -> None:
+        """Change the number of cached results, evicting the least recently used ones."""
+        with self._lock:
+            self.max_size = max_size
+            while self._entries and len(self._entries) > max(max_size, 0):
+                self._entries.popitem(last=False)
+                self.evictions += 1
+
+    def stats(self) -> Dict[str, float]:
+        """Return the cache counters e.g. {"hits": 9, "misses": 1, "hit_rate": 0.9, ...}"""
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "size": len(self._entries),
+                "max_size": self.max_size,
+                "hits": self.hits,
+                "disk_hits": self.disk_hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "invalidations": self.invalidations,
+                "hit_rate": self.hits / lookups if lookups else 0.0,
+            }
+
+
+# one cache per stored file for the whole process
+_CACHES: Dict[Path, QueryCache] = {}
+_CACHES_LOCK = threading.Lock()
+
+
+def get_query_cache(backend: StorageBackend, directory: Optional[Path] = None) -> QueryCache:
+    """Return the process-wide query result cache for a backend's store.
+    args:
+        backend: storage backend; JSON or SQLite
+        directory: folder results are saved in for other processes e.g. the index sidecar folder
+    return:
+        QueryCache: shared cache sized by QUERY_CACHE_SIZE
+    """
+    key = Path(backend.path).resolve()
+    with _CACHES_LOCK:
+        if key not in _CACHES:
+            _CACHES[key] = QueryCache(backend, directory=directory)
+        return _CACHES[key]
@@ -0,0 +1,557 @@
+import codecs
+import io
+import json
+import os
+import tempfile
+import threading
+import zlib
+from functools import partial
+from pathlib import Path
+from typing import Any, BinaryIO, Callable, Dict, Iterable, Iterator, List, Optional, Tuple
+from todo_app.config import JSON_JOURNAL_MODE, JOURNAL_MAX_BYTES, JOURNAL_MAX_ENTRIES
+from todo_app.models.task import Task
+
+# (modification time in ns, size in bytes, inode) of a file; None when the file does not exist
+FileSignature = Optional[Tuple[int, int, int]]
+
+# the journal operations on one task ID: (entry number, operation, task or changed fields)
+JournalSteps = List[Tuple[int, str, Optional[Dict[str, Any]]]]
+
+# bytes of the snapshot read at a time by TaskRepository.stream_records
+STREAM_CHUNK = 64 * 1024
+
+
+class TaskRepository:
+    """Parse a JSON task file once per process and serve every read from memory.
+
+    The parsed tasks are re-read only when the file's mtime, size or inode changes,
+    e.g. after another taskmate process saved a task. Tasks are held as frozen Task
+    objects and converted to the on-disk dictionary shape only when written. A dict
+    index from task ID to list position is maintained alongside the tasks so lookups are O(1).
+
+    In journal mode every insert/update/delete appends one compact JSON line to
+    <name>.journal.jsonl instead of rewriting the snapshot. Readers replay the journal
+    on top of the snapshot, and the snapshot is rewritten (compacted) in a background
+    thread once the journal grows past max_entries lines or max_bytes bytes.
+    """
+
+    def __init__(
+        self,
+        path: Path,
+        journal: bool = JSON_JOURNAL_MODE,
+        max_entries: int = JOURNAL_MAX_ENTRIES,
+        max_bytes: int = JOURNAL_MAX_BYTES,
+    ):
+        self.path = Path(path)
+        self.journal_path = self.path.with_name(f"{self.path.stem}.journal.jsonl")
+        self.journal = journal
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+
+        self._records: List[Task] = []
+        self._positions: Dict[str, int] = {}     # task ID -> position in _records
+        self._descriptions: Dict[str, int] = {}  # task description -> number of tasks using it
+        self._signature: Tuple[FileSignature, FileSignature] = (None, None)
+        self._loaded = False
+        self._lock = threading.RLock()
+
+        # checksum of the snapshot the journal applies to, and the journal size
+        self._snapshot_crc = 0
+        self._journal_entries = 0
+        self._journal_bytes = 0
+        self._journal_current = False  # whether the journal file starts with the base header of the snapshot
+        self._compactor: Optional[threading.Thread] = None
+        self._compaction_listeners: List[Callable[[str, str], None]] = []
+
+    @staticmethod
+    def _stat(path: Path) -> FileSignature:
+        """stat a file"""
+        try:
+            stat = os.stat(path)
+        except FileNotFoundError:
+            return None
+        return stat.st_mtime_ns, stat.st_size, stat.st_ino
+
+    def _file_signature(self) -> Tuple[FileSignature, FileSignature]:
+        """stat the snapshot and the journal"""
+        return self._stat(self.path), self._stat(self.journal_path)
+
+    def _read_file(self) -> List[Task]:
+        """parse the snapshot and replay the journal on top of it"""
+        try:
+            raw = self.path.read_bytes()
+        except FileNotFoundError:
+            raw = b""
+
+        self._snapshot_crc = zlib.crc32(raw)
+        try:
+            records = json.loads(raw) if raw.strip() else []
+        except json.JSONDecodeError:
+            records = []
+
+        return [Task.from_dict(task) for task in self._replay_journal(records)]
+
+    def _replay_journal(self, records: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """apply the journal operations written since the snapshot"""
+        self._journal_entries = 0
+        self._journal_bytes = 0
+        lines = self._read_journal(self._snapshot_crc)
+        self._journal_current = lines is not None
+        if lines is None:
+            return records
+
+        # replay on an ID-keyed dict; it keeps the snapshot order and makes every operation idempotent
+        tasks = {task.get("ID"): task for task in records}
+        for entry in _operations(lines[1:]):
+            operation = entry.get("op")
+            if operation == "insert":
+                tasks[entry["task"].get("ID")] = entry["task"]
+            elif operation == "update" and entry.get("id") in tasks:
+                tasks[entry["id"]] = {**tasks[entry["id"]], **entry["fields"]}
+            elif operation == "delete":
+                for task_id in entry["ids"]:
+                    tasks.pop(task_id, None)
+
+        self._journal_entries = len(lines) - 1
+        self._journal_bytes = sum(len(line.encode("utf-8")) for line in lines)
+        return list(tasks.values())
+
+    def _read_journal(self, crc: int) -> Optional[List[str]]:
+        """return the journal lines, base header first, when the journal applies to the snapshot with checksum crc"""
+        try:
+            with open(self.journal_path, "r", encoding="utf-8") as journal_file:
+                lines = journal_file.readlines()
+        except FileNotFoundError:
+            return None
+
+        if not lines:
+            return None
+
+        try:
+            header = json.loads(lines[0])
+        except json.JSONDecodeError:
+            return None
+
+        # a journal left behind by an interrupted compaction belongs to an older snapshot; _persist
+        # starts a new one instead of appending to it
+        if header.get("op") != "base" or header.get("crc") != crc:
+            return None
+        return lines
+
+    def stream_records(self) -> Iterator[Task]:
+        """Yield the saved tasks in the order records() returns them without loading the store.
+            Served from the cache when it is current; otherwise the snapshot is parsed STREAM_CHUNK
+            bytes at a time and the journal, which compaction keeps small, is applied as the tasks
+            go by. Nothing is cached, so this suits one pass over a large store such as an export.
+        """
+        with self._lock:
+            current = self._loaded and self._file_signature() == self._signature
+            cached = self._records
+        if current:
+            yield from cached
+            return
+
+        while True:
+            try:
+                snapshot: BinaryIO = open(self.path, "rb")
+            except FileNotFoundError:
+                snapshot = io.BytesIO()
+            with snapshot:
+                crc = 0
+                for block in iter(partial(snapshot.read, STREAM_CHUNK), b""):
+                    crc = zlib.crc32(block, crc)
+                lines = self._read_journal(crc) or []
+
+                # a compaction that replaced the snapshot after it was opened also dropped its journal
+                if not isinstance(snapshot, io.BytesIO):
+                    stat = self._stat(self.path)
+                    if stat is None or stat[2] != os.fstat(snapshot.fileno()).st_ino:
+                        continue
+
+                snapshot.seek(0)
+                yield from _replay_stream(_iter_json_array(snapshot), _journal_changes(lines[1:]))
+                return
+
+    def records(self) -> List[Task]:
+        """Return the cached tasks, re-reading the file only if it changed on disk.
+        The returned list is shared; callers must not modify it.
+        """
+        with self._lock:
+            # stat before reading so a write racing with the read is picked up next time
+            signature = self._file_signature()
+
+            if self._loaded and signature == self._signature:
+                self.hits += 1
+                return self._records
+
+            self.misses += 1
+            self._records = self._read_file()
+            self._signature = signature
+            self._loaded = True
+            self._reindex()
+            return self._records
+
+    def _reindex(self) -> None:
+        """rebuild the ID and description indexes from the cached tasks"""
+        self._positions = {task.id: position for position, task in enumerate(self._records)}
+        self._descriptions = {}
+        for task in self._records:
+            self._count_description(task.description, 1)
+
+    def _count_description(self, description: str, step: int) -> None:
+        """add step to the number of tasks using description"""
+        count = self._descriptions.get(description, 0) + step
+        if count > 0:
+            self._descriptions[description] = count
+        else:
+            self._descriptions.pop(description, None)
+
+    def _write_file(self) -> None:
+        """atomically write the cached tasks as the new snapshot and drop the journal"""
+        records = [task.to_dict() for task in self._records]
+        data = json.dumps(records, indent=4, ensure_ascii=False).encode("utf-8")
+
+        try:
+            # write next to the snapshot then rename, so a crash never leaves a truncated file
+            fd, temp_path = tempfile.mkstemp(dir=self.path.parent, prefix=f".{self.path.name}.")
+            try:
+                with os.fdopen(fd, "wb") as temp_file:
+                    temp_file.write(data)
+                    temp_file.flush()
+                    os.fsync(temp_file.fileno())
+
+                # mkstemp creates owner-only files; keep the snapshot's permissions
+                mode = os.stat(self.path).st_mode & 0o777 if self.path.exists() else 0o644
+                os.chmod(temp_path, mode)
+                os.replace(temp_path, self.path)
+            except BaseException:
+                if os.path.exists(temp_path):
+                    os.unlink(temp_path)
+                raise
+
+            # the journal's base checksum no longer matches, but remove it to free the space
+            if os.path.exists(self.journal_path):
+                os.unlink(self.journal_path)
+        except Exception:
+            # memory may be ahead of disk; force a re-read on the next access
+            self._loaded = False
+            raise
+
+        self._snapshot_crc = zlib.crc32(data)
+        self._journal_entries = 0
+        self._journal_bytes = 0
+        self._journal_current = False
+        self._signature = self._file_signature()
+
+    def _persist(self, *entries: Dict[str, Any]) -> None:
+        """save changes; journal lines in journal mode, otherwise a full snapshot"""
+        if not self.journal:
+            self._write_file()
+            return
+
+        # a missing journal, or one whose base header is of another snapshot (e.g. left behind by a crash
+        # between replacing the snapshot and removing the journal), is replaced by a new one; lines
+        # appended to it would be ignored by every reader
+        lines = []
+        fresh = not self._journal_current
+        if fresh:
+            lines.append(json.dumps({"op": "base", "crc": self._snapshot_crc}))
+        lines.extend(json.dumps(entry, ensure_ascii=False, separators=(",", ":")) for entry in entries)
+        data = "".join(f"{line}\n" for line in lines)
+
+        try:
+            with open(self.journal_path, "w" if fresh else "a", encoding="utf-8") as journal_file:
+                journal_file.write(data)
+        except Exception:
+            self._loaded = False
+            raise
+
+        if fresh:
+            self._journal_current = True
+            self._journal_entries = self._journal_bytes = 0
+        self._journal_entries += len(entries)
+        self._journal_bytes += len(data.encode("utf-8"))
+        self._signature = self._file_signature()
+
+        if self._journal_entries >= self.max_entries or self._journal_bytes >= self.max_bytes:
+            self._start_compaction()
+
+    def _start_compaction(self) -> None:
+        """rewrite the snapshot in a background thread"""
+        if self._compactor is not None and self._compactor.is_alive():
+            return
+
+        # not a daemon thread: the interpreter waits for it before a CLI command exits
+        self._compactor = threading.Thread(target=self.compact, name="taskmate-compaction")
+        self._compactor.start()
+
+    def add_compaction_listener(self, listener: Callable[[str, str], None]) -> None:
+        """Call listener(signature before, signature after) whenever a compaction rewrites the files
+        without changing the tasks, e.g. so indexes stamped with the old signature stay current.
+        """
+        with self._lock:
+            self._compaction_listeners.append(listener)
+
+    def compact(self) -> None:
+        """Fold the journal into a freshly written snapshot."""
+        with self._lock:
+            self.records()
+            if not self._journal_entries and not os.path.exists(self.journal_path):
+                return
+            before = self.signature()
+            self._write_file()
+            after = self.signature()
+            listeners = list(self._compaction_listeners)
+
+        # outside the lock; listeners may read tasks from another thread holding their own locks
+        for listener in listeners:
+            listener(before, after)
+
+    def wait_for_compaction(self) -> None:
+        """Block until a running background compaction finishes."""
+        compactor = self._compactor
+        if compactor is not None:
+            compactor.join()
+
+    def commit(self, records: List[Task]) -> None:
+        """Write records as the new snapshot and keep them as the cached tasks.
+        args:
+            records: the complete list of tasks to save
+        """
+        with self._lock:
+            self._records = records
+            self._loaded = True
+            self._reindex()
+            self._write_file()
+
+    def get(self, task_id: str) -> Optional[Task]:
+        """Return the cached task with task_id or None if it does not exist."""
+        with self._lock:
+            records = self.records()
+            position = self._positions.get(task_id)
+            return records[position] if position is not None else None
+
+    def get_many(self, task_ids: Iterable[str]) -> List[Task]:
+        """Return the cached tasks with the given IDs in list order; unknown IDs are skipped."""
+        with self._lock:
+            records = self.records()
+            positions = sorted(
+                position for position in map(self._positions.get, task_ids) if position is not None
+            )
+            return [records[position] for position in positions]
+
+    def has_description(self, description: str) -> bool:
+        """check if a task with the same description is already saved."""
+        with self._lock:
+            self.records()
+            return description in self._descriptions
+
+    def insert(self, task: Task) -> None:
+        """Append a task and save it."""
+        self.insert_many([task])
+
+    def insert_many(self, tasks: List[Task]) -> None:
+        """Append several tasks and save them with a single write."""
+        if not tasks:
+            return
+
+        with self._lock:
+            records = self.records()
+            for task in tasks:
+                records.append(task)
+                self._positions[task.id] = len(records) - 1
+                self._count_description(task.description, 1)
+            self._persist(*({"op": "insert", "task": task.to_dict()} for task in tasks))
+
+    def update(self, task_id: str, fields: Dict[str, Any]) -> bool:
+        """Set fields on the task with task_id and save it.
+        args:
+            task_id: ID of the task to update
+            fields: task fields to overwrite e.g. {"Status": "Complete"}
+        return:
+            bool: False if task_id does not exist
+        """
+        return bool(self.update_many({task_id: fields}))
+
+    def update_many(self, changes: Dict[str, Dict[str, Any]]) -> List[str]:
+        """Set fields on several tasks and save them with a single write.
+        args:
+            changes: task ID -> task fields to overwrite e.g. {"7d588667": {"Status": "Complete"}}
+        return:
+            List[str]: IDs that exist and were updated
+        """
+        with self._lock:
+            records = self.records()
+            updated: List[str] = []
+            entries: List[Dict[str, Any]] = []
+
+            for task_id, fields in changes.items():
+                position = self._positions.get(task_id)
+                if position is None:
+                    continue
+
+                # tasks are frozen; swap in an updated copy
+                old_task = records[position]
+                records[position] = old_task.with_fields(fields)
+                self._count_description(old_task.description, -1)
+                self._count_description(records[position].description, 1)
+
+                updated.append(task_id)
+                entries.append({"op": "update", "id": task_id, "fields": fields})
+
+            if entries:
+                self._persist(*entries)
+            return updated
+
+    def delete(self, task_ids: List[str]) -> List[str]:
+        """Delete tasks by ID in one pass over the list and save the change.
+        args:
+            task_ids: IDs of the tasks to delete
+        return:
+            List[str]: IDs that were deleted, in the order they were given
+        """
+        with self._lock:
+            records = self.records()
+            deleted = [task_id for task_id in dict.fromkeys(task_ids) if task_id in self._positions]
+            if not deleted:
+                return []
+
+            to_delete = set(deleted)
+            self._records = [task for task in records if task.id not in to_delete]
+            self._reindex()
+            self._persist({"op": "delete", "ids": deleted})
+            return deleted
+
+    def invalidate(self) -> None:
+        """Drop the cached tasks so the next access re-reads the file."""
+        with self._lock:
+            self._loaded = False
+
+    def cache_stats(self) -> Dict[str, int]:
+        """Return the cache hit and miss counters."""
+        return {"hits": self.hits, "misses": self.misses}
+
+    def signature(self) -> str:
+        """Return a string that changes whenever the snapshot or the journal changes on disk."""
+        return repr(self._file_signature())
+
+
+def _operations(lines: Iterable[str]) -> Iterator[Dict[str, Any]]:
+    """parse journal lines, stopping at a torn last line from a crash mid-append"""
+    for line in lines:
+        try:
+            yield json.loads(line)
+        except json.JSONDecodeError:
+            return
+
+
+def _journal_changes(lines: Iterable[str]) -> Dict[Any, JournalSteps]:
+    """group the journal operations by the task ID they touch, in journal order"""
+    changes: Dict[Any, JournalSteps] = {}
+    for number, entry in enumerate(_operations(lines)):
+        operation = entry.get("op")
+        if operation == "insert":
+            changes.setdefault(entry["task"].get("ID"), []).append((number, operation, entry["task"]))
+        elif operation == "update":
+            changes.setdefault(entry.get("id"), []).append((number, operation, entry["fields"]))
+        elif operation == "delete":
+            for task_id in entry["ids"]:
+                changes.setdefault(task_id, []).append((number, operation, None))
+    return changes
+
+
+def _apply_steps(
+    task: Optional[Dict[str, Any]], steps: JournalSteps
+) -> Tuple[Optional[Dict[str, Any]], Optional[int]]:
+    """apply the journal operations on one task ID the way _replay_journal does.
+    return:
+        (task or None when deleted, number of the insert that added it back once it was absent, which
+        moves it to the end of the store; None when it keeps its place)
+    """
+    moved = None
+    for number, operation, data in steps:
+        if operation == "insert":
+            if task is None:
+                moved = number
+            task = data
+        elif operation == "update":
+            if task is not None and data is not None:
+                task = {**task, **data}
+        else:
+            task = None
+    return task, moved
+
+
+def _replay_stream(records: Iterator[Dict[str, Any]], changes: Dict[Any, JournalSteps]) -> Iterator[Task]:
+    """yield snapshot records with the journal changes applied, then the tasks the journal added"""
+    appended: List[Tuple[int, Dict[str, Any]]] = []
+    for record in records:
+        steps = changes.pop(record.get("ID"), None)
+        if steps is None:
+            yield Task.from_dict(record)
+            continue
+        task, moved = _apply_steps(record, steps)
+        if task is not None and moved is None:
+            yield Task.from_dict(task)
+        elif task is not None and moved is not None:
+            appended.append((moved, task))
+
+    for steps in changes.values():
+        task, moved = _apply_steps(None, steps)
+        if task is not None and moved is not None:
+            appended.append((moved, task))
+
+    appended.sort(key=lambda item: item[0])
+    for _, task in appended:
+        yield Task.from_dict(task)
+
+
+def _iter_json_array(snapshot: BinaryIO) -> Iterator[Dict[str, Any]]:
+    """yield the objects of a JSON list file one at a time, holding about STREAM_CHUNK bytes of it.
+    Like _read_file, which reads a file that does not parse as empty, the stream ends where the file stops parsing.
+    """
+    decoder = json.JSONDecoder()
+    text = codecs.getincrementaldecoder("utf-8")()
+    buffer, position, started = "", 0, False
+    for block in iter(partial(snapshot.read, STREAM_CHUNK), b""):
+        buffer = buffer[position:] + text.decode(block)
+        position = 0
+        while True:
+            # skip the opening bracket and the separators between objects
+            while position < len(buffer):
+                char = buffer[position]
+                if char == "[" and not started:
+                    started = True
+                elif char not in " \t\r\n,":
+                    break
+                position += 1
+            if position == len(buffer):
+                break
+            if not started or buffer[position] != "{":
+                return  # the closing bracket, or a file that is not a list of objects
+            try:
+                record, position = decoder.raw_decode(buffer, position)
+            except json.JSONDecodeError:
+                break  # the object runs on into the next block
+            yield record
+
+
+# one repository per JSON file for the whole process
+_REPOSITORIES: Dict[Path, TaskRepository] = {}
+_REPOSITORIES_LOCK = threading.Lock()
+
+
+def get_repository(path: Path) -> TaskRepository:
+    """Return the process-wide repository for a JSON task file.
+    args:
+        path: path to the JSON task file
+    return:
+        TaskRepository: shared repository for path
+    """
+    key = Path(path).resolve()
+    with _REPOSITORIES_LOCK:
+        if key not in _REPOSITORIES:
+            _REPOSITORIES[key] = TaskRepository(key)
+        return _REPOSITORIES[key]
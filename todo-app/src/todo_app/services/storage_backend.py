@@ -0,0 +1,419 @@
+import os
+import sqlite3
+from itertools import islice
+from abc import ABC, abstractmethod
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Tuple
+from todo_app.config import JSON_DB_PATH, SQLITE_DB_PATH, STORAGE_BACKEND
+from todo_app.models.task import TASK_FIELDS, Task
+from todo_app.services.repository import get_repository
+
+
+class StorageBackend(ABC):
+    """Interface every TaskMate storage engine implements.
+
+    Tasks cross this interface as Task objects. Field changes passed to update_task and
+    update_tasks use the on-disk key names, e.g. {"Status": "Complete", "Time": "2025-10-23 18:00:00"}
+    """
+
+    # file the store is saved in; index sidecars, views and worker processes locate the store by it
+    path: Path
+
+    @abstractmethod
+    def load_all(self) -> List[Task]:
+        """Return every saved task in insertion order."""
+
+    @abstractmethod
+    def iter_tasks(self) -> Iterator[Task]:
+        """Yield every saved task in insertion order without building a list.
+        Whether the store is also read in pieces depends on the engine; JSONBackend holds it in memory.
+        """
+
+    def stream_tasks(self) -> Iterator[Task]:
+        """Yield every saved task in insertion order, reading the store in pieces, for a single pass
+        over a store of any size such as an export. Engines whose iter_tasks already does so inherit it.
+        """
+        return self.iter_tasks()
+
+    def iter_range(self, start: int, stop: int) -> Iterator[Task]:
+        """Yield the saved tasks at insertion positions start up to stop, e.g. one shard of a parallel scan."""
+        return islice(self.iter_tasks(), start, stop)
+
+    @abstractmethod
+    def save_all(self, records: List[Task]) -> None:
+        """Replace the whole store with records."""
+
+    @abstractmethod
+    def count(self) -> int:
+        """Return the number of saved tasks."""
+
+    @abstractmethod
+    def get_task(self, task_id: str) -> Optional[Task]:
+        """Return the task with task_id or None if it does not exist."""
+
+    @abstractmethod
+    def get_tasks(self, task_ids: Iterable[str]) -> List[Task]:
+        """Return the tasks with the given IDs in insertion order; unknown IDs are skipped."""
+
+    @abstractmethod
+    def has_description(self, description: str) -> bool:
+        """check if a task with the same description is already saved."""
+
+    @abstractmethod
+    def insert_task(self, task: Task) -> None:
+        """Save a new task at the end of the store."""
+
+    @abstractmethod
+    def insert_tasks(self, tasks: List[Task]) -> None:
+        """Save several new tasks at the end of the store with a single write."""
+
+    @abstractmethod
+    def update_task(self, task_id: str, fields: Dict[str, Any]) -> bool:
+        """Set fields on the task with task_id. Returns False if the task does not exist."""
+
+    @abstractmethod
+    def update_tasks(self, changes: Dict[str, Dict[str, Any]]) -> List[str]:
+        """Set fields on several tasks in one write and return the IDs that were updated."""
+
+    @abstractmethod
+    def delete_tasks(self, task_ids: List[str]) -> List[str]:
+        """Delete tasks by ID and return the IDs that were actually deleted."""
+
+    @abstractmethod
+    def clear(self) -> int:
+        """Delete every task and return how many were removed."""
+
+    @abstractmethod
+    def filter_tasks(
+        self, field: str, values: List[str], contains: bool = False
+    ) -> List[Task]:
+        """Return tasks whose field equals (or contains) any of values, ignoring case."""
+
+    @abstractmethod
+    def filter_time_ranges(self, ranges: List[Tuple[datetime, datetime]]) -> List[Task]:
+        """Return tasks whose due time falls in any [start, end) range."""
+
+    def cache_stats(self) -> Dict[str, int]:
+        """Return read cache counters; empty for engines without a read cache."""
+        return {}
+
+    @abstractmethod
+    def signature(self) -> str:
+        """Return a string that changes whenever the stored tasks may have changed,
+        including writes made by another process. Indexes use it to detect staleness.
+        """
+
+    def add_compaction_listener(self, listener: Callable[[str, str], None]) -> None:
+        """Call listener(signature before, signature after) when the engine rewrites its files on its own
+        without changing the tasks; engines that never do so ignore it.
+        """
+
+
+class JSONBackend(StorageBackend):
+    """Store tasks as a pretty-printed JSON list in a single file.
+
+    Reads are served from the process-wide TaskRepository, so the file is parsed
+    once per process instead of once per call.
+    """
+
+    def __init__(self, path: Path = JSON_DB_PATH):
+        self.path = Path(path)
+        self.repository = get_repository(self.path)
+
+    # cached tasks are frozen, so they are handed out without copying. The iterators walk the cached
+    # list, which holds the whole file with its journal replayed; only stream_tasks reads it in pieces
+
+    def load_all(self) -> List[Task]:
+        return list(self.repository.records())
+
+    def iter_tasks(self) -> Iterator[Task]:
+        yield from self.repository.records()
+
+    def stream_tasks(self) -> Iterator[Task]:
+        return self.repository.stream_records()
+
+    def iter_range(self, start: int, stop: int) -> Iterator[Task]:
+        yield from self.repository.records()[start:stop]
+
+    def save_all(self, records: List[Task]) -> None:
+        self.repository.commit(list(records))
+
+    def count(self) -> int:
+        return len(self.repository.records())
+
+    def get_task(self, task_id: str) -> Optional[Task]:
+        return self.repository.get(task_id)
+
+    def get_tasks(self, task_ids: Iterable[str]) -> List[Task]:
+        return self.repository.get_many(task_ids)
+
+    def has_description(self, description: str) -> bool:
+        return self.repository.has_description(description)
+
+    def insert_task(self, task: Task) -> None:
+        self.repository.insert(task)
+
+    def insert_tasks(self, tasks: List[Task]) -> None:
+        self.repository.insert_many(list(tasks))
+
+    def update_task(self, task_id: str, fields: Dict[str, Any]) -> bool:
+        return self.repository.update(task_id, fields)
+
+    def update_tasks(self, changes: Dict[str, Dict[str, Any]]) -> List[str]:
+        return self.repository.update_many(changes)
+
+    def delete_tasks(self, task_ids: List[str]) -> List[str]:
+        return self.repository.delete(task_ids)
+
+    def clear(self) -> int:
+        task_count = len(self.repository.records())
+        if task_count:
+            self.repository.commit([])
+        return task_count
+
+    def filter_tasks(
+        self, field: str, values: List[str], contains: bool = False
+    ) -> List[Task]:
+        if field not in TASK_FIELDS:
+            raise ValueError(f"Unknown task field {field}")
+
+        lowered = [value.lower() for value in values]
+        records = self.repository.records()
+
+        if contains:
+            return [
+                task for task in records
+                if any(value in task.value(field).lower() for value in lowered)
+            ]
+
+        wanted = set(lowered)
+        return [task for task in records if task.value(field).lower() in wanted]
+
+    def filter_time_ranges(self, ranges: List[Tuple[datetime, datetime]]) -> List[Task]:
+        # compares datetimes directly; no Time string is parsed or formatted per task
+        return [
+            task for task in self.repository.records()
+            if task.due is not None and any(start <= task.due < end for start, end in ranges)
+        ]
+
+    def cache_stats(self) -> Dict[str, int]:
+        return self.repository.cache_stats()
+
+    def signature(self) -> str:
+        return self.repository.signature()
+
+    def add_compaction_listener(self, listener: Callable[[str, str], None]) -> None:
+        self.repository.add_compaction_listener(listener)
+
+
+class SQLiteBackend(StorageBackend):
+    """Store tasks in a SQLite table indexed on ID, Tag, Priority, Status and Time."""
+
+    SCHEMA = (
+        """CREATE TABLE IF NOT EXISTS tasks (
+            seq INTEGER PRIMARY KEY AUTOINCREMENT,
+            ID TEXT NOT NULL UNIQUE,
+            Time TEXT NOT NULL DEFAULT '',
+            Description TEXT NOT NULL DEFAULT '',
+            Priority TEXT NOT NULL DEFAULT '' COLLATE NOCASE,
+            Tag TEXT NOT NULL DEFAULT '' COLLATE NOCASE,
+            Email TEXT NOT NULL DEFAULT '',
+            Status TEXT NOT NULL DEFAULT '' COLLATE NOCASE
+        )""",
+        "CREATE INDEX IF NOT EXISTS idx_tasks_tag ON tasks (Tag)",
+        "CREATE INDEX IF NOT EXISTS idx_tasks_priority ON tasks (Priority)",
+        "CREATE INDEX IF NOT EXISTS idx_tasks_status ON tasks (Status)",
+        "CREATE INDEX IF NOT EXISTS idx_tasks_time ON tasks (Time)",
+        "CREATE INDEX IF NOT EXISTS idx_tasks_description ON tasks (Description)",
+    )
+
+    # columns that may be used in a WHERE clause; guards against SQL injection through field names
+    FILTER_FIELDS = frozenset(TASK_FIELDS)
+
+    # bound parameters per statement; SQLite's default limit is 999
+    MAX_PARAMS = 900
+
+    def __init__(self, path: Path = SQLITE_DB_PATH):
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+
+        self._conn = sqlite3.connect(self.path)
+        self._conn.row_factory = sqlite3.Row
+        self._conn.execute("PRAGMA journal_mode=WAL")
+
+        with self._conn:
+            for statement in self.SCHEMA:
+                self._conn.execute(statement)
+
+    @staticmethod
+    def _to_task(row: sqlite3.Row) -> Task:
+        """convert a tasks row into a Task"""
+        return Task.from_dict({field: row[field] for field in TASK_FIELDS})
+
+    def _select(self, where: str = "", params: Tuple[Any, ...] = ()) -> List[Task]:
+        """run a SELECT over tasks keeping insertion order"""
+        columns = ", ".join(TASK_FIELDS)
+        query = f"SELECT {columns} FROM tasks {where} ORDER BY seq"
+        return [self._to_task(row) for row in self._conn.execute(query, params)]
+
+    def load_all(self) -> List[Task]:
+        return self._select()
+
+    def iter_tasks(self) -> Iterator[Task]:
+        columns = ", ".join(TASK_FIELDS)
+        # a separate cursor streams rows, so memory does not grow with the store size
+        cursor = self._conn.cursor()
+        try:
+            for row in cursor.execute(f"SELECT {columns} FROM tasks ORDER BY seq"):
+                yield self._to_task(row)
+        finally:
+            cursor.close()
+
+    def iter_range(self, start: int, stop: int) -> Iterator[Task]:
+        columns = ", ".join(TASK_FIELDS)
+        cursor = self._conn.cursor()
+        try:
+            query = f"SELECT {columns} FROM tasks ORDER BY seq LIMIT ? OFFSET ?"
+            for row in cursor.execute(query, (max(stop - start, 0), start)):
+                yield self._to_task(row)
+        finally:
+            cursor.close()
+
+    def save_all(self, records: List[Task]) -> None:
+        with self._conn:
+            self._conn.execute("DELETE FROM tasks")
+            self._insert_many(records)
+
+    def _insert_many(self, records: List[Task]) -> None:
+        columns = ", ".join(TASK_FIELDS)
+        placeholders = ", ".join("?" for _ in TASK_FIELDS)
+        self._conn.executemany(
+            f"INSERT OR REPLACE INTO tasks ({columns}) VALUES ({placeholders})",
+            (tuple(task.value(field) for field in TASK_FIELDS) for task in records),
+        )
+
+    def count(self) -> int:
+        return self._conn.execute("SELECT COUNT(*) FROM tasks").fetchone()[0]
+
+    def get_task(self, task_id: str) -> Optional[Task]:
+        tasks = self._select("WHERE ID = ?", (task_id,))
+        return tasks[0] if tasks else None
+
+    def get_tasks(self, task_ids: Iterable[str]) -> List[Task]:
+        columns = ", ".join(TASK_FIELDS)
+        unique_ids = list(dict.fromkeys(task_ids))
+        rows: List[Tuple[int, Task]] = []
+
+        # stay under SQLite's bound parameter limit
+        for start in range(0, len(unique_ids), self.MAX_PARAMS):
+            chunk = unique_ids[start:start + self.MAX_PARAMS]
+            placeholders = ", ".join("?" for _ in chunk)
+            query = f"SELECT seq, {columns} FROM tasks WHERE ID IN ({placeholders})"
+            rows.extend((row["seq"], self._to_task(row)) for row in self._conn.execute(query, chunk))
+
+        rows.sort(key=lambda row: row[0])
+        return [task for _, task in rows]
+
+    def has_description(self, description: str) -> bool:
+        row = self._conn.execute(
+            "SELECT 1 FROM tasks WHERE Description = ? LIMIT 1", (description,)
+        ).fetchone()
+        return row is not None
+
+    def insert_task(self, task: Task) -> None:
+        self.insert_tasks([task])
+
+    def insert_tasks(self, tasks: List[Task]) -> None:
+        with self._conn:
+            self._insert_many(tasks)
+
+    def update_task(self, task_id: str, fields: Dict[str, Any]) -> bool:
+        return bool(self.update_tasks({task_id: fields}))
+
+    def update_tasks(self, changes: Dict[str, Dict[str, Any]]) -> List[str]:
+        updated: List[str] = []
+
+        # every update runs in one transaction
+        with self._conn:
+            for task_id, fields in changes.items():
+                columns = [field for field in fields if field in self.FILTER_FIELDS and field != "ID"]
+                if not columns:
+                    if self.get_task(task_id) is not None:
+                        updated.append(task_id)
+                    continue
+
+                assignments = ", ".join(f"{field} = ?" for field in columns)
+                params = tuple(fields[field] for field in columns) + (task_id,)
+                cursor = self._conn.execute(f"UPDATE tasks SET {assignments} WHERE ID = ?", params)
+                if cursor.rowcount:
+                    updated.append(task_id)
+        return updated
+
+    def delete_tasks(self, task_ids: List[str]) -> List[str]:
+        unique_ids = list(dict.fromkeys(task_ids))
+        deleted: List[str] = []
+
+        with self._conn:
+            for task_id in unique_ids:
+                cursor = self._conn.execute("DELETE FROM tasks WHERE ID = ?", (task_id,))
+                if cursor.rowcount:
+                    deleted.append(task_id)
+        return deleted
+
+    def clear(self) -> int:
+        with self._conn:
+            cursor = self._conn.execute("DELETE FROM tasks")
+        return cursor.rowcount
+
+    def filter_tasks(
+        self, field: str, values: List[str], contains: bool = False
+    ) -> List[Task]:
+        if field not in self.FILTER_FIELDS:
+            raise ValueError(f"Unknown task field {field}")
+        if not values:
+            return []
+
+        if contains:
+            # substring match only reads the (indexed) column, never the whole table row
+            where = " OR ".join(f"instr(lower({field}), ?) > 0" for _ in values)
+            return self._select(f"WHERE {where}", tuple(value.lower() for value in values))
+
+        placeholders = ", ".join("?" for _ in values)
+        return self._select(f"WHERE {field} IN ({placeholders})", tuple(values))
+
+    def signature(self) -> str:
+        # the WAL file changes on every commit, the main file on every checkpoint
+        stats: List[Optional[Tuple[int, int, int]]] = []
+        for path in (self.path, self.path.with_name(f"{self.path.name}-wal")):
+            try:
+                stat = os.stat(path)
+                stats.append((stat.st_mtime_ns, stat.st_size, stat.st_ino))
+            except FileNotFoundError:
+                stats.append(None)
+        return repr(tuple(stats))
+
+    def filter_time_ranges(self, ranges: List[Tuple[datetime, datetime]]) -> List[Task]:
+        if not ranges:
+            return []
+
+        # Time is saved as an ISO string, so formatted bounds sort the same as the datetimes
+        where = " OR ".join("(Time >= ? AND Time < ?)" for _ in ranges)
+        params = tuple(str(bound) for time_range in ranges for bound in time_range)
+        return self._select(f"WHERE {where}", params)
+
+
+def get_storage_backend(name: str = STORAGE_BACKEND) -> StorageBackend:
+    """Create the storage backend selected in todo_app.config.
+    args:
+        name: backend name; json or sqlite
+    return:
+        StorageBackend: the configured storage engine
+    """
+    if name == "json":
+        return JSONBackend()
+
+    if name == "sqlite":
+        return SQLiteBackend()
+
+    raise ValueError(f"Unknown storage backend {name}. Valid backends are; json and sqlite")
@@ -1,44 +1,339 @@
-import re
 from datetime import datetime
-from typing import Tuple, List, Any
-from todo_app.services.database_service import DatabaseService
+from itertools import islice
+from typing import AbstractSet, Tuple, List, Any, Dict, Iterator, Optional
+from todo_app.services.database_service import LazyDatabaseService
 from todo_app.parsers.validator import Validator
-from todo_app.utilis.utils import convert_datestring
+from todo_app.models.task import Priority, Status, Task
+from todo_app.indexes.due import DueIndex
+from todo_app.indexes.inverted import tokenize
+from todo_app.indexes.stats import StatsIndex
+from todo_app.indexes.tags import SUBTREE_SUFFIX, TAG_SEPARATOR, TagIndex
+from todo_app.indexes.text import TextIndex
+from todo_app.indexes.trigram import TrigramIndex
+from todo_app.config import FUZZY_THRESHOLD, PARALLEL_MIN_TASKS, PARALLEL_WORKERS
+from todo_app.services.paging import Page, due_key, paginate
+from todo_app.services.parallel import parallel_scan, use_parallel
+from todo_app.services.query import (
+    CHECK_RATIO, AndQuery, DueQuery, DueRange, KeywordQuery, MatchAll, PriorityQuery, Query, QueryPlan,
+    StatusQuery, TagQuery, all_of, cache_key, day_range, due_between, due_within, make_query, overdue_query,
+    parse_query, plan_query, run_plan,
+)
+from todo_app.services.views import VIEW_NAME_PATTERN, SavedView, ViewIndex, split_view_query
+
+# keyword search modes; any and all use the inverted index, substring scans every task
+SEARCH_MODES = ("any", "all", "substring")
+
+# number of task IDs fetched from storage at a time while walking the due index
+DUE_WALK_BATCH = 256
 
 class TaskService:
-    db_service = DatabaseService()
+    # built on first use; subclasses may set their own DatabaseService
+    db_service = LazyDatabaseService()
     validator = Validator()
+    # worker processes for scans no index can answer, and the store size from which they are used
+    parallel_workers = PARALLEL_WORKERS
+    parallel_min_tasks = PARALLEL_MIN_TASKS
+
+    @staticmethod
+    def _day_ranges(time_list: list[str]) -> Tuple[bool, str, List[DueRange]]:
+        """convert time filters to whole-day [midnight, next midnight) datetime ranges.
+            args:
+                time_list: List containing time filters e.g. ['tomorrow', '23/10/2025']
+            return:
+                (True | False, empty string | error message, List of (start, end) | empty list)
+        """
+        try:
+            # skip empty strings
+            return True, "", [day_range(value) for value in time_list if value.strip()]
+        except ValueError as e:
+            return False, str(e), []  # if conversion fails
+
+    @classmethod
+    def build_query(
+        cls,
+        tag_list: Optional[list[str]] = None,
+        priority_list: Optional[list[str]] = None,
+        status_list: Optional[list[str]] = None,
+        time_list: Optional[list[str]] = None,
+        keyword_list: Optional[list[str]] = None,
+        expression: str = "",
+        due_from: str = "",
+        due_to: str = "",
+        overdue: bool = False,
+        within: str = "",
+    ) -> Tuple[bool, str, Query]:
+        """Combine list command filters and a query string into one query; every part must match.
+            args:
+                tag_list: tag filters; a task matches if its tag contains any of them
+                priority_list: priority filters e.g. ['high', 'mild']
+                status_list: status filters e.g. ['incomplete']
+                time_list: time filters e.g. ['tomorrow', '23/10/2025']; whole days
+                keyword_list: keywords; a task matches if it contains any of them
+                expression: query string e.g. 'status:incomplete and (tag:work or not priority:low)'
+                due_from, due_to: inclusive due time bounds e.g. 'today', '23/10/2025 18:00'
+                overdue: only incomplete tasks whose due time has passed
+                within: only tasks due between now and this duration from now e.g. '1 hour', '7 days'
+            return:
+                (True | False, empty string | error message, Query)
+        """
+        filters = (
+            ("tag", tag_list), ("priority", priority_list), ("status", status_list),
+            ("due", time_list), ("keyword", keyword_list),
+        )
+        try:
+            parts = [
+                make_query(name, values) for name, values in filters
+                if values and any(value.strip() for value in values)
+            ]
+            if due_from.strip() or due_to.strip():
+                parts.append(due_between(due_from.strip(), due_to.strip()))
+            if overdue:
+                parts.append(overdue_query())
+            if within.strip():
+                parts.append(due_within(within.strip()))
+            if expression.strip():
+                parts.append(parse_query(expression))
+        except ValueError as e:
+            return False, str(e), MatchAll()
+
+        return True, "", all_of(*parts)
+
+    @classmethod
+    def iter_query(cls, query: Query) -> Tuple[QueryPlan, Iterator[Task]]:
+        """Plan a query against the task indexes and stream its results in insertion order.
+            args:
+                query: query built with build_query or parse_query
+            return:
+                (QueryPlan, Iterator[Task]): the plan and a generator of matching tasks;
+                the plan's result count is set once the generator is exhausted
+        """
+        backend = cls.db_service.backend
+        total = backend.count()
+        plan = plan_query(query, cls.db_service.indexes, total)
+
+        # a full scan of a large store is spread over the worker processes when they are enabled
+        workers = cls.parallel_workers
+        if plan.candidates is None and plan.residual is not None and use_parallel(total, workers, cls.parallel_min_tasks):
+            task_ids = parallel_scan(backend, plan.residual, workers)
+            if task_ids is not None:
+                plan.steps[-1] = (f"scan all tasks in {workers} processes", len(task_ids))
+                plan.candidates, plan.residual = set(task_ids), None
+
+        return plan, run_plan(plan, backend.get_tasks, backend.iter_tasks)
+
+    @classmethod
+    def page_tasks(cls, plan: QueryPlan, tasks: Iterator[Task], page: Page) -> List[Task]:
+        """Sort and slice the results of a planned query.
+            A time-sorted page is read straight from the due index in due order when that
+            reaches the page sooner than collecting every match; the walk stops as soon as
+            the page is full.
+            args:
+                plan: plan returned by plan_query
+                tasks: the plan's matching tasks in insertion order, e.g. from iter_query
+                page: sort and slice to apply
+            return:
+                List[Task]: tasks of the page
+            raises:
+                ValueError: if page.after names no saved task
+        """
+        after = cls._cursor(page)
+        if page.sort == "time" and cls._walk_due_index(plan, page):
+            ordered = cls._iter_by_due(plan, after)
+            stop = None if page.limit is None else page.offset + page.limit
+            return list(islice(ordered, page.offset, stop))
+
+        return paginate(tasks, page, after)
+
+    @classmethod
+    def _walk_due_index(cls, plan: QueryPlan, page: Page) -> bool:
+        """whether walking the due index in order is cheaper than sorting the plan's candidates"""
+        candidates = plan.candidates
+        if candidates is None:
+            return True  # the plan scans every task anyway
+        if not candidates:
+            return False
+
+        # in due order a candidate turns up about every total / candidates IDs, so filling
+        # the page visits about needed * total / candidates IDs of the index
+        total = cls.db_service.backend.count()
+        needed = total if page.limit is None else page.offset + page.limit
+        return needed * total <= CHECK_RATIO * len(candidates) ** 2
+
+    @classmethod
+    def _iter_by_due(cls, plan: QueryPlan, after: Optional[Task] = None) -> Iterator[Task]:
+        """yield the tasks selected by a plan earliest due first, resuming after a cursor task"""
+        backend = cls.db_service.backend
+        index = cls.db_service.indexes.get(DueIndex.name)
+        assert isinstance(index, DueIndex)
+        candidates, residual = plan.candidates, plan.residual
+
+        def selected(task: Task) -> bool:
+            return residual is None or residual.matches(task)
+
+        # the due index keys tasks by (due epoch, ID); due_key adds a leading 0 for dated tasks
+        cursor = None if after is None else due_key(after)
+        dated = cursor is None or cursor[0] == 0
+        if dated:
+            task_ids = index.iter_ids(None if cursor is None else cursor[1:])
+            if candidates is not None:
+                task_ids = (task_id for task_id in task_ids if task_id in candidates)
+            while True:
+                batch = list(islice(task_ids, DUE_WALK_BATCH))
+                if not batch:
+                    break
+                # get_tasks returns insertion order; put the batch back in due order
+                by_id = {task.id: task for task in backend.get_tasks(batch)}
+                for task_id in batch:
+                    task = by_id.get(task_id)
+                    if task is not None and selected(task):
+                        yield task
+
+        # tasks without a due time sort last by ID; they are only scanned for when some exist
+        if backend.count() > len(index):
+            undated = (
+                task for task in backend.iter_tasks()
+                if task.due is None and (candidates is None or task.id in candidates) and selected(task)
+                and (cursor is None or due_key(task) > cursor)
+            )
+            yield from sorted(undated, key=due_key)
+
+    @classmethod
+    def cached_query(cls, query: Query, page: Optional[Page] = None) -> List[Dict[str, Any]]:
+        """Return the tasks matching a query, from the query cache when the store has not changed since.
+            args:
+                query: query built with build_query or parse_query
+                page: optional sort order and slice of the result
+            return:
+                List[Dict[str, Any]]: matching tasks as dictionaries
+        """
+        def compute() -> List[Dict[str, Any]]:
+            plan, tasks = cls.iter_query(query)
+            if page is not None:
+                tasks = iter(cls.page_tasks(plan, tasks, page))
+            return [task.to_dict() for task in tasks]
+
+        return cls.db_service.query_cache.rows(("query", cache_key(query), page), compute)
+
+    @classmethod
+    def query_tasks(cls, query: Query, page: Optional[Page] = None) -> Tuple[bool, str, List[Any]]:
+        """Return the saved tasks matching a query.
+            args:
+                query: query built with build_query or parse_query
+                page: optional sort order and slice of the result; insertion order and every match by default
+            return:
+                (bool, str, List[Any]):
+                    - (True | False, empty string | error message, List of tasks | empty list)
+        """
+        # check if it's empty
+        if not cls.db_service.backend.count():
+            return True, "No record found - Memory is Empty", []
+
+        try:
+            result = cls.cached_query(query, page)
+
+            if not result:
+                return False, f"No search result found for {query.describe()}", []
+
+            return True, "", result
+
+        except Exception as e:
+            return False, str(e), []
+
+    @classmethod
+    def explain_query(cls, query: Query) -> Tuple[bool, str, List[str]]:
+        """Run a query and describe how it was answered.
+            args:
+                query: query built with build_query or parse_query
+            return:
+                (bool, str, List[str]):
+                    - (True | False, empty string | error message, plan lines with candidate counts | empty list)
+        """
+        try:
+            plan, tasks = cls.iter_query(query)
+            for _ in tasks:
+                pass  # run the plan to count the results
+            return True, "", plan.explain()
+
+        except Exception as e:
+            return False, str(e), []
+
+    @classmethod
+    def iter_filtered_tasks(
+        cls,
+        tag_list: Optional[list[str]] = None,
+        priority_list: Optional[list[str]] = None,
+        status_list: Optional[list[str]] = None,
+        time_list: Optional[list[str]] = None,
+    ) -> Tuple[bool, str, Iterator[Task]]:
+        """Stream saved tasks matching every given filter, one task at a time.
+            Uses the same filters as the list command; a task must match all given filters.
+            args:
+                tag_list: tag filters; a task matches if its tag contains any of them
+                priority_list: priority filters e.g. ['high', 'mild']
+                status_list: status filters e.g. ['incomplete']
+                time_list: time filters e.g. ['tomorrow', '23/10/2025']
+            return:
+                (bool, str, Iterator):
+                    - (True | False, empty string | error message, generator of tasks | empty iterator)
+        """
+        # validate every filter before streaming anything
+        status, message, query = cls.build_query(tag_list, priority_list, status_list, time_list)
+        if not status:
+            return status, message, iter(())
+
+        # an unfiltered stream reads the store in pieces; filters are answered from the indexes
+        if isinstance(query, MatchAll):
+            return True, "", cls.db_service.backend.stream_tasks()
+
+        _, tasks = cls.iter_query(query)
+        return True, "", tasks
+
+    @classmethod
+    def _run_filter(cls, query: Query, filters: list[str]) -> Tuple[bool, str, List[Any]]:
+        """run a single-field filter query"""
+        filter_result = cls.cached_query(query)
+
+        if not filter_result:
+            return False, f"No search result found for {' '.join(filters)}", []
+
+        # return True and result if task is found
+        return True, "", filter_result
     
     @classmethod
-    def keyword_search(cls, keyword: list[str]) -> Tuple[bool, str, List[Any]]:
+    def keyword_search(
+        cls, keyword: list[str], mode: str = "any", page: Optional[Page] = None,
+    ) -> Tuple[bool, str, List[Any]]:
         """Search todo-app.json by keywords.
             args:
                 keyword: list of word to perform the search query by eg. "meeting"
+                mode: any - tasks containing any keyword; all - tasks containing every keyword;
+                      substring - scan descriptions, tags and emails for the keywords as plain text
+                      e.g. 'meet' finds 'meeting'
+                page: optional sort order and slice of the result
             return:
                 (bool, str, List):
                     - (True | False, empty message | error message, List of search result | empty list)
         """
+        if mode not in SEARCH_MODES:
+            return False, f"Invalid search mode {mode}. Valid modes are; {', '.join(SEARCH_MODES)}", []
 
-        # create a regex valid search word from keyword and a regex searcher
-        search_string = "|".join(keyword)
-        search_pattern = re.compile(search_string, re.IGNORECASE)
-
-        # read todo-app.json
-        todo_records = cls.db_service.read_json()
-
-        # check if todo_records is empty
-        if not todo_records:
+        # check if the store is empty
+        if not cls.db_service.backend.count():
            return True, "No record found - memory is Empty", []
 
-        # initializing a list to store search result
-        search_result = []
-
-        # search todo-app.json based on keyword
         try:
-            for task in todo_records:
-                if any(search_pattern.search(str(value)) for value in task.values()):
-                    # store task with keyword to search_result
-                    search_result.append(task)
+            # keywords without a word character e.g. '++' cannot be looked up in the index
+            if mode == "substring" or not any(tokenize(word) for word in keyword):
+                def substring_search() -> List[Dict[str, Any]]:
+                    tasks = cls._substring_search(keyword)
+                    if page is not None:
+                        tasks = iter(paginate(tasks, page, cls._cursor(page)))
+                    return [task.to_dict() for task in tasks]
+
+                key = ("substring", *sorted({word.lower() for word in keyword}), page)
+                search_result = cls.db_service.query_cache.rows(key, substring_search)
+            else:
+                search_result = cls.cached_query(KeywordQuery(tuple(keyword), match_all=mode == "all"), page)
 
             if not search_result:
                 # return an error message is no task has the keyword
@@ -51,6 +346,69 @@ class TaskService:
         except Exception as e:
             return False, str(e), []
 
+    @classmethod
+    def fuzzy_search(
+        cls, keyword: list[str], threshold: float = FUZZY_THRESHOLD, page: Optional[Page] = None,
+    ) -> Tuple[bool, str, List[Any]]:
+        """Search task descriptions and tags for words similar to the keywords, best match first.
+            args:
+                keyword: list of possibly misspelt words e.g. ['tozr', 'bok']
+                threshold: smallest word similarity between 0 and 1 that counts as a match; higher is stricter
+                page: optional slice of the ranked result, or a sort order replacing the ranking
+            return:
+                (bool, str, List):
+                    - (True | False, success message | error message, List of search result | empty list)
+        """
+        if not 0 < threshold <= 1:
+            return False, f"Invalid similarity threshold {threshold}; it must be above 0 and at most 1.", []
+
+        # check if the store is empty
+        if not cls.db_service.backend.count():
+            return True, "No record found - memory is Empty", []
+
+        if not any(tokenize(word) for word in keyword):
+            return False, f"No words to search for in {' '.join(keyword)}", []
+
+        def rank() -> List[Dict[str, Any]]:
+            index = cls.db_service.indexes.get(TrigramIndex.name)
+            assert isinstance(index, TrigramIndex)
+            scores = index.search(keyword, threshold)
+            # get_tasks returns insertion order, which breaks ties between equal scores
+            tasks = sorted(cls.db_service.backend.get_tasks(scores), key=lambda task: -scores[task.id])
+            if page is not None:
+                tasks = paginate(tasks, page, cls._cursor(page))
+            return [task.to_dict() for task in tasks]
+
+        try:
+            key = ("fuzzy", threshold, *sorted({word.lower() for word in keyword}), page)
+            search_result = cls.db_service.query_cache.rows(key, rank)
+
+            if not search_result:
+                return False, f"No task found similar to {' '.join(keyword)}", []
+
+            return True, f"Found {len(search_result)} task(s) similar to {' '.join(keyword)} ...", search_result
+
+        # catch and return error
+        except Exception as e:
+            return False, str(e), []
+
+    @classmethod
+    def _substring_search(cls, keyword: list[str]) -> Iterator[Task]:
+        """scan the searchable fields of every saved task for any keyword as literal, case-insensitive text"""
+        index = cls.db_service.indexes.get(TextIndex.name)
+        assert isinstance(index, TextIndex)
+        yield from cls.db_service.backend.get_tasks(index.scan(keyword))
+
+    @classmethod
+    def _cursor(cls, page: Page) -> Optional[Task]:
+        """the task named by page.after; raises ValueError if there is no such task"""
+        if not page.after:
+            return None
+        after = cls.db_service.backend.get_task(page.after)
+        if after is None:
+            raise ValueError(f"No task found with ID {page.after} to continue after.")
+        return after
+
     @classmethod
     def tag_filter(cls, tag_list: list[str]) ->Tuple[bool, str, List[Any]]:
         """Filter todo-app.json by task tag using keywords.
@@ -62,31 +420,13 @@ class TaskService:
                     - (False, error message, empty list) if no matches or error
         """
 
-        # load/read todo-app.json
-        todo_records = cls.db_service.read_json()
-
         # check if it's empty
-        if not todo_records:
+        if not cls.db_service.backend.count():
             return True, "No record found - Memory is Empty", []
 
-        # create a valid regex filter string from tag_list and tag filter
-        filter_string = "|".join(tag_list)
-        filter_pattern = re.compile(filter_string, re.IGNORECASE)
-
-        # initialize list to store filter result
-        filter_result = []
-
-        # filter todo_records by tag value
+        # filter saved tasks whose tag contains any of the tag filters
         try:
-            for task in todo_records:
-                if filter_pattern.search(task["Tag"]):  # filter by tag and store matching task
-                    filter_result.append(task)
-
-            if not filter_result:
-                return False, f"No search result found for {" ".join(tag_list)}", []
-
-            # return True and result if task is found
-            return True, "", filter_result   
+            return cls._run_filter(TagQuery(tuple(tag for tag in tag_list if tag)), tag_list)
 
         except Exception as e:
             return False, str(e), []
@@ -102,45 +442,20 @@ class TaskService:
                     - (False, error message, empty list) if no matches or error
         """
 
-        # load/read todo-app.json
-        todo_records = cls.db_service.read_json()
-
         # check if it's empty
-        if not todo_records:
+        if not cls.db_service.backend.count():
             return True, "No record found - memory is Empty", []
 
         # normalize and validate time
-        converted_time = []
-        for value in time_list:
-            if not value.strip():
-                continue # skip empty string
-            status, result = convert_datestring(value)
-            if not status:
-                assert isinstance(result, str)
-                return status, result, []  # if conversion fails
-
-            # conversion successful
-            assert isinstance(result, datetime)
-            converted_time.append(str(result))
-
-        # create a valid regex filter string from time_list and time filter
-        filter_string = "|".join([f"^{time.split()[0]}" for time in converted_time])
-        filter_pattern = re.compile(filter_string, re.IGNORECASE)
-
-        # initialize list to store filter result
-        filter_result = []
+        status, message, day_ranges = cls._day_ranges(time_list)
+        if not status:
+            return status, message, []  # if conversion fails
 
-        # filter todo_records by tag value
+        # filter saved tasks by time range through the sorted due-time index
         try:
-            for task in todo_records:
-                if filter_pattern.search(task["Time"]):  # filter by tag and store matching task
-                    filter_result.append(task)
-
-            if not filter_result:
-                return False, f"No search result found for {' '.join(time_list)}", []
-
-            # return True and result if task is found
-            return True, '', filter_result
+            # no time given matches every task
+            query = DueQuery(tuple(day_ranges), ", ".join(time_list)) if day_ranges else MatchAll()
+            return cls._run_filter(query, time_list)
 
         except Exception as e:
             return False, str(e), []
@@ -155,11 +470,8 @@ class TaskService:
                     - (True, empty string, List[dict]) if matches found
                     - (False, error message, empty list) if no matches or error
         """
-        # load/read todo-app.json
-        todo_records = cls.db_service.read_json()
-
         # check if it's empty
-        if not todo_records:
+        if not cls.db_service.backend.count():
             return True, "No record found - memory is Empty", []
 
         # check if input priority is valid
@@ -168,24 +480,10 @@ class TaskService:
             if not status:
                 return status, result, []  
 
-        # create a valid regex filter string from priority_list and priority filter
-        filter_string = "|".join(priority_list)
-        filter_pattern = re.compile(filter_string, re.IGNORECASE)
-
-        # initialize list to store filter result
-        filter_result = []
-
-        # filter todo_records by tag value
+        # filter saved tasks by priority level
         try:
-            for task in todo_records:
-                if filter_pattern.search(task["Priority"]):  # filter by priority and store matching task
-                    filter_result.append(task)
-
-            if not filter_result:
-                return False, f"No search result found for {' '.join(priority_list)}", []
-
-            # return True and result if task is found
-            return True, "", filter_result
+            priorities = tuple(dict.fromkeys(Priority.parse(priority) for priority in priority_list))
+            return cls._run_filter(PriorityQuery(priorities), priority_list)
 
         except Exception as e:
             return False, str(e), []
@@ -200,11 +498,8 @@ class TaskService:
                     - (True, empty string, List[dict]) if matches found
                     - (False, error message, empty list) if no matches or error
         """
-        # load/read todo-app.json
-        todo_records = cls.db_service.read_json()
-
         # check if it's empty
-        if not todo_records:
+        if not cls.db_service.backend.count():
             return True, "No record found - memory is Empty", []
 
         # check if input status is valid
@@ -213,24 +508,238 @@ class TaskService:
             if not status:
                 return status, message, []
   
-        # create a valid regex filter string from status_list
-        filter_string = "|".join(rf"^{re.escape(status)}$" for status in status_list)
-        filter_pattern = re.compile(filter_string, re.IGNORECASE)
+        # filter saved tasks by status
+        try:
+            statuses = tuple(dict.fromkeys(Status.parse(value) for value in status_list))
+            return cls._run_filter(StatusQuery(statuses), status_list)
+
+        except Exception as e:
+            return False, str(e), []
+
+    @classmethod
+    def stats(cls, recompute: bool = False, now: Optional[datetime] = None) -> Tuple[bool, str, Dict[str, Any]]:
+        """Count saved tasks by status, priority, tag and assignee, and count overdue tasks.
+            The counts are kept up to date on every change, so reading them does not touch the tasks.
+            args:
+                recompute: count every saved task again and check the kept counts against the result;
+                           the kept counts are replaced if they differ
+                now: time overdue tasks are counted against; the current time by default
+            return:
+                (bool, str, Dict[str, Any]):
+                    - (True | False, empty string | verification message | error message, counts | empty dict)
+                      counts e.g. {"total": 8, "overdue": 2, "status": {"Incomplete": 7, "Complete": 1}, ...}
+        """
+        now = now or datetime.now()
+        try:
+            index = cls.db_service.indexes.get(StatsIndex.name)
+            assert isinstance(index, StatsIndex)
+            if not recompute:
+                return True, "", index.snapshot(now)
+
+            counted = StatsIndex()
+            for task in cls.db_service.backend.iter_tasks():
+                counted.add(task)
+
+            message = f"Counters verified against {counted.total} task(s)."
+            if counted.to_state() != index.to_state():
+                cls.db_service.indexes.rebuild([StatsIndex.name])
+                message = f"Counters were out of date and have been recomputed from {counted.total} task(s)."
+            return True, message, counted.snapshot(now)
+
+        except Exception as e:
+            return False, str(e), {}
+
+    @classmethod
+    def _tag_index(cls) -> TagIndex:
+        """the current tag index; loaded from its sidecar when that is current, so the store is not read"""
+        index = cls.db_service.indexes.get(TagIndex.name)
+        assert isinstance(index, TagIndex)
+        return index
+
+    @classmethod
+    def tag_counts(cls, root: str = "") -> Tuple[bool, str, List[Dict[str, Any]]]:
+        """Count tasks per tag, with the tasks of every tag below it in the hierarchy rolled up.
+            args:
+                root: only count this tag and the tags below it e.g. 'work'; every tag by default
+            return:
+                (bool, str, List[Dict[str, Any]]):
+                    - (True | False, empty string | error message,
+                       tags e.g. [{"tag": "work", "tasks": 1, "subtree": 3}, {"tag": "work/release", ...}] | empty list)
+        """
+        try:
+            tree = cls._tag_index().tree(root)
+            if not tree:
+                return False, f"No task found with tag {root}" if root else "No record found - Memory is Empty", []
+            return True, "", [{"tag": tag, "tasks": own, "subtree": total} for tag, own, total in tree]
+
+        except Exception as e:
+            return False, str(e), []
+
+    @classmethod
+    def complete_tags(cls, incomplete: str) -> List[str]:
+        """Return saved tags starting with incomplete for shell completion, with the subtree filter
+        e.g. 'work/*' of every level above a matching tag.
+        """
+        prefix = incomplete.lower()
+        completions: Dict[str, None] = {}
+        for tag in cls._tag_index().tags(prefix):
+            levels = tag.split(TAG_SEPARATOR)
+            for depth in range(1, len(levels)):
+                level = TAG_SEPARATOR.join(levels[:depth])
+                if level.startswith(prefix):
+                    completions[level + SUBTREE_SUFFIX] = None
+            completions[tag] = None
+        return sorted(tag for tag in completions if tag)
+
+    @classmethod
+    def complete_ids(cls, incomplete: str) -> List[str]:
+        """Return saved task IDs starting with incomplete for shell completion."""
+        return cls._tag_index().task_ids(incomplete)
+
+    @classmethod
+    def _view_index(cls) -> ViewIndex:
+        """the current saved view index"""
+        index = cls.db_service.indexes.get(ViewIndex.name)
+        assert isinstance(index, ViewIndex)
+        return index
+
+    @classmethod
+    def save_view(cls, name: str, text: str) -> Tuple[bool, str]:
+        """Save a query under a name; its matching tasks are then kept up to date on every change.
+            args:
+                name: view name of letters, digits, - and _ e.g. 'release'
+                text: query string e.g. 'priority:high status:incomplete tag:release'
+            return:
+                (bool, str):
+                    - (True | False, success message | error message)
+        """
+        if not VIEW_NAME_PATTERN.match(name):
+            return False, f"Invalid view name {name}; use letters, digits, - and _ only."
+
+        try:
+            base, _ = split_view_query(parse_query(text))
+            index = cls._view_index()
+            _, tasks = cls.iter_query(base)
+            view = index.save(name, text, (task.id for task in tasks))
+            cls.db_service.indexes.mark_changed(ViewIndex.name)
+            return True, f"Saved view {name} matching {sum(1 for _ in cls._view_tasks(view))} task(s)."
+
+        except Exception as e:
+            return False, str(e)
+
+    @classmethod
+    def _saved_view(cls, name: str) -> SavedView:
+        """return a saved view by name"""
+        index = cls._view_index()
+        view = index.get(name)
+        if view is None:
+            saved = ', '.join(index.names()) or 'none'
+            raise ValueError(f"No view named {name}. Saved views are; {saved}")
+        return view
+
+    @classmethod
+    def _view_plan(cls, view: SavedView) -> QueryPlan:
+        """plan reading a view: its members narrowed by its due filters as of now
+            A due filter is a range lookup on the due index when that range is small next to
+            the members; otherwise, like any other filter on due times, it is checked on each member.
+        """
+        indexes = cls.db_service.indexes
+        candidates: AbstractSet[str] = frozenset(view.members)
+        plan = QueryPlan(view.query, [(f"view {view.name}", len(candidates))])
+
+        # re-parsed so relative times such as due:overdue are resolved against the current time
+        _, timed = split_view_query(parse_query(view.text))
+        unindexed: List[Query] = []
+        for child in timed.children if isinstance(timed, AndQuery) else (timed,):
+            if isinstance(child, MatchAll):
+                continue
+            task_ids = None
+            if isinstance(child, DueQuery) and candidates:
+                estimate = child.estimate(indexes)
+                if estimate is not None and estimate <= CHECK_RATIO * len(candidates):
+                    task_ids = child.lookup(indexes)
+            if task_ids is not None:
+                candidates = candidates & task_ids
+                plan.steps.append((f"and index {child.describe()}", len(candidates)))
+            else:
+                unindexed.append(child)
+
+        plan.candidates = candidates
+        if unindexed and candidates:
+            plan.residual = all_of(*unindexed)
+        return plan
+
+    @classmethod
+    def _view_tasks(cls, view: SavedView) -> Iterator[Task]:
+        """yield the tasks of a view in insertion order"""
+        backend = cls.db_service.backend
+        return run_plan(cls._view_plan(view), backend.get_tasks, backend.iter_tasks)
+
+    @classmethod
+    def show_view(cls, name: str, page: Optional[Page] = None) -> Tuple[bool, str, List[Any]]:
+        """Return the tasks of a saved view. The view's members are kept current, so this reads
+            only the matching tasks instead of filtering the whole store.
+            args:
+                name: view name e.g. 'release'
+                page: optional sort order and slice of the result; insertion order and every task by default
+            return:
+                (bool, str, List[Any]):
+                    - (True | False, empty string | error message, List of tasks | empty list)
+        """
+        # check if it's empty
+        if not cls.db_service.backend.count():
+            return True, "No record found - Memory is Empty", []
+
+        try:
+            view = cls._saved_view(name)
+            plan = cls._view_plan(view)
+            backend = cls.db_service.backend
+            tasks: Iterator[Task] = run_plan(plan, backend.get_tasks, backend.iter_tasks)
+            if page is not None:
+                tasks = iter(cls.page_tasks(plan, tasks, page))
+            result = [task.to_dict() for task in tasks]
 
-        # initialize list to store filter result
-        filter_result = []
+            if not result:
+                return False, f"No task found in view {name} ({view.text})", []
 
-        # filter todo_records by tag value
+            return True, "", result
+
+        except Exception as e:
+            return False, str(e), []
+
+    @classmethod
+    def list_views(cls) -> Tuple[bool, str, List[Dict[str, Any]]]:
+        """List the saved views with their queries and the number of tasks each one holds.
+            return:
+                (bool, str, List[Dict[str, Any]]):
+                    - (True | False, empty string | error message, views e.g. [{"name": "release", "query": "tag:release", "count": 3}])
+        """
         try:
-            for task in todo_records:
-                if filter_pattern.search(task["Status"]):  # filter by priority and store matching task
-                    filter_result.append(task)
+            views = [cls._saved_view(name) for name in cls._view_index().names()]
+            if not views:
+                return True, "No saved views", []
+            return True, "", [
+                {"name": view.name, "query": view.text, "count": sum(1 for _ in cls._view_tasks(view))}
+                for view in views
+            ]
 
-            if not filter_result:
-                return False, f"No search result found for {' '.join(status_list)}", []
+        except Exception as e:
+            return False, str(e), []
 
-            # return True and result if task is found
-            return True, "", filter_result
+    @classmethod
+    def delete_view(cls, name: str) -> Tuple[bool, str]:
+        """Delete a saved view; the tasks it selected are not touched.
+            args:
+                name: view name e.g. 'release'
+            return:
+                (bool, str):
+                    - (True | False, success message | error message)
+        """
+        try:
+            if not cls._view_index().delete(name):
+                return False, f"No view named {name}"
+            cls.db_service.indexes.mark_changed(ViewIndex.name)
+            return True, f"Deleted view {name}"
 
         except Exception as e:
-            return False, str(e), []
\ No newline at end of file
+            return False, str(e)
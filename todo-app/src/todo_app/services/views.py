@@ -0,0 +1,165 @@
+import json
+import re
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Set, Tuple
+from todo_app.indexes.base import TaskIndex
+from todo_app.indexes.registry import write_json
+from todo_app.models.task import Task
+from todo_app.services.query import AndQuery, DueQuery, NotQuery, OrQuery, Query, all_of, cache_key, parse_query
+
+# view names are used on the command line, so they are kept to letters, digits, - and _
+VIEW_NAME_PATTERN = re.compile(r"^[\w-]+$")
+
+
+def views_path(store_path: Path) -> Path:
+    """Return the file saved view definitions are kept in e.g. database/todo-app.json.views.json"""
+    store_path = Path(store_path)
+    return store_path.parent / f"{store_path.name}.views.json"
+
+
+def query_version(query: Query) -> str:
+    """string form of a parsed query; it changes when a relative time such as 'today' moves on"""
+    return repr(cache_key(query))
+
+
+def _timed(query: Query) -> bool:
+    """whether a query filters on due times anywhere"""
+    if isinstance(query, DueQuery):
+        return True
+    if isinstance(query, (AndQuery, OrQuery)):
+        return any(_timed(child) for child in query.children)
+    if isinstance(query, NotQuery):
+        return _timed(query.child)
+    return False
+
+
+def split_view_query(query: Query) -> Tuple[Query, Query]:
+    """Split a view's query into the filters that hold whatever the time and the due filters.
+        Due filters such as due:overdue resolve against the current time, so the members of a
+        view are kept for the first part only and the second is applied when the view is read.
+    args:
+        query: parsed view query e.g. of 'due:overdue tag:release'
+    return:
+        (Query, Query): the filters without due times and the due filters; MatchAll for an empty part
+    """
+    children = query.children if isinstance(query, AndQuery) else (query,)
+    base = all_of(*(child for child in children if not _timed(child)))
+    timed = all_of(*(child for child in children if _timed(child)))
+    return base, timed
+
+
+@dataclass
+class SavedView:
+    """A named query and the IDs of the saved tasks matching its filters without due times.
+
+    base: the part of query that does not depend on the time; version and members are of base
+    """
+    name: str
+    text: str
+    query: Query
+    base: Query
+    version: str
+    members: Set[str] = field(default_factory=set)
+
+
+class ViewIndex(TaskIndex):
+    """Keep the member IDs of every saved view current as tasks are added, updated and deleted.
+
+    A view's query is checked against each changed task only, so showing a view costs
+    the size of its result, never a filter of the whole store. Members are kept for the
+    filters without due times, which do not change as time passes; due filters are
+    applied through the due index when the view is read. View definitions are user data
+    and live in their own file next to the store; the member sets are an index like any
+    other and are rebuilt from the definitions when the sidecar is missing or out of date.
+    """
+
+    name = "views"
+
+    def __init__(self, path: Path) -> None:
+        self.path = Path(path)
+        self._views: Dict[str, SavedView] = {}
+        for name, text in self._read_definitions().items():
+            self._views[name] = self._parse(name, text)
+
+    def _read_definitions(self) -> Dict[str, str]:
+        """read the saved {name: query} definitions; none when the file does not exist"""
+        try:
+            with open(self.path, "r", encoding="utf-8") as views_file:
+                data = json.load(views_file)
+        except FileNotFoundError:
+            return {}
+        except (OSError, ValueError):
+            return {}
+        return {str(name): str(text) for name, text in data.items()} if isinstance(data, dict) else {}
+
+    def _write_definitions(self) -> None:
+        write_json(self.path, {name: view.text for name, view in self._views.items()})
+
+    @staticmethod
+    def _parse(name: str, text: str) -> SavedView:
+        query = parse_query(text)
+        base, _ = split_view_query(query)
+        return SavedView(name, text, query, base, query_version(base))
+
+    def names(self) -> List[str]:
+        """Return the names of the saved views in the order they were saved."""
+        return list(self._views)
+
+    def get(self, name: str) -> Optional[SavedView]:
+        """Return a saved view by name, or None."""
+        return self._views.get(name)
+
+    def save(self, name: str, text: str, members: Iterable[str]) -> SavedView:
+        """Save or replace a view with its current members and write the definitions file.
+        args:
+            name: view name e.g. 'release'
+            text: query string e.g. 'priority:high status:incomplete tag:release'
+            members: IDs of the saved tasks matching the view's filters without due times
+        return:
+            SavedView: the saved view
+        raises:
+            ValueError: if text is not a valid query
+        """
+        view = self._parse(name, text)
+        view.members = set(members)
+        self._views[name] = view
+        self._write_definitions()
+        return view
+
+    def delete(self, name: str) -> bool:
+        """Delete a view and write the definitions file; False if there was no such view."""
+        if self._views.pop(name, None) is None:
+            return False
+        self._write_definitions()
+        return True
+
+    def clear(self) -> None:
+        for view in self._views.values():
+            view.members = set()
+
+    def add(self, task: Task) -> None:
+        for view in self._views.values():
+            if view.base.matches(task):
+                view.members.add(task.id)
+
+    def remove(self, task: Task) -> None:
+        for view in self._views.values():
+            view.members.discard(task.id)
+
+    def to_state(self) -> Any:
+        return {
+            name: {"query": view.text, "version": view.version, "ids": sorted(view.members)}
+            for name, view in self._views.items()
+        }
+
+    def load_state(self, state: Any) -> None:
+        # member sets saved for other definitions are of no use; the registry rebuilds instead
+        if set(state) != set(self._views):
+            raise ValueError("saved views changed")
+        for name, view in self._views.items():
+            saved = state[name]
+            # members saved for another form of the query e.g. before due filters were split off
+            if saved["query"] != view.text or saved["version"] != view.version:
+                raise ValueError(f"view {name} changed")
+            view.members = set(saved["ids"])
@@ -1,10 +1,10 @@
 import re
 import hashlib
-from typing import Union, Tuple, List, Dict, Any
-from dateutil.parser import parse # type: ignore
-from dateutil.parser import ParserError # type: ignore
+from functools import lru_cache
+from typing import Union, Tuple, Dict, Optional
+from dateutil.relativedelta import relativedelta # type: ignore
 from datetime import datetime, timedelta
-import dateparser  # type: ignore
+from todo_app.config import DATE_CACHE_BUCKET, DATE_CACHE_SIZE
 
 DURATION_UNITS = {
     "minutes": ["minutes", "mins", "min" "minute"],
@@ -50,20 +50,180 @@ def normalize_duration_string(date: str) -> str:
 
     return time
 
-def convert_datestring(input_date: str) -> Union[Tuple[bool, str], Tuple[bool, datetime]]:
-    """convert a date string to datetime value.
+# fast path: the due string shapes of extractor.DATE_PATTERN resolved without dateutil or dateparser.
+# Each one gives exactly what those parsers return for it; anything else falls through to them.
+MONTHS = {
+    name: number
+    for number, names in enumerate(
+        (("jan", "january"), ("feb", "february"), ("mar", "march"), ("apr", "april"), ("may",),
+         ("jun", "june"), ("jul", "july"), ("aug", "august"), ("sep", "sept", "september"),
+         ("oct", "october"), ("nov", "november"), ("dec", "december")),
+        start=1,
+    )
+    for name in names
+}
+WEEKDAYS = {
+    name: number
+    for number, names in enumerate(
+        (("mon", "monday"), ("tue", "tues", "tuesday"), ("wed", "wednesday"), ("thu", "thursday"),
+         ("fri", "friday"), ("sat", "saturday"), ("sun", "sunday"))
+    )
+    for name in names
+}
+# day shifts dateparser applies to the reference time, and the calendar steps of next/last
+RELATIVE_DAYS = {"today": 0, "tomorrow": 1, "yesterday": -1}
+RELATIVE_STEPS = {"week": relativedelta(weeks=1), "month": relativedelta(months=1), "year": relativedelta(years=1)}
+IN_UNITS = {"minute": "minutes", "hour": "hours", "day": "days", "week": "weeks"}
+
+_MONTH = "|".join(sorted(MONTHS, key=len, reverse=True))
+CLOCK_PATTERN = re.compile(r"^(\d{1,2})(?::(\d{2}))?\s*(am|pm)$")
+TIME_PATTERN = re.compile(r"^(\d{1,2}):(\d{2})(?::(\d{2}))?$")
+ISO_PATTERN = re.compile(r"^(\d{4})[-/](\d{1,2})[-/](\d{1,2})(?:[ t](\d{1,2}):(\d{2})(?::(\d{2}))?)?$")
+SLASH_PATTERN = re.compile(r"^(\d{1,2})/(\d{1,2})/(\d{4})$")
+DAY_MONTH_YEAR_PATTERN = re.compile(rf"^(\d{{1,2}})[-/]({_MONTH})[-/](\d{{2}}|\d{{4}})$")
+MONTH_DAY_PATTERN = re.compile(rf"^({_MONTH})\s+(\d{{1,2}})(?:st|nd|rd|th)?(?:,?\s*(\d{{4}}))?$")
+DAY_MONTH_PATTERN = re.compile(rf"^(\d{{1,2}})(?:st|nd|rd|th)?\s+({_MONTH})(?:,?\s*(\d{{4}}))?$")
+RELATIVE_STEP_PATTERN = re.compile(r"^(next|last)\s+(week|month|year)$")
+IN_PATTERN = re.compile(r"^in\s+(\d+)\s*(minute|hour|day|week)s?$")
+
+# how often each way of resolving a due string was taken since start-up (cache hits are not counted)
+DATE_PATHS = ("fast", "duration", "dateutil", "dateparser", "failed")
+_date_path_counts: Dict[str, int] = dict.fromkeys(DATE_PATHS, 0)
+
+
+def _two_digit_year(year: int, reference: datetime) -> int:
+    """the year dateutil reads a two digit year as: the one within 50 years of the reference"""
+    year += reference.year // 100 * 100
+    if year >= reference.year + 50:
+        year -= 100
+    elif year < reference.year - 50:
+        year += 100
+    return year
+
+
+def fast_parse_date(date: str, reference: datetime) -> Optional[datetime]:
+    """Resolve the common due string shapes without the general purpose parsers.
+        Handles 3pm, 3:30 pm, 15:00, today, tomorrow, yesterday, next/last week|month|year,
+        weekday names, in N minutes|hours|days|weeks, 2025-01-14 (with an optional time),
+        2026/02/23, 23/02/2026 (month first unless the first number cannot be a month, as
+        dateutil reads it), 01-feb-25, July 2nd 2025 and 1st February 2025.
     args:
-        date: an extracted date like string
-    returns:
-        bool: True or False
-        date: converted date string in datetime datatype
-        err: error message
+        date: lower case date string with single spaces
+        reference: time relative phrases are resolved against
+    return:
+        datetime | None: the resolved time; None when the string has another shape or is not a valid date
     """
-    # initialise current time
-    current_time: datetime = datetime.now()
+    day = reference.replace(hour=0, minute=0, second=0, microsecond=0)
+    try:
+        if date in RELATIVE_DAYS:
+            return reference + timedelta(days=RELATIVE_DAYS[date])
+
+        if date in WEEKDAYS:
+            # the next such day, today included
+            return day + timedelta(days=(WEEKDAYS[date] - day.weekday()) % 7)
+
+        match = CLOCK_PATTERN.match(date)
+        if match:
+            hour, minute = int(match.group(1)), int(match.group(2) or 0)
+            if not 1 <= hour <= 12:
+                return None
+            return day.replace(hour=hour % 12 + (12 if match.group(3) == "pm" else 0), minute=minute)
+
+        match = TIME_PATTERN.match(date)
+        if match:
+            return day.replace(hour=int(match.group(1)), minute=int(match.group(2)), second=int(match.group(3) or 0))
+
+        match = ISO_PATTERN.match(date)
+        if match:
+            year, month, month_day, hour, minute, second = (int(value or 0) for value in match.groups())
+            return datetime(year, month, month_day, hour, minute, second)
+
+        match = SLASH_PATTERN.match(date)
+        if match:
+            first, second_number, year = (int(value) for value in match.groups())
+            month, month_day = (first, second_number) if first <= 12 else (second_number, first)
+            return datetime(year, month, month_day)
+
+        match = DAY_MONTH_YEAR_PATTERN.match(date)
+        if match:
+            year = int(match.group(3))
+            year = _two_digit_year(year, reference) if len(match.group(3)) == 2 else year
+            return datetime(year, MONTHS[match.group(2)], int(match.group(1)))
+
+        match = MONTH_DAY_PATTERN.match(date)
+        if match:
+            return datetime(int(match.group(3) or day.year), MONTHS[match.group(1)], int(match.group(2)))
+
+        match = DAY_MONTH_PATTERN.match(date)
+        if match:
+            return datetime(int(match.group(3) or day.year), MONTHS[match.group(2)], int(match.group(1)))
+
+        match = RELATIVE_STEP_PATTERN.match(date)
+        if match:
+            step = RELATIVE_STEPS[match.group(2)]
+            return reference + step if match.group(1) == "next" else reference - step
+
+        match = IN_PATTERN.match(date)
+        if match:
+            return reference + timedelta(**{IN_UNITS[match.group(2)]: int(match.group(1))})
+
+    except ValueError:
+        return None  # e.g. 31/02/2026
+    return None
+
+
+def date_path_stats() -> Dict[str, int]:
+    """Return how many due strings each parsing path resolved e.g. {"fast": 40, "dateparser": 1, ...}"""
+    return dict(_date_path_counts)
+
+
+def reference_time(now: Optional[datetime] = None) -> datetime:
+    """Return the start of the DATE_CACHE_BUCKET second window now falls in e.g. 10:41:37 -> 10:41:00.
+    Relative dates are resolved against it, so a phrase gives the same result throughout the window.
+    """
+    now = now or datetime.now()
+    return datetime.fromtimestamp(now.timestamp() // DATE_CACHE_BUCKET * DATE_CACHE_BUCKET)
+
+
+def library_parse_date(date: str, reference: datetime) -> Tuple[str, Union[str, datetime, None]]:
+    """Resolve a date string with dateutil, then dateparser; the slow general purpose path.
+    args:
+        date: date string
+        reference: time relative phrases are resolved against
+    return:
+        (str, datetime | str | None): the parser that answered ('dateutil', 'dateparser' or 'failed')
+        and its result; None or an error message when neither understands the string
+    """
+    # imported here, not at start-up: the fast path answers most due strings without either
+    # parser, and dateparser alone takes a few hundred milliseconds to load
+    from dateutil.parser import parse, ParserError # type: ignore
+
+    # missing fields e.g. the day of '5pm' come from the reference day
+    try:
+        return "dateutil", parse(date, default=reference.replace(hour=0, minute=0, second=0, microsecond=0))
+
+    except (ParserError, ValueError, OverflowError):
+        try:
+            import dateparser  # type: ignore
 
+            convert_date = dateparser.parse(
+                date,
+                settings={
+                    "PREFER_DATES_FROM": "future",
+                    "RELATIVE_BASE": reference,
+                    "RETURN_AS_TIMEZONE_AWARE": False,
+                },
+            )
+            return ("dateparser" if convert_date is not None else "failed"), convert_date
+
+        except Exception as e:
+            return "failed", str(e)
+
+
+def _resolve_datestring(date: str, reference: datetime) -> Tuple[bool, Union[str, datetime]]:
+    """convert a normalised date string relative to reference; (False, "") when no parser understands it"""
     # normalize date string
-    normalised_date = normalize_duration_string(input_date)
+    normalised_date = normalize_duration_string(date)
 
     # convert date_string to datetime
     # Check for phrases like "2 hours", "in 30 minutes"
@@ -94,37 +254,78 @@ def convert_datestring(input_date: str) -> Union[Tuple[bool, str], Tuple[bool, d
             delta = timedelta()
 
         # calculate date/time
-        relative_date: datetime = current_time + delta
+        relative_date: datetime = reference + delta
 
         # return True, date
+        _date_path_counts["duration"] += 1
         return True, relative_date
 
-    # convert other form of task time
-    try:
-        convert_date = parse(input_date)
-
-    except (ParserError, ValueError):
-        try:
-            convert_date = dateparser.parse(
-                input_date,
-                settings={
-                    "PREFER_DATES_FROM": "future",
-                    "RELATIVE_BASE": current_time,
-                    "RETURN_AS_TIMEZONE_AWARE": False,
-                },
-            )
-
-            if convert_date is None:
-                return False, f"Unable to convert {input_date} to datetime object"
+    # the common shapes first; dateutil and dateparser only for the rest
+    fast_date = fast_parse_date(date, reference)
+    if fast_date is not None:
+        _date_path_counts["fast"] += 1
+        return True, fast_date
 
-        except Exception as e:
-            return False, str(e)
+    path, convert_date = library_parse_date(date, reference)
+    _date_path_counts[path] += 1
+    if not isinstance(convert_date, datetime):
+        return False, convert_date or ""
 
     # date return format year-month-day
     absolute_date: datetime = convert_date
     return True, absolute_date
 
 
+# results by (normalised date string, reference time); the reference is part of the key, so
+# 'tomorrow' parsed after midnight is a new entry rather than yesterday's answer
+_cached_resolve = lru_cache(maxsize=DATE_CACHE_SIZE)(_resolve_datestring)
+
+
+def convert_datestring(input_date: str, now: Optional[datetime] = None) -> Union[Tuple[bool, str], Tuple[bool, datetime]]:
+    """convert a date string to datetime value.
+        Results are memoised per normalised string and reference window (see reference_time), so
+        bulk adds and filters repeating phrases like 'tomorrow' or '5pm' parse each phrase once.
+    args:
+        date: an extracted date like string
+        now: time relative dates are resolved against; the current time by default
+    returns:
+        bool: True or False
+        date: converted date string in datetime datatype
+        err: error message
+    """
+    # case and repeated spaces do not change the meaning, so they do not get their own cache entries
+    normalised_date = " ".join(input_date.lower().split())
+
+    _, result = _cached_resolve(normalised_date, reference_time(now))
+    if isinstance(result, datetime):
+        return True, result
+    return False, result or f"Unable to convert {input_date} to datetime object"
+
+
+def date_cache_stats() -> Dict[str, float]:
+    """Return the date parsing cache counters e.g. {"hits": 9, "misses": 1, "hit_rate": 0.9, ...}"""
+    info = _cached_resolve.cache_info()
+    lookups = info.hits + info.misses
+    return {
+        "size": info.currsize,
+        "max_size": info.maxsize or 0,  # always set; resize_date_cache never makes it unbounded
+        "hits": info.hits,
+        "misses": info.misses,
+        "hit_rate": info.hits / lookups if lookups else 0.0,
+    }
+
+
+def resize_date_cache(max_size: int) -> None:
+    """Replace the date parsing cache with an empty one holding up to max_size results; 0 turns it off."""
+    global _cached_resolve
+    _cached_resolve = lru_cache(maxsize=max(max_size, 0))(_resolve_datestring)
+
+
+def clear_date_cache() -> None:
+    """Forget every memoised date and reset the counters."""
+    _cached_resolve.cache_clear()
+
+
 def generate_taskID(task_description: str) -> str:
     """Generate a unique id for each user task based on task description and time of creation
     args:
@@ -148,4 +349,4 @@ def generate_taskID(task_description: str) -> str:
     task_id = id_generator.hexdigest()[:8]
 
     # return the generated task id
-    return str(task_id)
\ No newline at end of file
+    return str(task_id)
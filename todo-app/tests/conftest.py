@@ -0,0 +1,68 @@
+import atexit
+import os
+import shutil
+import tempfile
+from pathlib import Path
+import pytest
+
+# the tests run against a copy of the checked-in store in a folder of their own, so they never write to the
+# working store or beside it (index sidecars, delta log, saved query results, views, MX cache). It is set
+# before todo_app is imported, because the default paths are read from todo_app.config once, and the test
+# modules build their default services when they are imported.
+CHECKED_IN_STORE = Path(__file__).resolve().parents[1] / "database" / "todo-app.json"
+DATA_DIR = Path(tempfile.mkdtemp(prefix="taskmate-tests-"))
+shutil.copyfile(CHECKED_IN_STORE, DATA_DIR / "todo-app.json")
+os.environ["TASKMATE_DATA_DIR"] = str(DATA_DIR)
+# registered before any index registry, so it runs after their exit-time sidecar writes
+atexit.register(shutil.rmtree, DATA_DIR, ignore_errors=True)
+
+
+def local_resolver(domain: str, timeout: float):
+    """stand-in for DNS: every domain accepts email except nomail.org and the domains below it"""
+    return not (domain == "nomail.org" or domain.endswith(".nomail.org"))
+
+
+@pytest.fixture(autouse=True)
+def local_deliverability(tmp_path):
+    """check email domains against local_resolver with a per-test MX cache, so no test needs the network"""
+    from todo_app.parsers.deliverability import DeliverabilityChecker, MXCache, set_checker
+
+    checker = DeliverabilityChecker("cached", local_resolver, MXCache(tmp_path / "mx-cache.json"))
+    set_checker(checker)
+    yield checker
+    set_checker(None)
+
+
+@pytest.fixture(autouse=True)
+def default_store():
+    """give every test the checked-in tasks in the default store, whatever an earlier test saved to it
+    e.g. test_app's add_task; the default store and its indexes live in DATA_DIR
+    """
+    from todo_app.config import JSON_DB_PATH
+
+    saved = CHECKED_IN_STORE.read_bytes()
+    if not JSON_DB_PATH.exists() or JSON_DB_PATH.read_bytes() != saved:
+        JSON_DB_PATH.write_bytes(saved)
+    return JSON_DB_PATH
+
+
+@pytest.fixture
+def tmp_store(tmp_path):
+    """make TaskService subclasses whose store is tmp_path/todo-app.json saved with the given tasks (Tasks or
+    saved-shape dictionaries); the store's DatabaseService is the subclass's db_service
+    """
+    from todo_app.models.task import Task
+    from todo_app.services.database_service import DatabaseService
+    from todo_app.services.storage_backend import JSONBackend
+    from todo_app.services.task_service import TaskService
+
+    def make(tasks=()):
+        class TemporaryTaskService(TaskService):
+            db_service = DatabaseService(JSONBackend(tmp_path / "todo-app.json"))
+
+        rows = [task.to_dict() if isinstance(task, Task) else task for task in tasks]
+        if rows:
+            TemporaryTaskService.db_service._save_json(rows)
+        return TemporaryTaskService
+
+    return make
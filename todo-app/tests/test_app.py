@@ -44,4 +44,63 @@ def test_missing_email_add_task():
     assert status is True
     assert isinstance(message, str)
     assert isinstance(output, list)
-    assert all(isinstance(task, dict) for task in output)
\ No newline at end of file
+    assert all(isinstance(task, dict) for task in output)
+
+def test_add_tasks(tmp_store):
+    temporary_app = TodoApp()
+    temporary_app.db_service = tmp_store().db_service
+    lines = [
+        "buy groceries @shopping #high due:8pm",
+        "@shopping #high due:8pm",
+        "read tozer book @religion #mild due:tomorrow",
+        "buy groceries @shopping #low due:9pm",
+    ]
+    status, message, errors = temporary_app.add_tasks(lines, commit_every=2)
+    assert status is True
+    assert message == "Imported 2 task(s), skipped 1 duplicate(s), 1 line(s) failed."
+    assert errors == ["line 2: Task description not Found!"]
+    assert len(temporary_app.db_service.read_json()) == 2
+
+def test_import_tasks_csv(tmp_store):
+    import io
+    temporary_app = TodoApp()
+    temporary_app.db_service = tmp_store().db_service
+    csv_file = io.StringIO(
+        "description,tag,priority,due\n"
+        "buy groceries,shopping,high,8pm\n"
+        "evening mass,worship,urgent,6pm\n"
+    )
+    status, message, errors = temporary_app.import_tasks(csv_file, "csv")
+    assert status is True
+    assert message == "Imported 1 task(s), skipped 0 duplicate(s), 1 line(s) failed."
+    assert errors == ["line 3: Invalid Priority Level. Priority Level are high, mild and low"]
+
+def test_add_tasks_looks_up_each_domain_once(tmp_store, local_deliverability):
+    temporary_app = TodoApp()
+    temporary_app.db_service = tmp_store().db_service
+    domains = ["gmail.com", "yahoo.com", "outlook.com", "proton.me", "example.org"]
+    lines = (
+        f"task {n} @work #high due:8pm assigned:user{n}@{domains[n % len(domains)]}" for n in range(10000)
+    )
+    status, message, errors = temporary_app.add_tasks(lines, commit_every=0)
+    assert status is True
+    assert errors == []
+    assert message == "Imported 10000 task(s), skipped 0 duplicate(s), 0 line(s) failed."
+    assert local_deliverability.lookups == len(domains)
+
+def test_add_tasks_lexes_each_line_once(tmp_store, monkeypatch):
+    import todo_app.models.app as app_module
+    import todo_app.parsers.extractor as extractor_module
+    lex_task, lexed = app_module.lex_task, []
+    def counting_lex_task(text):
+        lexed.append(text)
+        return lex_task(text)
+    monkeypatch.setattr(app_module, "lex_task", counting_lex_task)
+    monkeypatch.setattr(extractor_module, "lex_task", counting_lex_task)
+    temporary_app = TodoApp()
+    temporary_app.db_service = tmp_store().db_service
+    lines = [f"task {n} @work #high due:8pm assigned:user{n}@gmail.com" for n in range(5)]
+    status, message, errors = temporary_app.add_tasks(lines)
+    assert status is True
+    assert errors == []
+    assert lexed == lines
@@ -146,3 +146,41 @@ def test_update_status():
 #     assert message == f"Deleted 1 task(s), but {['09dhf73g', 'ed8f905f']} not found."
 
 
+
+def test_apply_updates(tmp_store):
+    service = tmp_store(db_service.read_json()).db_service
+    changes = [
+        ("76339f3c", {"priority": "low", "status": "inprogress"}),
+        ("133990b1", {"priority": "low"}),
+    ]
+    status, message = service.apply_updates(changes)
+    assert status is True
+    assert message == "Updated 2 task(s) successfully."
+    assert service.backend.get_task("76339f3c").status == "Inprogress"
+    assert service.backend.get_task("133990b1").priority == "Low"
+
+def test_apply_updates_invalid_change_saves_nothing(tmp_store):
+    service = tmp_store(db_service.read_json()).db_service
+    changes = [
+        ("76339f3c", {"priority": "low"}),
+        ("ydhfi73g", {"status": "complete"}),
+        ("133990b1", {"priority": "urgent"}),
+    ]
+    status, message = service.apply_updates(changes)
+    assert status is False
+    assert "Invalid Task ID. ydhfi73g does not exist!" in message
+    assert "Invalid Priority Level" in message
+    assert service.backend.get_task("76339f3c").priority == "High"
+
+def test_apply_updates_validates_each_assignee_once(tmp_store, local_deliverability):
+    service = tmp_store(db_service.read_json()).db_service
+    task_ids = [task["ID"] for task in service.read_json()]
+    changes = [(task_id, {"email": f"owner{n % 2}@team{n % 2}.org"}) for n, task_id in enumerate(task_ids)]
+    status, message = service.apply_updates(changes)
+    assert status is True
+    assert message == f"Updated {len(task_ids)} task(s) successfully."
+    assert local_deliverability.lookups == 2
+
+    status, message = service.apply_updates([(task_ids[0], {"email": "owner@nomail.org"})])
+    assert status is False
+    assert message == f"{task_ids[0]}: Invalid Email address"
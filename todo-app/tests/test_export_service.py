@@ -0,0 +1,43 @@
+import io
+import json
+import pytest
+from todo_app.services.export_service import export_tasks
+
+TASKS = [
+    {
+        "ID": "5e42c77c",
+        "Time": "2025-10-23 18:00:00",
+        "Description": "Morning Mass On Sunday, Do Not Forget",
+        "Priority": "High",
+        "Tag": "Worship",
+        "Email": "johndoe34@gmail.com",
+        "Status": "Incomplete"
+    },
+    {
+        "ID": "76339f3c",
+        "Time": "2024-06-15 14:30:00",
+        "Description": "Read Tozer Book",
+        "Priority": "Mild",
+        "Tag": "Religion",
+        "Email": "",
+        "Status": "Complete"
+    },
+]
+
+def test_export_jsonl():
+    stream = io.StringIO()
+    count = export_tasks(iter(TASKS), stream, "jsonl")
+    assert count == 2
+    assert [json.loads(line) for line in stream.getvalue().splitlines()] == TASKS
+
+def test_export_csv():
+    stream = io.StringIO()
+    count = export_tasks(iter(TASKS), stream, "csv")
+    lines = stream.getvalue().splitlines()
+    assert count == 2
+    assert lines[0] == "ID,Time,Description,Priority,Tag,Email,Status"
+    assert lines[1].startswith('5e42c77c,2025-10-23 18:00:00,"Morning Mass On Sunday, Do Not Forget"')
+
+def test_export_invalid_format():
+    with pytest.raises(ValueError):
+        export_tasks(iter(TASKS), io.StringIO(), "xml")
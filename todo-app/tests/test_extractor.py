@@ -1,4 +1,5 @@
 from todo_app.parsers.extractor import Extractor
+from todo_app.parsers.lexer import lex_task
 from datetime import datetime
 
 app = Extractor()
@@ -39,6 +40,12 @@ def test_tag_extraction():
     assert status is True
     assert tag == "Shopping"
 
+def test_hierarchical_tag_extraction():
+    sample = "ship notes @work / release/q3# #high due:8pm"
+    status, tag = app.extract_tag(sample)
+    assert status is True
+    assert tag == "Work/Release/Q3"
+
 def test_missing_tag_input_extraction():
     sample = "buy groceries #high due:8pm assigned:okeyobinna2001@gmail.com"
     status, error_message = app.extract_tag(sample)
@@ -79,4 +86,55 @@ def test_invalid_date_time_input_extraction():
     sample = "buy groceries @shopping #high due:someday assigned:jhonobinna2001gmail.com"
     status, error_message = app.extract_date(sample)
     assert status is False
-    assert error_message == "Invalid or No date found in task description."
\ No newline at end of file
+    assert error_message == "Invalid or No date found in task description."
+
+def test_lex_task_fields_and_offsets():
+    sample = "buy groceries @shopping #high due:8pm assigned:okeyobinna2001@gmail.com"
+    line = lex_task(sample)
+    assert line.errors == []
+    assert {name: token.text for name, token in line.tokens.items()} == {
+        "description": "buy groceries",
+        "tag": "shopping",
+        "priority": "high",
+        "due": "8pm",
+        "email": "okeyobinna2001@gmail.com",
+    }
+    for token in line.tokens.values():
+        assert sample[token.start:token.end] == token.text
+
+def test_lex_task_error_positions():
+    sample = "buy groceries @shopping due:8pm"
+    line = lex_task(sample)
+    assert [error.field for error in line.errors] == ["priority", "tag", "email"]
+    assert line.error("tag").position == sample.index("shopping")
+    assert line.error("priority").position == sample.index("due")
+    assert line.error("priority").message == "Task Priority level not found!"
+
+def test_lex_task_due_segment_stops_at_assignee():
+    line = lex_task("call mom @family #mild DUE next friday assigned:mark20@gmail.com")
+    assert line.get("due").text == "next friday"
+    assert line.get("email").text == "mark20@gmail.com"
+
+def test_extract_fields_matches_extract_methods():
+    samples = [
+        "buy groceries @shopping #high due:8pm",
+        "@shopping #high due:8pm",
+        "buy groceries #high due:8pm",
+        "buy groceries @shopping due:8pm",
+        "buy groceries @shopping #urgent due:8pm",
+        "buy groceries @shopping #low due:someday",
+        "ship notes @work / release/q3# #high due:8pm",
+    ]
+    for sample in samples:
+        fields = app.extract_fields(sample)
+        assert fields["description"] == app.extract_task_description(sample)
+        assert fields["priority"] == app.extract_priority_level(sample)
+        assert fields["tag"] == app.extract_tag(sample)
+        assert fields["due"][0] == app.extract_date(sample)[0]
+        assert fields["email"] == (False, "Email not found.")
+
+def test_extract_fields_reads_date_from_due_only():
+    fields = app.extract_fields("plan monday standup @work #high due:8pm")
+    status, due = fields["due"]
+    assert status is True
+    assert due.hour == 20
@@ -0,0 +1,22 @@
+import io
+from todo_app.services.import_service import guess_import_format, iter_task_lines, task_line_from_row
+
+def test_guess_import_format():
+    assert guess_import_format("tasks.CSV") == "csv"
+    assert guess_import_format("tasks.jsonl") == "jsonl"
+    assert guess_import_format("tasks.txt") == "text"
+
+def test_task_line_from_row():
+    row = {"Description": "buy groceries", "Tag": "shopping", "Priority": "high", "Due": "8pm", "Assigned": "johndoe34@gmail.com"}
+    assert task_line_from_row(row) == "buy groceries @shopping #high due:8pm assigned:johndoe34@gmail.com"
+    assert task_line_from_row({"task": "catechism @worship #high due:5pm"}) == "catechism @worship #high due:5pm"
+
+def test_iter_text_lines_skips_blank_lines():
+    stream = io.StringIO("buy groceries @shopping #high due:8pm\n\ncatechism @worship #high due:5pm\n")
+    assert [number for number, _, _ in iter_task_lines(stream)] == [1, 3]
+
+def test_iter_jsonl_lines_reports_invalid_json():
+    stream = io.StringIO('{"task": "catechism @worship #high due:5pm"}\n{"task": \n')
+    lines = list(iter_task_lines(stream, "jsonl"))
+    assert lines[0] == (1, "catechism @worship #high due:5pm", "")
+    assert lines[1][0] == 2 and lines[1][2].startswith("Invalid JSON")
@@ -0,0 +1,268 @@
+import json
+from datetime import datetime
+from todo_app.indexes.due import DueIndex
+from todo_app.indexes.inverted import InvertedIndex, tokenize
+from todo_app.indexes.registry import IndexRegistry
+from todo_app.indexes.stats import StatsIndex
+from todo_app.indexes.tags import TagIndex
+from todo_app.indexes.text import TextIndex, keyword_pattern
+from todo_app.indexes.trigram import TrigramIndex, similarity
+from todo_app.models.task import Task
+from todo_app.services.storage_backend import JSONBackend
+
+TASKS = [
+    Task.from_dict({
+        "ID": "5e42c77c", "Time": "2025-10-23 18:00:00", "Description": "Learn C++ Templates",
+        "Priority": "High", "Tag": "Work", "Email": "johndoe34@gmail.com", "Status": "Incomplete",
+    }),
+    Task.from_dict({
+        "ID": "76339f3c", "Time": "2024-06-15 14:30:00", "Description": "Read Tozer Book",
+        "Priority": "Mild", "Tag": "Religion", "Email": "", "Status": "Complete",
+    }),
+]
+
+def test_tokenize_keeps_plus_and_hash():
+    assert tokenize("Learn C++ and C# @Work") == ["learn", "c++", "and", "c#", "work"]
+
+def test_inverted_index_any_and_all():
+    index = InvertedIndex()
+    for task in TASKS:
+        index.add(task)
+
+    assert index.search(["c++"]) == {"5e42c77c"}
+    assert index.search(["tozer", "work"]) == {"5e42c77c", "76339f3c"}
+    assert index.search(["tozer", "work"], match_all=True) == set()
+    assert index.search(["johndoe34@gmail.com"]) == {"5e42c77c"}
+
+def test_inverted_index_remove():
+    index = InvertedIndex()
+    index.add(TASKS[0])
+    index.remove(TASKS[0])
+    assert index.to_state() == {}
+
+def test_registry_persists_sidecar(tmp_path, monkeypatch):
+    backend = JSONBackend(tmp_path / "todo-app.json")
+    backend.save_all(TASKS)
+    registry = IndexRegistry(backend, [InvertedIndex()])
+    registry.sync()
+    registry.flush()
+
+    sidecar = json.loads(registry.sidecar_path("inverted").read_text())
+    assert sidecar["signature"] == backend.signature()
+    assert sidecar["state"]["tozer"] == ["76339f3c"]
+
+    # a new registry loads the sidecar instead of scanning the tasks
+    def scan():
+        raise AssertionError("tasks were scanned")
+
+    monkeypatch.setattr(backend, "iter_tasks", scan)
+    reader = IndexRegistry(backend, [InvertedIndex()])
+    assert reader.get("inverted").search(["tozer"]) == {"76339f3c"}
+
+def test_registry_rebuilds_after_external_write(tmp_path):
+    backend = JSONBackend(tmp_path / "todo-app.json")
+    backend.save_all(TASKS)
+    registry = IndexRegistry(backend, [InvertedIndex()])
+    assert registry.get("inverted").search(["tozer"]) == {"76339f3c"}
+
+    backend.delete_tasks(["76339f3c"])
+    assert registry.get("inverted").search(["tozer"]) == set()
+
+def test_registry_write_logs_delta_instead_of_loading_sidecars(tmp_path, monkeypatch):
+    backend = JSONBackend(tmp_path / "todo-app.json")
+    backend.save_all(TASKS[:1])
+    builder = IndexRegistry(backend, [InvertedIndex(), TagIndex()])
+    builder.sync()
+    builder.flush()
+    writer = IndexRegistry(backend, [InvertedIndex(), TagIndex()])
+    sidecar = writer.sidecar_path("inverted").read_bytes()
+
+    # a write neither loads nor rewrites the sidecars
+    def load_state(state):
+        raise AssertionError("sidecar was loaded")
+
+    monkeypatch.setattr(InvertedIndex, "load_state", load_state)
+    writer.prepare_write()
+    backend.insert_tasks(TASKS[1:])
+    writer.apply(added=TASKS[1:])
+    writer.flush()
+    monkeypatch.undo()
+    assert writer.sidecar_path("inverted").read_bytes() == sidecar
+    assert writer.delta_path.exists()
+
+    # a reader catches the sidecar up from the delta log instead of scanning the tasks
+    def scan():
+        raise AssertionError("tasks were scanned")
+
+    monkeypatch.setattr(backend, "iter_tasks", scan)
+    reader = IndexRegistry(backend, [InvertedIndex(), TagIndex()])
+    assert reader.get("inverted").search(["tozer"]) == {"76339f3c"}
+    assert list(reader.get("tag").tags()) == ["religion", "work"]
+
+def test_registry_follows_journal_compaction(tmp_path, monkeypatch):
+    backend = JSONBackend(tmp_path / "todo-app.json")
+    backend.save_all(TASKS[:1])
+    builder = IndexRegistry(backend, [InvertedIndex()])
+    builder.sync()
+    builder.flush()
+
+    backend.repository.journal = True
+    backend.repository.max_entries = 1
+    writer = IndexRegistry(backend, [InvertedIndex()])
+    writer.prepare_write()
+    backend.insert_tasks(TASKS[1:])
+    writer.apply(added=TASKS[1:])
+    backend.repository.wait_for_compaction()
+    assert not backend.repository.journal_path.exists()
+
+    def scan():
+        raise AssertionError("tasks were scanned")
+
+    monkeypatch.setattr(backend, "iter_tasks", scan)
+    reader = IndexRegistry(backend, [InvertedIndex()])
+    assert reader.get("inverted").search(["tozer"]) == {"76339f3c"}
+
+def test_bucket_index():
+    from todo_app.indexes.buckets import BucketIndex
+    index = BucketIndex("Priority")
+    for task in TASKS:
+        index.add(task)
+
+    assert index.get("HIGH") == {"5e42c77c"}
+    assert index.counts() == {"high": 1, "mild": 1}
+    index.remove(TASKS[0])
+    assert index.get("high") == set()
+
+    tags = BucketIndex("Tag")
+    for task in TASKS:
+        tags.add(task)
+    assert tags.containing("rel") == {"76339f3c"}
+
+def test_due_index_range_scan():
+    index = DueIndex()
+    for task in TASKS:
+        index.add(task)
+    index.add(Task.from_dict({"ID": "00000000", "Time": "", "Description": "Someday"}))
+
+    assert index.between(datetime(2024, 1, 1), datetime(2026, 1, 1)) == ["76339f3c", "5e42c77c"]
+    assert index.between(datetime(2025, 10, 23, 18), datetime(2025, 10, 23, 18, 0, 1)) == ["5e42c77c"]
+    assert index.count_between(datetime.min, datetime(2025, 1, 1)) == 1
+
+    index.remove(TASKS[1])
+    assert index.between(datetime.min, datetime.max) == ["5e42c77c"]
+
+def test_trigram_similarity():
+    assert similarity("tozer", "tozer") == 1.0
+    assert similarity("tozr", "tozer") == 3 / 8
+    assert similarity("book", "mass") == 0.0
+
+def test_trigram_index_ranks_and_updates():
+    index = TrigramIndex()
+    for task in TASKS:
+        index.add(task)
+
+    scores = index.search(["tozr", "bok"], threshold=0.3)
+    assert list(scores) == ["76339f3c"]
+    assert index.search(["templtes"], threshold=0.3).keys() == {"5e42c77c"}
+    assert index.search(["templtes"], threshold=0.9) == {}
+
+    index.remove(TASKS[1])
+    assert index.search(["tozer"], threshold=0.3) == {}
+    assert index.similar_words("tozer", 0.1) == {}
+
+def test_trigram_index_state_round_trip():
+    index = TrigramIndex()
+    for task in TASKS:
+        index.add(task)
+    restored = TrigramIndex()
+    restored.load_state(json.loads(json.dumps(index.to_state())))
+    assert restored.search(["tozr"], threshold=0.3) == index.search(["tozr"], threshold=0.3)
+
+def test_keyword_pattern_merges_prefixes():
+    assert keyword_pattern(["meet", "mass", "meeting", "c++"]).pattern == r"(?:c\+\+|m(?:ass|eet))"
+    assert keyword_pattern(["", ""]) is None
+
+def test_text_index_scan():
+    index = TextIndex()
+    for task in TASKS:
+        index.add(task)
+
+    assert sorted(index.scan(["TEMPL", "tozer book"])) == ["5e42c77c", "76339f3c"]
+    assert index.scan(["c++ t"]) == ["5e42c77c"]
+    assert index.scan(["(", "[a-z]*"]) == []
+    # fields are scanned separately, so a match cannot span the description and the tag
+    assert index.scan(["templates work"]) == []
+    assert index.scan(["5e42c77c"]) == []  # only Description, Tag and Email are searchable
+
+    index.remove(TASKS[0])
+    assert index.scan(["templ"]) == []
+
+def test_in_memory_index_is_not_persisted(tmp_path):
+    backend = JSONBackend(tmp_path / "todo-app.json")
+    backend.save_all(TASKS)
+    registry = IndexRegistry(backend, [TextIndex()], directory=tmp_path / "indexes")
+
+    registry.apply(added=[])  # never built, so left alone
+    assert registry.get("text").scan(["tozer"]) == ["76339f3c"]
+    registry.flush()
+    assert not (tmp_path / "indexes").exists()
+
+def test_stats_index_counts_incrementally():
+    index = StatsIndex()
+    for task in TASKS:
+        index.add(task)
+    now = datetime(2025, 1, 1)
+
+    snapshot = index.snapshot(now)
+    assert snapshot["total"] == 2
+    assert snapshot["status"] == {"Complete": 1, "Incomplete": 1}
+    assert snapshot["assignee"] == {"": 1, "johndoe34@gmail.com": 1}
+    assert snapshot["overdue"] == 0  # the only past task is complete
+    assert index.overdue(datetime(2026, 1, 1)) == 1
+
+    index.remove(TASKS[0])
+    index.add(TASKS[0].with_fields({"Status": "Complete"}))
+    assert index.snapshot(now)["status"] == {"Complete": 2}
+    assert index.overdue(datetime(2026, 1, 1)) == 0
+
+def test_tag_index_subtrees_and_counts(tmp_path):
+    tagged = [
+        TASKS[0].with_fields({"ID": f"0000000{number}", "Tag": tag})
+        for number, tag in enumerate(["Work", "Work/Release", "Work/Release/Q3", "Work-Life", "Home/Garden"])
+    ]
+    index = TagIndex()
+    for task in tagged:
+        index.add(task)
+
+    assert index.subtree("work") == {"00000000", "00000001", "00000002"}
+    assert index.subtree("Work/Release") == {"00000001", "00000002"}
+    assert index.subtree_count("home") == 1 and index.subtree("hom") == set()
+    assert list(index.tags("work/")) == ["work/release", "work/release/q3"]
+    assert index.tree("work") == [("work", 1, 3), ("work/release", 1, 2), ("work/release/q3", 1, 1)]
+    assert ("home", 0, 1) in index.tree()
+    assert index.task_ids("0000000") == [task.id for task in tagged]
+
+    index.remove(tagged[2])
+    assert list(index.tags("work/")) == ["work/release"]
+
+    # the sidecar keeps the BucketIndex shape; the sorted tags are rebuilt on load
+    backend = JSONBackend(tmp_path / "todo-app.json")
+    backend.save_all(tagged)
+    IndexRegistry(backend, [TagIndex()], directory=tmp_path / "indexes").flush()
+    registry = IndexRegistry(backend, [TagIndex()], directory=tmp_path / "indexes")
+    registry.get("tag")
+    registry.flush()
+    loaded = IndexRegistry(backend, [TagIndex()], directory=tmp_path / "indexes").get("tag")
+    assert list(loaded.tags("w")) == ["work", "work-life", "work/release", "work/release/q3"]
+
+def test_trigram_level_is_built_on_first_lookup():
+    index = TrigramIndex()
+    index.load_state({"tozer": ["76339f3c"], "book": ["76339f3c"]})
+    assert index._grams is None  # loading only reads the words
+    index.add(TASKS[0])
+    index.remove(TASKS[0])
+    assert index._grams is None
+
+    assert index.search(["tozr"], 0.3) == {"76339f3c": similarity("tozr", "tozer")}
+    index.add(TASKS[0])  # kept current once built
+    assert "5e42c77c" in index.search(["templats"], 0.3)
@@ -0,0 +1,40 @@
+from todo_app.models.task import Task
+from todo_app.services.paging import Page, make_page, paginate
+
+TASKS = [
+    Task.from_dict({"ID": "a", "Time": "2025-10-25 09:00:00", "Description": "one", "Priority": "Low", "Tag": "x", "Status": "Complete"}),
+    Task.from_dict({"ID": "b", "Time": "2025-10-23 18:00:00", "Description": "two", "Priority": "High", "Tag": "x"}),
+    Task.from_dict({"ID": "c", "Time": "", "Description": "three", "Priority": "High", "Tag": "x"}),
+    Task.from_dict({"ID": "d", "Time": "2025-10-24 09:00:00", "Description": "four", "Priority": "Mild", "Tag": "x"}),
+]
+
+def ids(tasks):
+    return [task.id for task in tasks]
+
+def test_make_page_validates():
+    assert make_page("Time", 5, 0, " b ") == (True, "", Page("time", 5, 0, "b"))
+    assert make_page("size")[0] is False
+    assert make_page(limit=0)[0] is False
+    assert make_page(offset=-1)[0] is False
+
+def test_paginate_insertion_order_is_lazy():
+    def stream():
+        yield from TASKS
+        raise AssertionError("read past the page")
+    assert ids(paginate(stream(), Page(limit=2, offset=1))) == ["b", "c"]
+    assert ids(paginate(iter(TASKS), Page(limit=2), after=TASKS[1])) == ["c", "d"]
+
+def test_paginate_sorted():
+    assert ids(paginate(TASKS, Page("time"))) == ["b", "d", "a", "c"]
+    assert ids(paginate(TASKS, Page("priority", limit=2))) == ["b", "c"]
+    assert ids(paginate(TASKS, Page("status", limit=2, offset=1))) == ["d", "c"]
+
+def test_paginate_cursor_pages_cover_every_task_once():
+    pages, after = [], None
+    while True:
+        page = paginate(TASKS, Page("priority", limit=3), after)
+        if not page:
+            break
+        pages += ids(page)
+        after = page[-1]
+    assert pages == ids(paginate(TASKS, Page("priority")))
@@ -0,0 +1,36 @@
+from todo_app.models.task import Task
+from todo_app.services.parallel import parallel_scan, use_parallel
+from todo_app.services.query import parse_query
+from todo_app.services.storage_backend import JSONBackend, SQLiteBackend
+
+TASKS = [
+    Task.from_dict({
+        "ID": f"{number:08x}", "Time": f"2025-10-{number % 28 + 1:02d} 09:00:00",
+        "Description": f"Task number {number}", "Priority": ("High", "Mild", "Low")[number % 3],
+        "Tag": f"tag{number % 7}", "Status": "Complete" if number % 5 else "Incomplete",
+    })
+    for number in range(500)
+]
+
+def test_use_parallel_threshold():
+    assert use_parallel(1000, workers=4, min_tasks=500) is True
+    assert use_parallel(100, workers=4, min_tasks=500) is False
+    assert use_parallel(1000, workers=1, min_tasks=500) is False
+
+def test_parallel_scan_keeps_insertion_order(tmp_path):
+    query = parse_query("not tag:tag3 and not priority:mild")
+    for backend in (JSONBackend(tmp_path / "todo-app.json"), SQLiteBackend(tmp_path / "todo-app.db")):
+        backend.save_all(TASKS)
+        expected = [task.id for task in TASKS if query.matches(task)]
+        assert parallel_scan(backend, query, workers=2) == expected
+
+def test_task_service_uses_parallel_scan(tmp_store):
+    service = tmp_store(TASKS)
+    service.parallel_workers = 2
+    service.parallel_min_tasks = 100
+
+    query = parse_query("not status:complete")
+    _, _, lines = service.explain_query(query)
+    assert lines[1] == "  1. scan all tasks in 2 processes -> 100 candidate(s)"
+    _, _, tasks = service.query_tasks(query)
+    assert [task["ID"] for task in tasks] == [task.id for task in TASKS if query.matches(task)]
@@ -0,0 +1,91 @@
+import pytest
+from datetime import datetime
+from todo_app.models.task import Priority, Status
+from todo_app.services.query import (
+    AndQuery, KeywordQuery, MatchAll, NotQuery, OrQuery, PriorityQuery, StatusQuery, TagQuery,
+    due_between, due_within, overdue_query, parse_query, plan_query,
+)
+from todo_app.services.task_service import TaskService
+
+task_service = TaskService()
+
+def test_parse_query_precedence():
+    query = parse_query("status:incomplete and (tag:work or priority:high,mild) not tozer")
+    assert query == AndQuery((
+        StatusQuery((Status.INCOMPLETE,)),
+        OrQuery((TagQuery(("work",)), PriorityQuery((Priority.HIGH, Priority.MILD)))),
+        NotQuery(KeywordQuery(("tozer",))),
+    ))
+
+def test_parse_query_empty_and_errors():
+    assert parse_query("  ") == MatchAll()
+    with pytest.raises(ValueError, match="Missing"):
+        parse_query("(tag:work")
+    with pytest.raises(ValueError, match="Invalid Priority Level"):
+        parse_query("priority:urgent")
+    with pytest.raises(ValueError, match="Incomplete query"):
+        parse_query("tag:work or")
+    with pytest.raises(ValueError, match="Unexpected"):
+        parse_query("tag:work)")
+
+def test_planner_starts_from_most_selective_index():
+    query = parse_query("priority:high and tag:religion and status:complete")
+    plan = plan_query(query, task_service.db_service.indexes, task_service.db_service.backend.count())
+    assert plan.steps[0] == ("index tag ~ (religion)", 1)
+    assert plan.candidates == {"76339f3c"}
+    assert plan.residual is None
+
+def test_planner_filters_unindexed_predicates():
+    query = parse_query("priority:high and not tag:worship")
+    plan = plan_query(query, task_service.db_service.indexes, task_service.db_service.backend.count())
+    assert plan.steps == [("index priority in (high)", 7)]
+    assert plan.residual == NotQuery(TagQuery(("worship",)))
+
+def test_query_tasks_matches_full_scan():
+    status, _, query = task_service.build_query(
+        tag_list=["worship", "shopping"], status_list=["incomplete"], expression="not priority:mild"
+    )
+    assert status is True
+    _, _, tasks = task_service.query_tasks(query)
+    expected = [task["ID"] for task in task_service.db_service.read_json() if query.matches(
+        task_service.db_service.backend.get_task(task["ID"])
+    )]
+    assert [task["ID"] for task in tasks] == expected == ["5e42c77c", "c2b129bb", "133990b1"]
+
+def test_explain_query_reports_counts():
+    _, _, query = task_service.build_query(priority_list=["high"], status_list=["complete"])
+    status, _, lines = task_service.explain_query(query)
+    assert status is True
+    assert lines == [
+        "query: priority in (high) AND status in (complete)",
+        "  1. index status in (complete) -> 1 candidate(s)",
+        "  2. and index priority in (high) -> 1 candidate(s)",
+        "result: 1 task(s)",
+    ]
+
+def test_build_query_invalid_status():
+    status, message, _ = task_service.build_query(status_list=["done"])
+    assert status is False
+    assert message.startswith("Invalid or no task status given")
+
+def test_due_between_uses_due_index():
+    query = due_between("2025-10-24", "2025-10-25 09:00")
+    _, _, tasks = task_service.query_tasks(query)
+    assert [task["Time"] for task in tasks] == [
+        task["Time"] for task in task_service.db_service.read_json()
+        if "2025-10-24" <= task["Time"] <= "2025-10-25 09:00"
+    ]
+    _, _, lines = task_service.explain_query(query)
+    assert lines[1].startswith("  1. index due in")
+
+def test_overdue_and_within():
+    now = datetime(2025, 10, 24)
+    _, _, tasks = task_service.query_tasks(overdue_query(now))
+    assert tasks and all(task["Time"] < "2025-10-24" and task["Status"] != "Complete" for task in tasks)
+    assert due_within("7 days").matches(task_service.db_service.backend.load_all()[0]) is False
+
+def test_due_range_errors():
+    with pytest.raises(ValueError):
+        due_between("25/10/2025", "23/10/2025")
+    with pytest.raises(ValueError):
+        parse_query("within:yesterday")
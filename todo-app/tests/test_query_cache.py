@@ -0,0 +1,81 @@
+from todo_app.models.task import Task
+from todo_app.services.query import parse_query
+from todo_app.services.query_cache import QueryCache
+from todo_app.services.storage_backend import JSONBackend
+
+TASKS = [
+    Task.from_dict({"ID": "5e42c77c", "Time": "2025-10-23 18:00:00", "Description": "Morning Mass",
+                    "Priority": "High", "Tag": "Worship", "Status": "Incomplete"}),
+    Task.from_dict({"ID": "76339f3c", "Time": "2024-06-15 14:30:00", "Description": "Read Tozer Book",
+                    "Priority": "Mild", "Tag": "Religion", "Status": "Complete"}),
+]
+
+ROWS = [task.to_dict() for task in TASKS]
+
+def test_repeated_query_is_served_from_cache(tmp_store):
+    service = tmp_store(TASKS)
+    cache = service.db_service.query_cache
+
+    first = service.cached_query(parse_query("status:incomplete,inprogress"))
+    # the same query written differently shares the cache entry
+    second = service.cached_query(parse_query("status:INPROGRESS,incomplete"))
+    assert second == first and second[0] is not first[0]
+    assert [task["ID"] for task in first] == ["5e42c77c"]
+    stats = cache.stats()
+    assert (stats["hits"], stats["misses"], stats["hit_rate"]) == (1, 1, 0.5)
+
+def test_write_invalidates_results(tmp_store):
+    service = tmp_store(TASKS)
+    query = parse_query("status:complete")
+    assert [task["ID"] for task in service.cached_query(query)] == ["76339f3c"]
+
+    service.db_service.apply_updates([("5e42c77c", {"status": "complete"})])
+    assert [task["ID"] for task in service.cached_query(query)] == ["5e42c77c", "76339f3c"]
+    assert service.db_service.query_cache.stats()["invalidations"] == 1
+
+def test_external_write_invalidates_results(tmp_store, tmp_path):
+    service = tmp_store(TASKS)
+    assert service.keyword_search(["tozer"])[0] is True
+
+    # another process rewriting the file is noticed through the backend signature
+    JSONBackend(tmp_path / "todo-app.json").save_all(TASKS[:1])
+    assert service.keyword_search(["tozer"])[0] is False
+
+def test_lru_eviction_and_resize(tmp_path):
+    cache = QueryCache(JSONBackend(tmp_path / "todo-app.json"), max_size=2)
+    for key in ("a", "b", "a", "c"):
+        cache.get_or_compute(key, lambda: ROWS)
+    assert cache.stats()["evictions"] == 1
+
+    calls = []
+    cache.get_or_compute("a", lambda: calls.append("a") or ROWS)  # recently used, still cached
+    cache.get_or_compute("b", lambda: calls.append("b") or ROWS)  # evicted
+    assert calls == ["b"]
+
+    cache.resize(0)
+    assert cache.stats()["size"] == 0
+    cache.get_or_compute("a", lambda: calls.append("a") or ROWS)
+    assert calls == ["b", "a"]
+
+def test_results_are_shared_with_later_processes(tmp_path):
+    backend = JSONBackend(tmp_path / "todo-app.json")
+    backend.save_all(TASKS)
+    calls = []
+    QueryCache(backend, directory=tmp_path / "indexes").get_or_compute("a", lambda: calls.append("a") or ROWS)
+
+    # a cache created later, as by the next CLI command, reads the saved result
+    later = QueryCache(backend, directory=tmp_path / "indexes")
+    assert later.get_or_compute("a", lambda: calls.append("a") or ROWS) == tuple(ROWS)
+    assert calls == ["a"] and later.stats()["disk_hits"] == 1
+
+    # until the store changes
+    backend.save_all(TASKS[:1])
+    after_write = QueryCache(backend, directory=tmp_path / "indexes")
+    after_write.get_or_compute("a", lambda: calls.append("a") or ROWS[:1])
+    assert calls == ["a", "a"]
+
+    # only the max_size most recently written results are kept
+    small = QueryCache(backend, max_size=2, directory=tmp_path / "indexes")
+    for key in ("b", "c", "d"):
+        small.get_or_compute(key, lambda: ROWS)
+    assert len(list((tmp_path / "indexes" / "todo-app.json.queries").glob("*.json"))) == 2
@@ -0,0 +1,143 @@
+import json
+from todo_app.models.task import Task
+from todo_app.services.repository import TaskRepository, get_repository
+
+TASK = {
+    "ID": "5e42c77c",
+    "Time": "2025-10-23 18:00:00",
+    "Description": "Morning Mass On Sunday",
+    "Priority": "High",
+    "Tag": "Worship",
+    "Email": "",
+    "Status": "Incomplete"
+}
+
+def test_records_parsed_once(tmp_path):
+    path = tmp_path / "todo-app.json"
+    path.write_text(json.dumps([TASK]))
+    repository = TaskRepository(path)
+
+    for _ in range(5):
+        assert repository.records() == [Task.from_dict(TASK)]
+    assert repository.cache_stats() == {"hits": 4, "misses": 1}
+
+def test_records_reloaded_after_external_write(tmp_path):
+    path = tmp_path / "todo-app.json"
+    path.write_text(json.dumps([TASK]))
+    repository = TaskRepository(path)
+    repository.records()
+
+    path.write_text(json.dumps([TASK, dict(TASK, ID="c2b129bb")]))
+    assert len(repository.records()) == 2
+    assert repository.misses == 2
+
+def test_commit_does_not_trigger_reload(tmp_path):
+    repository = TaskRepository(tmp_path / "todo-app.json")
+    repository.commit([Task.from_dict(TASK)])
+    assert repository.records() == [Task.from_dict(TASK)]
+    assert repository.misses == 0
+
+def test_get_repository_is_shared(tmp_path):
+    path = tmp_path / "todo-app.json"
+    assert get_repository(path) is get_repository(path)
+
+def test_get_uses_id_index(tmp_path):
+    repository = TaskRepository(tmp_path / "todo-app.json")
+    repository.commit([Task.from_dict(dict(TASK, ID=f"{i:08x}", Description=f"Task {i}")) for i in range(100)])
+    assert repository.get("00000063").description == "Task 99"
+    assert repository.get("ydhfi73g") is None
+
+def test_batched_delete_rebuilds_index(tmp_path):
+    repository = TaskRepository(tmp_path / "todo-app.json")
+    repository.commit([Task.from_dict(dict(TASK, ID=f"{i:08x}", Description=f"Task {i}")) for i in range(100)])
+
+    deleted = repository.delete([f"{i:08x}" for i in range(0, 100, 2)] + ["ydhfi73g"])
+    assert len(deleted) == 50
+    assert repository.get("00000000") is None
+    assert repository.get("00000063").description == "Task 99"
+    assert repository.has_description("Task 2") is False
+    assert json.loads(repository.path.read_text()) == [task.to_dict() for task in repository.records()]
+
+def test_update_keeps_description_index(tmp_path):
+    repository = TaskRepository(tmp_path / "todo-app.json")
+    repository.commit([Task.from_dict(TASK)])
+    assert repository.update("5e42c77c", {"Description": "Evening Mass"}) is True
+    assert repository.has_description("Evening Mass") is True
+    assert repository.has_description("Morning Mass On Sunday") is False
+    assert repository.update("ydhfi73g", {"Description": "Evening Mass"}) is False
+
+def test_journal_mode_appends_instead_of_rewriting(tmp_path):
+    path = tmp_path / "todo-app.json"
+    repository = TaskRepository(path, journal=True)
+    repository.commit([Task.from_dict(TASK)])
+    snapshot = path.read_text()
+
+    repository.insert(Task.from_dict(dict(TASK, ID="c2b129bb", Description="Catechism")))
+    repository.update("5e42c77c", {"Status": "Complete"})
+    repository.delete(["c2b129bb"])
+
+    assert path.read_text() == snapshot
+    assert len(repository.journal_path.read_text().splitlines()) == 4  # base line + 3 operations
+
+    # a fresh reader replays the journal on top of the snapshot
+    reader = TaskRepository(path, journal=True)
+    assert reader.records() == [Task.from_dict(dict(TASK, Status="Complete"))]
+
+def test_journal_ignores_torn_last_line(tmp_path):
+    path = tmp_path / "todo-app.json"
+    repository = TaskRepository(path, journal=True)
+    repository.commit([Task.from_dict(TASK)])
+    repository.update("5e42c77c", {"Status": "Inprogress"})
+
+    with open(repository.journal_path, "a", encoding="utf-8") as journal_file:
+        journal_file.write('{"op":"update","id":"5e42c77c","fie')
+
+    assert TaskRepository(path, journal=True).records() == [Task.from_dict(dict(TASK, Status="Inprogress"))]
+
+def test_journal_compaction(tmp_path):
+    path = tmp_path / "todo-app.json"
+    repository = TaskRepository(path, journal=True, max_entries=3)
+    repository.commit([Task.from_dict(TASK)])
+
+    for status in ["Inprogress", "Complete", "Incomplete"]:
+        repository.update("5e42c77c", {"Status": status})
+    repository.wait_for_compaction()
+
+    assert not repository.journal_path.exists()
+    assert json.loads(path.read_text()) == [dict(TASK, Status="Incomplete")]
+
+def test_journal_left_by_interrupted_compaction_is_replaced(tmp_path):
+    path = tmp_path / "todo-app.json"
+    repository = TaskRepository(path, journal=True)
+    repository.commit([Task.from_dict(TASK)])
+    repository.insert(Task.from_dict(dict(TASK, ID="c2b129bb", Description="Catechism")))
+
+    # crash after the new snapshot replaced the old one but before the journal was removed
+    stale = repository.journal_path.read_bytes()
+    repository.compact()
+    repository.journal_path.write_bytes(stale)
+
+    writer = TaskRepository(path, journal=True)
+    writer.insert(Task.from_dict(dict(TASK, ID="76339f3c", Description="Read Tozer Book")))
+    expected = [task.id for task in writer.records()]
+    assert expected == ["5e42c77c", "c2b129bb", "76339f3c"]
+    assert [task.id for task in TaskRepository(path, journal=True).records()] == expected
+
+def test_stream_records_matches_records(tmp_path, monkeypatch):
+    import todo_app.services.repository as repository_module
+    monkeypatch.setattr(repository_module, "STREAM_CHUNK", 7)  # objects straddle many reads
+    path = tmp_path / "todo-app.json"
+    writer = TaskRepository(path, journal=True, max_entries=100)
+    writer.commit([Task.from_dict(dict(TASK, ID=f"{i:08x}", Description=f"Täsk {i}")) for i in range(6)])
+    writer.update("00000001", {"Status": "Complete"})
+    writer.delete(["00000002", "00000004"])
+    writer.insert(Task.from_dict(dict(TASK, ID="00000004", Description="Back Again")))
+    writer.insert(Task.from_dict(dict(TASK, ID="c2b129bb", Description="Catechism")))
+    with open(writer.journal_path, "a", encoding="utf-8") as journal_file:
+        journal_file.write('{"op": "delete", "ids": ["0000')  # torn last line
+
+    reader = TaskRepository(path, journal=True)
+    streamed = list(reader.stream_records())
+    assert streamed == TaskRepository(path, journal=True).records()
+    assert [task.id for task in streamed] == ["00000000", "00000001", "00000003", "00000005", "00000004", "c2b129bb"]
+    assert reader.misses == 0  # nothing was cached
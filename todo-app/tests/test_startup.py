@@ -0,0 +1,36 @@
+import os
+import subprocess
+import sys
+
+# import time of the taskmate entry point; loading dateparser alone went well past it
+STARTUP_BUDGET_MS = int(os.environ.get("TASKMATE_STARTUP_BUDGET_MS", "500"))
+
+# loaded by the code paths that need them, never at start-up
+DEFERRED_MODULES = ("dateparser", "email_validator", "dateutil.parser", "concurrent.futures.process")
+
+def _import_entry_point():
+    """import the entry point with -X importtime in a fresh interpreter; cumulative microseconds per module"""
+    code = (
+        "import todo_app.main\n"
+        "from todo_app.services import repository\n"
+        "print(len(repository._REPOSITORIES))"
+    )
+    result = subprocess.run([sys.executable, "-X", "importtime", "-c", code], capture_output=True, text=True, check=True)
+    times = {}
+    for line in result.stderr.splitlines():
+        if line.startswith("import time:") and "cumulative" not in line:
+            _, cumulative, name = line[len("import time:"):].split("|")
+            times[name.strip()] = int(cumulative)
+    return times, int(result.stdout)
+
+def test_heavy_dependencies_are_deferred():
+    times, open_stores = _import_entry_point()
+    assert "todo_app.cli_interface.cli_app" in times
+    assert [name for name in DEFERRED_MODULES if name in times] == []
+    # no store is opened until a command needs one
+    assert open_stores == 0
+
+def test_startup_import_budget():
+    # the best of a few runs, so a busy machine does not fail the budget
+    best = min(_import_entry_point()[0]["todo_app.main"] for _ in range(3)) / 1000
+    assert best <= STARTUP_BUDGET_MS, f"importing taskmate took {best:.0f} ms; budget {STARTUP_BUDGET_MS} ms"
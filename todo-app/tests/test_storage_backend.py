@@ -0,0 +1,87 @@
+import pytest
+from datetime import datetime
+from todo_app.models.task import Priority, Status, Task
+from todo_app.services.storage_backend import JSONBackend, SQLiteBackend, get_storage_backend
+
+TASKS = [
+    {
+        "ID": "5e42c77c",
+        "Time": "2025-10-23 18:00:00",
+        "Description": "Morning Mass On Sunday",
+        "Priority": "High",
+        "Tag": "Worship",
+        "Email": "johndoe34@gmail.com",
+        "Status": "Incomplete"
+    },
+    {
+        "ID": "76339f3c",
+        "Time": "2024-06-15 14:30:00",
+        "Description": "Read Tozer Book",
+        "Priority": "Mild",
+        "Tag": "Religion",
+        "Email": "",
+        "Status": "Complete"
+    },
+]
+
+
+@pytest.fixture(params=["json", "sqlite"])
+def backend(request, tmp_path):
+    if request.param == "json":
+        store = JSONBackend(tmp_path / "todo-app.json")
+    else:
+        store = SQLiteBackend(tmp_path / "todo-app.db")
+    store.save_all([Task.from_dict(task) for task in TASKS])
+    return store
+
+def test_load_all_keeps_insertion_order(backend):
+    assert [task.to_dict() for task in backend.load_all()] == TASKS
+    assert backend.count() == 2
+
+def test_iter_tasks(backend):
+    assert [task.to_dict() for task in backend.iter_tasks()] == TASKS
+
+def test_get_task(backend):
+    assert backend.get_task("76339f3c").description == "Read Tozer Book"
+    assert backend.get_task("ydhfi73g") is None
+
+def test_insert_and_duplicate_description(backend):
+    task = Task.from_dict(dict(TASKS[0], ID="a1b2c3d4", Description="Buy Groceries"))
+    backend.insert_task(task)
+    assert backend.has_description("Buy Groceries") is True
+    assert backend.load_all()[-1] == task
+
+def test_update_task(backend):
+    assert backend.update_task("76339f3c", {"Status": "Inprogress"}) is True
+    assert backend.get_task("76339f3c").status is Status.INPROGRESS
+    assert backend.update_task("ydhfi73g", {"Status": "Complete"}) is False
+
+def test_update_tasks(backend):
+    updated = backend.update_tasks({
+        "5e42c77c": {"Priority": "Low"},
+        "76339f3c": {"Priority": "Low", "Status": "Incomplete"},
+        "ydhfi73g": {"Priority": "Low"},
+    })
+    assert updated == ["5e42c77c", "76339f3c"]
+    assert [task.priority for task in backend.load_all()] == [Priority.LOW, Priority.LOW]
+
+def test_delete_tasks(backend):
+    deleted = backend.delete_tasks(["ydhfi73g", "76339f3c"])
+    assert deleted == ["76339f3c"]
+    assert [task.id for task in backend.load_all()] == ["5e42c77c"]
+
+def test_clear(backend):
+    assert backend.clear() == 2
+    assert backend.load_all() == []
+
+def test_filter_tasks(backend):
+    assert [task.id for task in backend.filter_tasks("Priority", ["high"])] == ["5e42c77c"]
+    assert [task.id for task in backend.filter_tasks("Tag", ["relig"], contains=True)] == ["76339f3c"]
+
+def test_filter_time_ranges(backend):
+    tasks = backend.filter_time_ranges([(datetime(2024, 6, 15), datetime(2024, 6, 16))])
+    assert [task.id for task in tasks] == ["76339f3c"]
+
+def test_unknown_backend():
+    with pytest.raises(ValueError):
+        get_storage_backend("csv")
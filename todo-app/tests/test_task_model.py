@@ -0,0 +1,53 @@
+from datetime import datetime
+from todo_app.models.task import Priority, Status, Task
+
+TASK = {
+    "ID": "52932284",
+    "Time": "2025-10-25 09:22:52.738809",
+    "Description": "Buy Clothes",
+    "Priority": "Mild",
+    "Tag": "Shopping",
+    "Email": "",
+    "Status": "Incomplete"
+}
+
+def test_round_trip_keeps_on_disk_shape():
+    task = Task.from_dict(TASK)
+    assert task.due == datetime(2025, 10, 25, 9, 22, 52, 738809)
+    assert task.priority is Priority.MILD
+    assert task.status is Status.INCOMPLETE
+    assert task.to_dict() == TASK
+
+def test_enums_compare_with_saved_strings():
+    assert Priority.parse("very HIGH") == "High"
+    assert Status.parse("inprogress") is Status.INPROGRESS
+    assert sorted([Priority.LOW, Priority.HIGH, Priority.MILD], key=lambda p: p.rank) == [
+        Priority.HIGH, Priority.MILD, Priority.LOW
+    ]
+
+def test_missing_time_has_no_due():
+    task = Task.from_dict(dict(TASK, Time=""))
+    assert task.due is None
+    assert task.due_epoch is None
+    assert task.to_dict()["Time"] == ""
+
+def test_with_fields_returns_updated_copy():
+    task = Task.from_dict(TASK)
+    updated = task.with_fields({"Status": "Complete", "Time": "2025-10-26 10:00:00"})
+    assert updated.status is Status.COMPLETE
+    assert updated.due == datetime(2025, 10, 26, 10)
+    assert task.status is Status.INCOMPLETE
+
+def test_value_reads_saved_field():
+    task = Task.from_dict(TASK)
+    assert [task.value(field) for field in TASK] == list(TASK.values())
+
+def test_unknown_saved_values_are_rejected():
+    import pytest
+    with pytest.raises(ValueError, match="Priority 'Urgent'"):
+        Task.from_dict(dict(TASK, Priority="Urgent"))
+    with pytest.raises(ValueError, match="Status 'Done'"):
+        Task.from_dict(dict(TASK, Status="Done"))
+    task = Task.from_dict(dict(TASK, Priority="", Status=None))
+    assert (task.priority, task.status) == (Priority.MILD, Status.INCOMPLETE)
+    assert Priority.parse("urgent") is Priority.MILD
@@ -1,4 +1,5 @@
 from todo_app.services.task_service import TaskService
+from todo_app.models.task import Priority, Status
 
 task_service = TaskService()
 
@@ -60,4 +61,143 @@ def test_wrong_priority_filter():
     status, message, tasks = task_service.priority_filter(priority_filters)
     assert status is False
     assert message == 'Invalid Priority Level. Priority Level are high, mild and low'
-    assert tasks == []
\ No newline at end of file
+    assert tasks == []
+
+def test_iter_filtered_tasks():
+    status, message, tasks = task_service.iter_filtered_tasks(priority_list=["high"], status_list=["complete"])
+    assert status is True
+    assert message == ''
+    tasks = list(tasks)
+    assert [task.id for task in tasks] == ["76339f3c"]
+    assert all(task.status is Status.COMPLETE and task.priority is Priority.HIGH for task in tasks)
+
+def test_iter_filtered_tasks_invalid_status():
+    status, message, tasks = task_service.iter_filtered_tasks(status_list=["done"])
+    assert status is False
+    assert list(tasks) == []
+
+def test_iter_filtered_tasks_streams_an_unfiltered_store(tmp_store):
+    saved = task_service.db_service.read_json()
+    service = tmp_store(saved)
+    repository = service.db_service.backend.repository
+    repository.invalidate()
+    misses = repository.misses
+    status, message, tasks = service.iter_filtered_tasks()
+    assert status is True
+    assert [task.to_dict() for task in tasks] == saved
+    assert repository.misses == misses  # read in pieces, not loaded into the cache
+
+def test_keyword_search_escapes_keywords():
+    status, message, tasks = task_service.keyword_search(["c++"])
+    assert status is False
+    assert message == "No search result found for c++"
+    assert tasks == []
+
+def test_keyword_search_modes():
+    _, _, any_tasks = task_service.keyword_search(["worship", "catechism"])
+    _, _, all_tasks = task_service.keyword_search(["worship", "catechism"], mode="all")
+    assert [task["ID"] for task in any_tasks] == ["5e42c77c", "c2b129bb"]
+    assert [task["ID"] for task in all_tasks] == ["c2b129bb"]
+
+def test_keyword_search_substring_mode():
+    status, _, tasks = task_service.keyword_search(["docl"], mode="substring")
+    assert status is True
+    assert [task["ID"] for task in tasks] == ["0f93a0e2"]
+    assert task_service.keyword_search(["docl"])[0] is False
+
+def test_keyword_search_invalid_mode():
+    status, message, tasks = task_service.keyword_search(["tozer"], mode="regex")
+    assert status is False
+    assert message.startswith("Invalid search mode regex")
+
+def test_keyword_search_follows_updates(tmp_store):
+    service = tmp_store(task_service.db_service.read_json())
+    service.db_service.apply_updates([("76339f3c", {"description": "read pilgrim progress"})])
+    assert [task["ID"] for task in service.keyword_search(["pilgrim"])[2]] == ["76339f3c"]
+    assert service.keyword_search(["tozer"])[0] is False
+
+    service.db_service.delete_tasks(["76339f3c"])
+    assert service.keyword_search(["pilgrim"])[0] is False
+
+def test_time_sorted_page_matches_full_sort():
+    from todo_app.services.paging import Page
+    from todo_app.services.query import MatchAll, StatusQuery
+
+    expected = sorted(task_service.db_service.read_json(), key=lambda task: (task["Time"], task["ID"]))
+    _, _, tasks = task_service.query_tasks(MatchAll(), Page("time", limit=3, offset=1))
+    assert [task["ID"] for task in tasks] == [task["ID"] for task in expected[1:4]]
+
+    # a cursor resumes the due index walk just after the given task
+    query = StatusQuery((Status.INCOMPLETE,))
+    _, _, walked = task_service.query_tasks(query, Page("time", after=expected[0]["ID"]))
+    assert [task["ID"] for task in walked] == [
+        task["ID"] for task in expected[1:] if task["Status"] == "Incomplete"
+    ]
+
+def test_keyword_search_page():
+    from todo_app.services.paging import Page
+
+    _, _, tasks = task_service.keyword_search(["worship", "catechism"], page=Page("time", limit=1))
+    assert [task["ID"] for task in tasks] == ["c2b129bb"]
+    status, message, _ = task_service.keyword_search(["worship"], page=Page(after="ydhfi73g"))
+    assert status is False
+    assert message == "No task found with ID ydhfi73g to continue after."
+
+def test_fuzzy_search_ranks_best_match_first():
+    status, message, tasks = task_service.fuzzy_search(["tozr", "bok"])
+    assert status is True
+    assert message.startswith("Found")
+    assert tasks[0]["ID"] == "76339f3c"
+
+    assert task_service.fuzzy_search(["catchism"], threshold=0.5)[2][0]["ID"] == "c2b129bb"
+    assert task_service.fuzzy_search(["xyzzy"])[0] is False
+    assert task_service.fuzzy_search(["tozer"], threshold=0)[0] is False
+
+def test_substring_search_treats_keywords_literally():
+    assert task_service.keyword_search(["(docl"], mode="substring")[0] is False
+    status, _, tasks = task_service.keyword_search(["DOCL", "[x"], mode="substring")
+    assert status is True
+    assert [task["ID"] for task in tasks] == ["0f93a0e2"]
+
+def test_stats_follow_changes_and_recompute(tmp_store):
+    from datetime import datetime
+
+    service = tmp_store(task_service.db_service.read_json())
+    status, _, stats = service.stats()
+    assert status is True
+    assert stats["total"] == 8
+    assert sum(stats["status"].values()) == sum(stats["priority"].values()) == 8
+
+    service.db_service.apply_updates([("76339f3c", {"status": "incomplete"})])
+    service.db_service.delete_tasks(["5e42c77c"])
+    _, _, stats = service.stats(now=datetime(2025, 1, 1))
+    assert stats["total"] == 7
+    assert stats["status"] == {"Incomplete": 7}
+    assert stats["overdue"] == 2
+
+    _, message, recomputed = service.stats(recompute=True, now=datetime(2025, 1, 1))
+    assert message == "Counters verified against 7 task(s)."
+    assert recomputed == stats
+
+    # counters that drifted from the saved tasks are replaced
+    service.db_service.indexes.get("stats").remove(service.db_service.backend.get_task("76339f3c"))
+    _, message, recomputed = service.stats(recompute=True, now=datetime(2025, 1, 1))
+    assert message.startswith("Counters were out of date")
+    assert recomputed == stats == service.stats(now=datetime(2025, 1, 1))[2]
+
+def test_tag_subtree_filter_counts_and_completion(tmp_store):
+    service = tmp_store(task_service.db_service.read_json())
+    # tags cannot be updated through the app; a write made by another process is picked up the same way
+    service.db_service.backend.update_tasks({"5e42c77c": {"Tag": "Worship/Mass"}, "76339f3c": {"Tag": "Worship/Reading"}})
+    status, _, tasks = service.tag_filter(["worship/*"])
+    assert status is True
+    assert {task["Tag"].lower().split("/")[0] for task in tasks} == {"worship"}
+    assert {"5e42c77c", "76339f3c"} <= {task["ID"] for task in tasks}
+
+    _, _, counts = service.tag_counts("worship")
+    assert counts[0]["tag"] == "worship" and counts[0]["subtree"] == len(tasks)
+    assert {"tag": "worship/mass", "tasks": 1, "subtree": 1} in counts
+
+    assert service.complete_tags("Wors") == ["worship", "worship/*", "worship/mass", "worship/reading"]
+    assert service.complete_ids("5e4") == ["5e42c77c"]
+    assert service.tag_counts("nothing") == (False, "No task found with tag nothing", [])
@@ -0,0 +1,58 @@
+from datetime import datetime
+import pytest
+from todo_app.utilis.utils import (
+    clear_date_cache, convert_datestring, date_cache_stats, date_path_stats, fast_parse_date, library_parse_date,
+    reference_time,
+)
+
+def test_reference_time_is_the_start_of_the_window():
+    assert reference_time(datetime(2025, 10, 23, 10, 41, 37, 5)) == datetime(2025, 10, 23, 10, 41)
+
+def test_repeated_phrases_are_parsed_once():
+    clear_date_cache()
+    now = datetime(2025, 10, 23, 10, 41, 37)
+    for phrase in ["5pm", "2 hours", "5PM", " 2  hours", "5pm"]:
+        status, _ = convert_datestring(phrase, now)
+        assert status is True
+
+    stats = date_cache_stats()
+    assert (stats["misses"], stats["hits"]) == (2, 3)
+    assert convert_datestring("2 hours", now) == (True, datetime(2025, 10, 23, 12, 41))
+
+def test_relative_phrases_follow_the_day():
+    clear_date_cache()
+    assert convert_datestring("5pm", datetime(2025, 10, 23, 23, 59, 30)) == (True, datetime(2025, 10, 23, 17, 0))
+    # after midnight the same phrase is a new cache entry for the new day
+    assert convert_datestring("5pm", datetime(2025, 10, 24, 0, 0, 30)) == (True, datetime(2025, 10, 24, 17, 0))
+    assert date_cache_stats()["misses"] == 2
+
+def test_failures_keep_the_input_in_the_message():
+    assert convert_datestring("Not A Date", datetime(2025, 10, 23)) == (
+        False, "Unable to convert Not A Date to datetime object"
+    )
+
+@pytest.mark.parametrize("reference", [datetime(2025, 10, 23, 10, 41), datetime(2024, 2, 29, 23, 59)])
+def test_fast_path_agrees_with_the_parsers(reference):
+    corpus = [
+        "today", "tomorrow", "next month", "last week", "3pm", "12am", "3:30 pm", "18:00", "thursday", "sun",
+        "in 2 days", "2025-01-14", "2025-01-14 09:30", "2026/02/23", "05/06/2026", "23/02/2026", "01-feb-25",
+        "july 2nd 2025", "feb 1st, 2025", "1st february",
+    ]
+    for text in corpus:
+        assert fast_parse_date(text, reference) == library_parse_date(text, reference)[1], text
+
+def test_fast_path_leaves_other_shapes_to_the_parsers():
+    reference = datetime(2025, 10, 23, 10, 41)
+    for text in ("13pm", "31/02/2026", "tonight", "end of month"):
+        assert fast_parse_date(text, reference) is None
+
+def test_date_paths_are_counted():
+    clear_date_cache()
+    before = date_path_stats()
+    now = datetime(2025, 10, 23, 10, 41)
+    for text in ("tomorrow", "3 hours", "23 oct 2025 09:30"):
+        assert convert_datestring(text, now)[0] is True
+    after = date_path_stats()
+    assert {path: after[path] - before[path] for path in after} == {
+        "fast": 1, "duration": 1, "dateutil": 1, "dateparser": 0, "failed": 0
+    }
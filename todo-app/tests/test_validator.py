@@ -1,3 +1,5 @@
+import pytest
+from todo_app.parsers.deliverability import DeliverabilityChecker, MXCache
 from todo_app.parsers.validator import Validator
 
 validator = Validator()
@@ -34,4 +36,76 @@ def test_invalid_status():
     status = "Done"
     is_valid, message = validator.valid_status(status)
     assert is_valid is False
-    assert message == "Invalid or no task status given. Valid status are; Incomplete, Inprogress and Complete"
\ No newline at end of file
+    assert message == "Invalid or no task status given. Valid status are; Incomplete, Inprogress and Complete"
+
+def test_undeliverable_domain_is_invalid():
+    assert validator.valid_email("mark20@nomail.org") == "Invalid Email address"
+
+def test_deliverability_off_skips_lookups():
+    lookups = []
+    checker = DeliverabilityChecker("off", lambda domain, timeout: lookups.append(domain))
+    assert checker.check("nomail.org") is True
+    assert lookups == []
+
+def test_deliverability_strict_rejects_unknown_domains(tmp_path):
+    checker = DeliverabilityChecker("strict", lambda domain, timeout: None, MXCache(tmp_path / "mx.json"))
+    assert checker.check("gmail.com") is False
+    assert checker.check("gmail.com") is False
+    assert checker.lookups == 2
+
+def test_deliverability_cache_is_shared_and_expires(tmp_path):
+    answers = {"gmail.com": True, "nomail.org": False}
+
+    def resolver(domain, timeout):
+        return answers.get(domain)
+
+    checker = DeliverabilityChecker("cached", resolver, MXCache(tmp_path / "mx.json"))
+    assert checker.check("GMAIL.com") is True
+    assert checker.check("nomail.org") is False
+    assert checker.check("unknown.com") is True  # no answer: accepted, not saved
+    assert checker.lookups == 3
+
+    # a new process reads the answers back from disk
+    reopened = DeliverabilityChecker("cached", resolver, MXCache(tmp_path / "mx.json"))
+    assert reopened.check("gmail.com") is True
+    assert reopened.check("nomail.org") is False
+    assert reopened.lookups == 0
+
+    expired = DeliverabilityChecker("cached", resolver, MXCache(tmp_path / "mx.json", ttl=0))
+    expired.check("gmail.com")
+    assert expired.lookups == 1
+
+def test_deliverability_rejects_unknown_mode():
+    with pytest.raises(ValueError, match="Unknown deliverability mode"):
+        DeliverabilityChecker("sometimes")
+
+def test_valid_emails_keeps_input_order_and_looks_up_each_domain_once(local_deliverability):
+    addresses = ["mark20@gmail.com", "bad@@gmail.com", "ken@nomail.org", "Mark20@gmail.com", "mark20@gmail.com"]
+    results = validator.valid_emails(addresses)
+    assert [result if isinstance(result, str) else result.normalized for result in results] == [
+        "mark20@gmail.com", "Invalid Email address", "Invalid Email address", "Mark20@gmail.com", "mark20@gmail.com",
+    ]
+    assert local_deliverability.lookups == 2
+
+def test_valid_emails_looks_domains_up_concurrently(tmp_path):
+    import threading
+    import time
+    from todo_app.parsers.deliverability import set_checker
+
+    active, most = [0], [0]
+    lock = threading.Lock()
+
+    def slow_resolver(domain, timeout):
+        with lock:
+            active[0] += 1
+            most[0] = max(most[0], active[0])
+        time.sleep(0.05)
+        with lock:
+            active[0] -= 1
+        return True
+
+    set_checker(DeliverabilityChecker("cached", slow_resolver, MXCache(tmp_path / "mx.json")))
+    addresses = [f"user{n}@domain{n % 6}.com" for n in range(60)]
+    results = validator.valid_emails(addresses, workers=3)
+    assert [result.normalized for result in results] == addresses
+    assert most[0] == 3
@@ -0,0 +1,90 @@
+import json
+import pytest
+from todo_app.models.task import Task
+from todo_app.services.paging import Page
+from todo_app.services.storage_backend import JSONBackend
+from todo_app.services.views import ViewIndex, views_path
+
+TASKS = [
+    Task.from_dict({"ID": "5e42c77c", "Time": "2025-10-23 18:00:00", "Description": "Morning Mass",
+                    "Priority": "High", "Tag": "Worship", "Status": "Incomplete"}),
+    Task.from_dict({"ID": "76339f3c", "Time": "2024-06-15 14:30:00", "Description": "Read Tozer Book",
+                    "Priority": "Mild", "Tag": "Religion", "Status": "Complete"}),
+    Task.from_dict({"ID": "0cdd1fb1", "Time": "2025-10-24 07:00:00", "Description": "Release notes",
+                    "Priority": "High", "Tag": "Release", "Status": "Incomplete"}),
+]
+
+def _ids(result):
+    return [task["ID"] for task in result]
+
+def test_view_members_follow_changes(tmp_store):
+    service = tmp_store(TASKS)
+    assert service.save_view("urgent", "priority:high status:incomplete") == (
+        True, "Saved view urgent matching 2 task(s)."
+    )
+    assert _ids(service.show_view("urgent")[2]) == ["5e42c77c", "0cdd1fb1"]
+
+    service.db_service.apply_updates([("5e42c77c", {"status": "complete"}), ("76339f3c", {"priority": "high"})])
+    assert _ids(service.show_view("urgent")[2]) == ["0cdd1fb1"]
+
+    service.db_service.apply_updates([("76339f3c", {"status": "incomplete"})])
+    service.db_service.upload_tasks([{"ID": "9a1b2c3d", "Time": "2025-10-22 09:00:00", "Description": "Fix build",
+                                      "Priority": "High", "Tag": "Release", "Status": "Incomplete"}])
+    service.db_service.delete_tasks(["0cdd1fb1"])
+    assert _ids(service.show_view("urgent")[2]) == ["76339f3c", "9a1b2c3d"]
+    assert _ids(service.show_view("urgent", Page(sort="time", limit=1))[2]) == ["76339f3c"]
+
+def test_due_filters_are_applied_when_a_view_is_read(tmp_store, monkeypatch):
+    service = tmp_store(TASKS)
+    service.db_service.upload_tasks([{"ID": "9a1b2c3d", "Time": "2099-10-22 09:00:00", "Description": "Fix build",
+                                      "Priority": "High", "Tag": "Release", "Status": "Incomplete"}])
+    assert service.save_view("late", "due:overdue tag:release") == (True, "Saved view late matching 1 task(s).")
+
+    # members hold the filters without due times, so they stay valid as time passes
+    view = service._view_index().get("late")
+    assert view.members == {"0cdd1fb1", "9a1b2c3d"}
+
+    # reading the view neither re-filters the store nor marks the views sidecar for a rewrite
+    changed = []
+    monkeypatch.setattr(service.db_service.indexes, "mark_changed", changed.append)
+    monkeypatch.setattr(service, "iter_query", None)
+    for _ in range(2):
+        assert _ids(service.show_view("late")[2]) == ["0cdd1fb1"]
+    assert service.list_views()[2] == [{"name": "late", "query": "due:overdue tag:release", "count": 1}]
+    assert changed == []
+
+def test_view_definitions_are_saved_beside_the_store(tmp_store, tmp_path):
+    service = tmp_store(TASKS)
+    service.save_view("release", "tag:release")
+    service.save_view("done", "status:complete")
+    path = views_path(tmp_path / "todo-app.json")
+    assert json.loads(path.read_text()) == {"release": "tag:release", "done": "status:complete"}
+    assert service.list_views()[2] == [
+        {"name": "release", "query": "tag:release", "count": 1},
+        {"name": "done", "query": "status:complete", "count": 1},
+    ]
+
+    # a new index reads the definitions and only accepts member sets saved for them
+    index = ViewIndex(path)
+    assert index.names() == ["release", "done"]
+    with pytest.raises(ValueError):
+        index.load_state({"release": {"query": "tag:release", "version": "", "ids": []}})
+
+    assert service.delete_view("done") == (True, "Deleted view done")
+    assert json.loads(path.read_text()) == {"release": "tag:release"}
+
+def test_external_write_rebuilds_members(tmp_store, tmp_path):
+    service = tmp_store(TASKS)
+    service.save_view("release", "tag:release")
+    # another process rewriting the file is noticed through the backend signature
+    JSONBackend(tmp_path / "todo-app.json").save_all(TASKS[:2])
+    status, message, result = service.show_view("release")
+    assert (status, result) == (False, [])
+
+def test_invalid_views(tmp_store):
+    service = tmp_store(TASKS)
+    assert service.save_view("my view", "tag:release")[0] is False
+    status, message = service.save_view("broken", "tag:release and (")
+    assert status is False and message
+    assert service.show_view("missing")[:2] == (False, "No view named missing. Saved views are; none")
+    assert service.delete_view("missing") == (False, "No view named missing")